@@ -1,41 +1,136 @@
 # ai.py
 
-from typing import Dict
-
-import torch
-import torch.nn.functional as F
-from transformers import AutoTokenizer, AutoModelForSequenceClassification
+import hashlib
+import os
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 MODEL_NAME = "unitary/toxic-bert"
 TOXIC_THRESHOLD = 0.7
+MAX_LENGTH = 256
+# fp32: 원본 모델, int8: Linear 레이어 dynamic int8 양자화 (CPU 전용)
+BACKEND = os.getenv("TOXIC_BACKEND", "fp32")
+BACKENDS = ("fp32", "int8")
+PRELOAD = os.getenv("TOXIC_PRELOAD", "1") != "0"
+# 긴 본문은 MAX_LENGTH 토큰 단위의 겹치는 윈도우로 나눠 전부 검사한다
+LONG_TEXT = os.getenv("TOXIC_LONG_TEXT", "1") != "0"
+WINDOW_STRIDE = int(os.getenv("TOXIC_WINDOW_STRIDE", "64"))
+WINDOW_BATCH_SIZE = int(os.getenv("TOXIC_WINDOW_BATCH_SIZE", "32"))
+# 텍스트마다 앞쪽 이 개수의 윈도우를 먼저 검사하고, 유해 판정이 나지 않은 텍스트만 나머지 윈도우를 검사한다
+FIRST_WINDOWS = int(os.getenv("TOXIC_FIRST_WINDOWS", "4"))
 
-tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
-model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
-model.eval()
+Verdict = Dict[str, float | str | bool]
 
+# torch / transformers 는 첫 사용 시점(또는 백그라운드 warm-up)에 import 해서
+# 서버 기동과 reload 가 모델 로딩을 기다리지 않도록 한다.
+torch = None
+F = None
+tokenizer = None
+model = None
 
-def check_toxicity(text: str) -> Dict[str, float | str | bool]:
+_loadLock = threading.Lock()
+_state: Dict[str, Any] = {"status": "idle", "error": None, "loadSeconds": None, "warmupSeconds": None}
 
-    text = (text or "").strip()
-    if not text:
-        return {"label": "non_toxic", "score": 0.0, "isToxic": False}
 
-    enc = tokenizer(
-        text,
-        return_tensors="pt",
-        truncation=True,
-        max_length=256,
-    )
+def build_model(backend: str):
+    import torch as _torch
+    from transformers import AutoTokenizer, AutoModelForSequenceClassification
+
+    if backend not in BACKENDS:
+        raise ValueError(f"unknown TOXIC_BACKEND: {backend}")
+
+    _tokenizer = AutoTokenizer.from_pretrained(MODEL_NAME)
+    _model = AutoModelForSequenceClassification.from_pretrained(MODEL_NAME)
+    _model.eval()
+
+    if backend == "int8":
+        _model = _torch.quantization.quantize_dynamic(_model, {_torch.nn.Linear}, dtype=_torch.qint8)
+        _model.eval()
+
+    return _tokenizer, _model
+
+
+def load_model():
+    global torch, F, tokenizer, model
+
+    if model is not None:
+        return
+
+    with _loadLock:
+        if model is not None:
+            return
+
+        _state["status"] = "loading"
+        started = time.perf_counter()
+
+        try:
+            import torch as _torch
+            import torch.nn.functional as _F
+
+            _tokenizer, _model = build_model(BACKEND)
+        except Exception as ex:
+            _state["status"] = "error"
+            _state["error"] = repr(ex)
+            raise
+
+        torch, F, tokenizer = _torch, _F, _tokenizer
+        model = _model
+        _state["loadSeconds"] = time.perf_counter() - started
+        _state["status"] = "loaded"
+
+
+def warmup():
+    # 더미 forward pass 로 커널/메모리 할당을 미리 끝내 둔다
+    load_model()
+    started = time.perf_counter()
+    check_toxicity_batch(["warm up"])
+    _state["warmupSeconds"] = time.perf_counter() - started
+    _state["status"] = "ready"
+
+
+def start_background_warmup() -> threading.Thread:
+    def run():
+        try:
+            warmup()
+        except Exception:
+            pass
+
+    t = threading.Thread(target=run, name="toxicity-warmup", daemon=True)
+    t.start()
+    return t
+
+
+def is_ready() -> bool:
+    return model is not None
+
+
+def model_status() -> Dict[str, Any]:
+    return {"name": MODEL_NAME, "backend": BACKEND, **_state}
+
+
+_whitespaceRe = re.compile(r"\s+")
+
+
+def normalize_text(text: str) -> str:
+    return _whitespaceRe.sub(" ", (text or "").strip())
+
+
+def model_id() -> str:
+    # 판정 결과에 영향을 주는 설정을 모두 포함한 식별자
+    return f"{MODEL_NAME}:{BACKEND}@{TOXIC_THRESHOLD}"
 
-    with torch.no_grad():
-        outputs = model(**enc)
-        logits = outputs.logits
-        probs = F.softmax(logits, dim=-1)[0]
 
-    score, idx = torch.max(probs, dim=0)
-    score = float(score.item())
-    idx = int(idx.item())
+def content_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
 
+
+def _empty_verdict() -> Verdict:
+    return {"label": "non_toxic", "score": 0.0, "isToxic": False, "offset": 0}
+
+
+def _to_verdict(score: float, idx: int, offset: int = 0) -> Verdict:
     label = model.config.id2label.get(idx, str(idx))
 
     is_toxic = bool(score >= TOXIC_THRESHOLD and "tox" in label.lower())
@@ -44,4 +139,103 @@ def check_toxicity(text: str) -> Dict[str, float | str | bool]:
         "label": label,
         "score": score,
         "isToxic": is_toxic,
+        "offset": offset,
     }
+
+
+def _scanWindows(
+    sampleMap: List[int],
+    starts: List[int],
+    infer: Callable[[List[int]], List[Tuple[float, int]]],
+) -> Dict[int, Verdict]:
+    # 윈도우 r 은 텍스트 sampleMap[r] 의 starts[r] 문자 위치부터. infer(rows) 는 윈도우별 (최고 확률, label index).
+    # 텍스트마다 점수가 가장 높은 윈도우의 판정(유해 판정 우선)을 돌려준다.
+    # 각 텍스트의 앞쪽 FIRST_WINDOWS 개를 먼저 추론하고, 유해 판정이 난 텍스트의 남은 윈도우는 건너뛴다
+    position: List[int] = []
+    seen: Dict[int, int] = {}
+    for sample in sampleMap:
+        position.append(seen.get(sample, 0))
+        seen[sample] = position[-1] + 1
+
+    head = [r for r in range(len(sampleMap)) if position[r] < FIRST_WINDOWS]
+    tail = [r for r in range(len(sampleMap)) if position[r] >= FIRST_WINDOWS]
+    best: Dict[int, Verdict] = {}
+
+    for stage in (head, tail):
+        for start in range(0, len(stage), WINDOW_BATCH_SIZE):
+            rows = [r for r in stage[start:start + WINDOW_BATCH_SIZE] if not best.get(sampleMap[r], {}).get("isToxic")]
+            if not rows:
+                continue
+
+            for r, (score, idx) in zip(rows, infer(rows)):
+                sample = sampleMap[r]
+                verdict = _to_verdict(float(score), int(idx), starts[r])
+                current = best.get(sample)
+
+                if current is None or (verdict["isToxic"], verdict["score"]) > (current["isToxic"], current["score"]):
+                    best[sample] = verdict
+
+    return best
+
+
+def check_toxicity_batch(texts: List[str]) -> List[Verdict]:
+    # 여러 텍스트를 padding 해서 한 번(또는 몇 번)의 forward pass 로 검사.
+    # LONG_TEXT 이면 각 텍스트를 겹치는 토큰 윈도우로 나누고, 모든 윈도우를
+    # WINDOW_BATCH_SIZE 단위로 묶어 추론한다 (_scanWindows).
+    results: List[Optional[Verdict]] = [None] * len(texts)
+    pending = []
+
+    for i, text in enumerate(texts):
+        text = (text or "").strip()
+        if not text:
+            results[i] = _empty_verdict()
+        else:
+            pending.append((i, text))
+
+    if not pending:
+        return results
+
+    load_model()
+
+    enc = tokenizer(
+        [text for _, text in pending],
+        return_tensors="pt",
+        truncation=True,
+        max_length=MAX_LENGTH,
+        padding=True,
+        return_overflowing_tokens=LONG_TEXT,
+        stride=WINDOW_STRIDE if LONG_TEXT else 0,
+        return_offsets_mapping=True,
+    )
+
+    offsets = enc.pop("offset_mapping")
+    windows = offsets.shape[0]
+
+    if LONG_TEXT:
+        sampleMap = enc.pop("overflow_to_sample_mapping").tolist()
+    else:
+        sampleMap = list(range(windows))
+
+    # 윈도우 첫 토큰([CLS] 다음)의 원문 문자 위치
+    starts = [int(offsets[r][1][0]) for r in range(windows)]
+
+    def infer(rows: List[int]) -> List[Tuple[float, int]]:
+        index = torch.tensor(rows)
+        batch = {k: v[index] for k, v in enc.items()}
+
+        with torch.no_grad():
+            probs = F.softmax(model(**batch).logits, dim=-1)
+
+        scores, idxs = torch.max(probs, dim=-1)
+        return list(zip(scores.tolist(), idxs.tolist()))
+
+    best = _scanWindows(sampleMap, starts, infer)
+
+    for sample, (i, _) in enumerate(pending):
+        results[i] = best[sample]
+
+    return results
+
+
+def check_toxicity(text: str) -> Verdict:
+    return check_toxicity_batch([text])[0]
@@ -0,0 +1,62 @@
+# author_stats.py
+
+# 작성자별 통계(공개된 글 수, 조회수 합, 좋아요 합)를 author_stats 에 유지한다.
+# posts 에 쓰는 모든 경로(ORM, 조회수 일괄 반영, 좋아요, 검사 결과 반영, bulk import)를 빠짐없이
+# 따라가도록 트리거로 증감하고, 읽을 때는 SUM 없이 한 행만 조회한다.
+# 공개(approved) 글만 집계하므로 검사 상태가 바뀌면 그 글의 몫을 더하거나 뺀다.
+
+def _upsert(sign: str, row: str) -> str:
+    # row(new/old) 가 공개 글이면 그 글의 몫을 sign(+/-) 방향으로 반영
+    approved = f"({row}.moderationStatus = 'approved')"
+    return f"""
+        INSERT INTO author_stats(authorId, postCount, totalViews, totalLikes)
+        VALUES (
+            {row}.authorId,
+            {sign}{approved},
+            {sign}{approved} * coalesce({row}.views, 0),
+            {sign}{approved} * coalesce({row}.likesCount, 0)
+        )
+        ON CONFLICT(authorId) DO UPDATE SET
+            postCount = postCount + excluded.postCount,
+            totalViews = totalViews + excluded.totalViews,
+            totalLikes = totalLikes + excluded.totalLikes;
+    """
+
+
+_TRIGGERS = {
+    "posts_author_stats_ai": f"AFTER INSERT ON posts BEGIN {_upsert('+', 'new')} END",
+    "posts_author_stats_ad": f"AFTER DELETE ON posts BEGIN {_upsert('-', 'old')} END",
+    "posts_author_stats_au": (
+        "AFTER UPDATE OF views, likesCount, moderationStatus, authorId ON posts "
+        f"BEGIN {_upsert('-', 'old')} {_upsert('+', 'new')} END"
+    ),
+}
+
+_REBUILD = [
+    "DELETE FROM author_stats",
+    """
+    INSERT INTO author_stats(authorId, postCount, totalViews, totalLikes)
+    SELECT authorId, count(*), sum(coalesce(views, 0)), sum(coalesce(likesCount, 0))
+    FROM posts WHERE moderationStatus = 'approved' GROUP BY authorId
+    """,
+]
+
+
+def rebuildAuthorStats(conn):
+    for sql in _REBUILD:
+        conn.exec_driver_sql(sql)
+
+
+def setupAuthorStats(bind):
+    # 트리거를 처음 만드는 경우(기존 DB 포함)에는 같은 트랜잭션에서 기존 글로 통계를 채운다
+    with bind.begin() as conn:
+        existing = {
+            r[0] for r in conn.exec_driver_sql("SELECT name FROM sqlite_master WHERE type = 'trigger'")
+        }
+        missing = [name for name in _TRIGGERS if name not in existing]
+
+        for name in missing:
+            conn.exec_driver_sql(f"CREATE TRIGGER IF NOT EXISTS {name} {_TRIGGERS[name]}")
+
+        if missing:
+            rebuildAuthorStats(conn)
@@ -0,0 +1,90 @@
+# bench/api_load.py
+#
+# DB_MODE=sync(Session + 스레드풀 라우트) vs async(AsyncSession + aiosqlite) 의
+# 처리량(RPS), 지연 시간, 서버 메모리(RSS) 비교. 서버를 먼저 띄운 뒤 실행한다.
+#
+#   DB_MODE=sync  uvicorn main:app --port 8006 &
+#   DB_MODE=async uvicorn main:app --port 8006 &
+#   python bench/api_load.py --url http://127.0.0.1:8006 --pid $! --concurrency 200
+
+import argparse
+import json
+import random
+import statistics
+import threading
+import time
+
+from moderation_load import login, percentile, request
+
+
+def rss(pid: int | None) -> int | None:
+    # Linux 전용: /proc/<pid>/status 의 VmRSS (KiB)
+    if not pid:
+        return None
+    with open(f"/proc/{pid}/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1])
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8006")
+    parser.add_argument("--pid", type=int, help="uvicorn 프로세스 pid (RSS 측정용)")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--concurrency", type=int, default=100)
+    parser.add_argument("--seed", type=int, default=200, help="미리 만들 게시글 수")
+    parser.add_argument("--write-ratio", type=float, default=0.05)
+    args = parser.parse_args()
+
+    token = login(args.url)
+    ids = []
+    for i in range(args.seed):
+        status, body = request(f"{args.url}/posts", "POST", {"title": f"load {i}", "body": "hello community " * 20}, token)
+        if status == 200:
+            ids.append(json.loads(body)["id"])
+
+    stop = time.monotonic() + args.seconds
+    latencies, errors, peak = [], [0], [rss(args.pid) or 0]
+    lock = threading.Lock()
+
+    def client():
+        while time.monotonic() < stop:
+            r = random.random()
+            t = time.perf_counter()
+            if r < args.write_ratio:
+                status, _ = request(f"{args.url}/posts", "POST", {"title": "load", "body": f"hello community {r}"}, token)
+            elif r < 0.5 and ids:
+                status, _ = request(f"{args.url}/posts/{random.choice(ids)}")
+            else:
+                status, _ = request(f"{args.url}/posts?limit=20")
+            with lock:
+                latencies.append(time.perf_counter() - t)
+                if status >= 400:
+                    errors[0] += 1
+
+    def sampler():
+        while time.monotonic() < stop:
+            peak[0] = max(peak[0], rss(args.pid) or 0)
+            time.sleep(0.2)
+
+    baseline = rss(args.pid)
+    threads = [threading.Thread(target=client) for _ in range(args.concurrency)]
+    threads.append(threading.Thread(target=sampler))
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    ms = [v * 1000 for v in latencies]
+    print(
+        f"requests={len(ms)} errors={errors[0]} rps={len(ms) / args.seconds:.1f} "
+        f"p50={statistics.median(ms):.1f}ms p99={percentile(ms, 0.99):.1f}ms"
+    )
+    if baseline:
+        print(f"rss before={baseline / 1024:.1f}MiB peak={peak[0] / 1024:.1f}MiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+# bench/authors.py
+#
+# GET /users/{id}/posts: authorId 단일 인덱스(작성자 글 전체를 읽고 정렬) vs (authorId, createdAt DESC, id DESC) 복합 인덱스,
+# 작성자 통계: 조회 시점 SUM vs author_stats 한 행 조회. 조회수 반영 시 author_stats 트리거 비용도 측정.
+# 임시 SQLite 파일 사용.
+#   python bench/authors.py --posts 1000000 --authors 100
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from author_stats import setupAuthorStats
+from database import Base, buildEngines
+from db_models import Post
+from models.posts import addViews, getAuthorStats, listAuthorPosts
+from trending import setupHotScore
+
+
+def median(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--authors", type=int, default=100, help="게시글을 나눠 갖는 작성자 수 (작을수록 작성자당 글이 많음)")
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--updates", type=int, default=1000, help="조회수 일괄 반영 시 갱신하는 게시글 수")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    rnd = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, _ = buildEngines(f"sqlite:///{tmp}/bench.db", "default")
+        Base.metadata.create_all(bind=engine)
+
+        t = time.perf_counter()
+        with engine.begin() as conn:
+            for i in range(0, args.posts, 10_000):
+                conn.execute(Post.__table__.insert(), [
+                    {"title": f"post {j}", "body": "lorem ipsum", "authorId": j % args.authors,
+                     "createdAt": now - timedelta(seconds=rnd.randint(0, 90 * 86400)),
+                     "updatedAt": now, "views": rnd.randint(0, 5000), "likesCount": rnd.randint(0, 300),
+                     "moderationStatus": "approved"}
+                    for j in range(i, min(i + 10_000, args.posts))
+                ])
+        print(f"populate {args.posts} posts / {args.authors} authors: {time.perf_counter() - t:.1f}s")
+
+        t = time.perf_counter()
+        setupAuthorStats(engine)
+        print(f"author_stats backfill: {time.perf_counter() - t:.1f}s")
+        setupHotScore(engine)
+        db = sessionmaker(bind=engine)()
+        authorId = 0
+
+        single = text(
+            "SELECT id FROM posts INDEXED BY ix_posts_authorId "
+            "WHERE authorId = :a AND moderationStatus = 'approved' "
+            "ORDER BY createdAt DESC, id DESC LIMIT :limit"
+        )
+        singleMs = median(lambda: db.execute(single, {"a": authorId, "limit": args.limit}).all(), args.repeat)
+        compositeMs = median(lambda: listAuthorPosts(db, authorId, args.limit), args.repeat)
+        first = listAuthorPosts(db, authorId, args.limit)
+        after = (first[-1]["createdAt"], first[-1]["id"])
+        cursorMs = median(lambda: listAuthorPosts(db, authorId, args.limit, after=after), args.repeat)
+
+        print(f"timeline, authorId index + sort: {singleMs:10.2f} ms")
+        print(f"timeline, composite index:       {compositeMs:10.2f} ms")
+        print(f"timeline, composite + cursor:    {cursorMs:10.2f} ms")
+
+        sums = text(
+            "SELECT count(*), sum(views), sum(likesCount) FROM posts "
+            "WHERE authorId = :a AND moderationStatus = 'approved'"
+        )
+        sumMs = median(lambda: db.execute(sums, {"a": authorId}).one(), args.repeat)
+        statsMs = median(lambda: getAuthorStats(db, authorId), args.repeat)
+        print(f"stats, SUM at read time:         {sumMs:10.2f} ms")
+        print(f"stats, author_stats row:         {statsMs:10.2f} ms")
+
+        ids = rnd.sample(range(1, args.posts + 1), min(args.updates, args.posts))
+        updateMs = median(lambda: addViews(db, {pid: 1 for pid in ids}), args.repeat)
+        print(f"addViews {len(ids)} posts (hotScore + author_stats triggers): {updateMs:.1f} ms")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+# bench/cold_start.py
+#
+# API 프로세스 cold start 시간 측정.
+#   python bench/cold_start.py                 # 현재 작업 트리
+#   python bench/cold_start.py --ref HEAD~1    # 특정 커밋과 비교
+#
+# import main 까지 걸린 시간(서버가 요청을 받을 수 있는 시점)과
+# 모델 warm-up 까지 끝난 시간(유해성 검사가 가능한 시점)을 따로 출력한다.
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tarfile
+import tempfile
+import io
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+PROBE = r"""
+import time
+t0 = time.perf_counter()
+import main
+t1 = time.perf_counter()
+import ai
+if hasattr(ai, "warmup"):
+    ai.warmup()
+else:
+    ai.check_toxicity("warm up")
+t2 = time.perf_counter()
+print(f"{t1 - t0:.4f} {t2 - t0:.4f}")
+"""
+
+
+def measure(srcDir: str, runs: int):
+    importTimes, readyTimes = [], []
+    env = dict(os.environ, TOXIC_PRELOAD="0")
+
+    with tempfile.TemporaryDirectory() as cwd:
+        for _ in range(runs):
+            out = subprocess.run(
+                [sys.executable, "-c", f"import sys; sys.path.insert(0, {srcDir!r})\n{PROBE}"],
+                cwd=cwd, env=env, capture_output=True, text=True, check=True,
+            ).stdout.split()
+            importTimes.append(float(out[-2]))
+            readyTimes.append(float(out[-1]))
+
+    return statistics.median(importTimes), statistics.median(readyTimes)
+
+
+def checkout(ref: str, dest: str):
+    data = subprocess.run(["git", "archive", ref], cwd=ROOT, capture_output=True, check=True).stdout
+    with tarfile.open(fileobj=io.BytesIO(data)) as tar:
+        tar.extractall(dest)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--ref", help="비교할 git ref (예: HEAD~1)")
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    rows = [("working tree", *measure(ROOT, args.runs))]
+
+    if args.ref:
+        with tempfile.TemporaryDirectory() as src:
+            checkout(args.ref, src)
+            rows.append((args.ref, *measure(src, args.runs)))
+
+    print(f"{'tree':<16}{'import main (s)':>18}{'model ready (s)':>18}")
+    for name, imp, ready in rows:
+        print(f"{name:<16}{imp:>18.3f}{ready:>18.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# bench/comments.py
+#
+# 댓글이 많은 게시글의 댓글 목록 조회: 기존 방식(메모리 dict 전체 복사 + 정렬)
+# vs comments 테이블 (postId, createdAt, id) 인덱스 + 커서. 임시 SQLite 파일 사용.
+#   python bench/comments.py --comments 50000 --limit 50
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from db_models import Comment, Post
+from models.comments import listComments, createComment, deleteComment
+
+
+def median(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--comments", type=int, default=50_000)
+    parser.add_argument("--limit", type=int, default=50)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    rows = [
+        {"postId": 1, "authorId": i % 500, "text": f"comment {i} " + "lorem " * 10,
+         "createdAt": now + timedelta(milliseconds=i), "updatedAt": now + timedelta(milliseconds=i)}
+        for i in range(args.comments)
+    ]
+
+    # 기존 storage.comments 구조
+    legacy = {1: {i + 1: dict(r, id=i + 1) for i, r in enumerate(rows)}}
+
+    def legacyList():
+        data = list(legacy.get(1, {}).values())
+        data.sort(key=lambda x: x["createdAt"])
+        return data
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            conn.execute(Post.__table__.insert(), [{
+                "id": 1, "title": "hot", "body": "lorem ipsum", "authorId": 1, "createdAt": now, "updatedAt": now,
+                "views": 0, "likesCount": 0, "commentsCount": args.comments, "moderationStatus": "approved",
+            }])
+            for i in range(0, args.comments, 5000):
+                conn.execute(Comment.__table__.insert(), rows[i:i + 5000])
+
+        db = sessionmaker(bind=engine)()
+        plan = db.connection().exec_driver_sql(
+            "EXPLAIN QUERY PLAN SELECT id FROM comments WHERE postId = 1 ORDER BY createdAt, id LIMIT 50"
+        ).fetchall()
+        print("plan:", "; ".join(r[-1] for r in plan))
+
+        print(f"legacy full copy + sort ({args.comments} comments): {median(legacyList, args.repeat):8.2f} ms")
+        print(f"{'page':>8}{'cursor ms':>11}")
+
+        # 댓글 수에서 마지막 페이지를 구하고, 그 뒤의 페이지는 건너뛴다
+        lastPage = max(0, (args.comments - 1) // args.limit)
+        for page in sorted({p for p in (0, 10, 100, lastPage // 2, lastPage) if p <= lastPage}):
+            skip = page * args.limit
+            after = None
+            if skip:
+                last = db.query(Comment.createdAt, Comment.id).filter(Comment.postId == 1) \
+                    .order_by(Comment.createdAt, Comment.id).offset(skip - 1).first()
+                after = (last.createdAt, last.id)
+            print(f"{page:>8}{median(lambda: listComments(db, 1, args.limit, after), args.repeat):>11.2f}")
+
+        # 댓글 작성/삭제 (commentsCount 갱신 포함 한 트랜잭션)
+        created = []
+        writeMs = median(lambda: created.append(createComment(db, 1, 1, "bench comment")), args.repeat)
+        deleteMs = median(lambda: deleteComment(db, 1, created.pop()["id"]), args.repeat)
+        print(f"create {writeMs:.2f} ms, delete {deleteMs:.2f} ms, "
+              f"commentsCount={db.get(Post, 1).commentsCount}")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
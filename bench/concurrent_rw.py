@@ -0,0 +1,110 @@
+# bench/concurrent_rw.py
+#
+# 동시 읽기/쓰기 처리량 비교: SQLITE_PROFILE=default(단일 엔진, rollback journal)
+# vs wal(WAL + 쓰기 전용 엔진 / 읽기 전용 풀). 임시 SQLite 파일 사용.
+#   python bench/concurrent_rw.py --readers 8 --writers 2 --seconds 10
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, buildEngines
+from db_models import Post
+from models.posts import createPost, listPosts
+
+
+def run(profile: str, args):
+    with tempfile.TemporaryDirectory() as tmp:
+        writeEngine, readEngine = buildEngines(f"sqlite:///{tmp}/bench.db", profile)
+        Base.metadata.create_all(bind=writeEngine)
+        Writer = sessionmaker(autocommit=False, autoflush=False, bind=writeEngine)
+        Reader = sessionmaker(autocommit=False, autoflush=False, bind=readEngine)
+
+        now = datetime.now(timezone.utc)
+        with writeEngine.begin() as conn:
+            conn.execute(Post.__table__.insert(), [
+                {"title": f"seed {i}", "body": "lorem ipsum " * 50, "authorId": i % 50,
+                 "createdAt": now, "updatedAt": now, "views": 0, "likesCount": 0,
+                 "commentsCount": 0, "moderationStatus": "approved"}
+                for i in range(5000)
+            ])
+
+        stop = time.monotonic() + args.seconds
+        reads, writes, errors = [], [], [0]
+        lock = threading.Lock()
+
+        def reader():
+            while time.monotonic() < stop:
+                db = Reader()
+                t = time.perf_counter()
+                try:
+                    listPosts(db, 0, 20, None)
+                    with lock:
+                        reads.append(time.perf_counter() - t)
+                except Exception:
+                    with lock:
+                        errors[0] += 1
+                finally:
+                    db.close()
+
+        def writer():
+            while time.monotonic() < stop:
+                db = Writer()
+                t = time.perf_counter()
+                try:
+                    createPost(db, 1, "bench", "lorem ipsum " * 50)
+                    with lock:
+                        writes.append(time.perf_counter() - t)
+                except Exception:
+                    with lock:
+                        errors[0] += 1
+                finally:
+                    db.close()
+
+        threads = [threading.Thread(target=reader) for _ in range(args.readers)]
+        threads += [threading.Thread(target=writer) for _ in range(args.writers)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        writeEngine.dispose()
+        readEngine.dispose()
+
+    readMs = sorted(r * 1000 for r in reads) or [0.0]
+    return {
+        "reads/s": len(reads) / args.seconds,
+        "writes/s": len(writes) / args.seconds,
+        "read p50": statistics.median(readMs),
+        "read p99": readMs[min(len(readMs) - 1, int(len(readMs) * 0.99))],
+        "errors": errors[0],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    print(f"{'profile':<10}{'reads/s':>10}{'writes/s':>10}{'read p50':>10}{'read p99':>10}{'errors':>8}")
+    for profile in ("default", "wal"):
+        r = run(profile, args)
+        print(
+            f"{profile:<10}{r['reads/s']:>10.0f}{r['writes/s']:>10.0f}"
+            f"{r['read p50']:>9.2f}ms{r['read p99']:>8.2f}ms{r['errors']:>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
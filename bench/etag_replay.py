@@ -0,0 +1,89 @@
+# bench/etag_replay.py
+#
+# 트래픽 로그를 두 번 재생해서 조건부 GET(If-None-Match) 사용 전후의 전송량과 서버 CPU 시간을 비교.
+# 로그는 한 줄에 GET 경로 하나 (예: /posts?limit=20, /posts/12, /posts/12/image).
+# --log 를 생략하면 기존 게시글 id 로 목록/상세 위주의 polling 로그를 만든다. 서버를 먼저 띄운 뒤 실행한다.
+#
+#   uvicorn main:app --port 8006 &
+#   python bench/etag_replay.py --url http://127.0.0.1:8006 --pid $! [--log access.log]
+
+import argparse
+import json
+import os
+import random
+import time
+import urllib.error
+import urllib.request
+
+
+def cpuSeconds(pid: int | None) -> float | None:
+    # Linux 전용: /proc/<pid>/stat 의 utime + stime
+    if not pid:
+        return None
+    with open(f"/proc/{pid}/stat") as f:
+        fields = f.read().rsplit(")", 1)[1].split()
+    return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+
+
+def fetch(url: str, etag: str | None):
+    req = urllib.request.Request(url)
+    if etag:
+        req.add_header("If-None-Match", etag)
+    try:
+        with urllib.request.urlopen(req, timeout=60) as res:
+            return res.status, res.headers.get("ETag"), len(res.read())
+    except urllib.error.HTTPError as ex:
+        return ex.code, ex.headers.get("ETag"), len(ex.read())
+
+
+def syntheticLog(base: str, n: int):
+    with urllib.request.urlopen(f"{base}/posts?limit=50") as res:
+        ids = [p["id"] for p in json.loads(res.read())]
+    paths = ["/posts?limit=20", "/posts?limit=20&view=summary"] + [f"/posts/{i}" for i in ids[:20]]
+    weights = [8, 4] + [1] * (len(paths) - 2)
+    return random.choices(paths, weights=weights, k=n)
+
+
+def replay(base: str, paths, pid, conditional: bool):
+    etags = {}
+    sent = notModified = 0
+    cpu = cpuSeconds(pid)
+    started = time.perf_counter()
+
+    for path in paths:
+        status, etag, size = fetch(base + path, etags.get(path) if conditional else None)
+        sent += size
+        notModified += status == 304
+        if etag:
+            etags[path] = etag
+
+    elapsed = time.perf_counter() - started
+    cpuUsed = cpuSeconds(pid) - cpu if cpu is not None else None
+    return sent, notModified, elapsed, cpuUsed
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8006")
+    parser.add_argument("--pid", type=int, help="uvicorn 프로세스 pid (CPU 시간 측정용)")
+    parser.add_argument("--log", help="한 줄에 GET 경로 하나")
+    parser.add_argument("--requests", type=int, default=2000, help="--log 가 없을 때 만들 요청 수")
+    args = parser.parse_args()
+
+    if args.log:
+        with open(args.log) as f:
+            paths = [line.strip() for line in f if line.strip()]
+    else:
+        paths = syntheticLog(args.url, args.requests)
+
+    print(f"requests={len(paths)}")
+    print(f"{'mode':<14}{'body bytes':>14}{'304':>7}{'wall s':>9}{'server cpu s':>14}")
+
+    for name, conditional in (("unconditional", False), ("if-none-match", True)):
+        sent, hits, elapsed, cpu = replay(args.url, paths, args.pid, conditional)
+        cpuText = f"{cpu:.2f}" if cpu is not None else "-"
+        print(f"{name:<14}{sent:>14,}{hits:>7}{elapsed:>9.2f}{cpuText:>14}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+# bench/hot.py
+#
+# sort=hot 목록: 조회 시점에 점수를 계산하는 ORDER BY <점수 식> (전체 스캔 + 정렬)
+# vs 미리 계산한 hotScore 인덱스 범위 읽기. 전체 재계산 비용과 카운터 갱신 시 트리거 비용도 측정.
+# 임시 SQLite 파일 사용.
+#   python bench/hot.py --posts 1000000
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import text
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, buildEngines
+from db_models import Post
+from models.posts import addViews, listPosts
+from trending import recomputeHotScores, scoreSql, setupHotScore
+
+
+def median(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--updates", type=int, default=1000, help="조회수 일괄 반영 시 갱신하는 게시글 수")
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    rnd = random.Random(0)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine, _ = buildEngines(f"sqlite:///{tmp}/bench.db", "default")
+        Base.metadata.create_all(bind=engine)
+
+        t = time.perf_counter()
+        with engine.begin() as conn:
+            for i in range(0, args.posts, 10_000):
+                conn.execute(Post.__table__.insert(), [
+                    {"title": f"post {j}", "body": "lorem ipsum", "authorId": j % 1000,
+                     "createdAt": now - timedelta(seconds=rnd.randint(0, 90 * 86400)),
+                     "updatedAt": now, "views": rnd.randint(0, 5000), "likesCount": rnd.randint(0, 300),
+                     "commentsCount": rnd.randint(0, 100), "moderationStatus": "approved"}
+                    for j in range(i, min(i + 10_000, args.posts))
+                ])
+        print(f"populate {args.posts} posts: {time.perf_counter() - t:.1f}s")
+
+        t = time.perf_counter()
+        recomputeHotScores(engine)
+        recomputeS = time.perf_counter() - t
+        print(f"full recompute: {recomputeS:.1f}s ({args.posts / recomputeS:.0f} rows/s)")
+
+        setupHotScore(engine)
+        db = sessionmaker(bind=engine)()
+
+        naive = text(
+            f"SELECT id FROM posts WHERE moderationStatus = 'approved' "
+            f"ORDER BY {scoreSql()} DESC, id DESC "
+            f"LIMIT :limit"
+        )
+        naiveMs = median(lambda: db.execute(naive, {"limit": args.limit}).all(), args.repeat)
+        indexedMs = median(lambda: listPosts(db, 0, args.limit, None, sort="hot"), args.repeat)
+        first = listPosts(db, 0, args.limit, None, sort="hot")
+        after = (db.get(Post, first[-1]["id"]).hotScore, first[-1]["id"])
+        cursorMs = median(lambda: listPosts(db, 0, args.limit, None, after=after, sort="hot"), args.repeat)
+
+        print(f"naive ORDER BY expression: {naiveMs:10.1f} ms")
+        print(f"hotScore index, page 1:    {indexedMs:10.2f} ms")
+        print(f"hotScore index, cursor:    {cursorMs:10.2f} ms")
+
+        ids = rnd.sample(range(1, args.posts + 1), min(args.updates, args.posts))
+        updateMs = median(lambda: addViews(db, {pid: 1 for pid in ids}), args.repeat)
+        print(f"addViews {len(ids)} posts (trigger recompute): {updateMs:.1f} ms")
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+# bench/list_stream.py
+#
+# GET /posts?limit=1000 응답 생성: 기존 방식(전체 목록 dict -> PostOut 검증 -> 한 번에 인코딩)
+# vs 스트리밍(STREAM_CHUNK_ROWS 행씩 읽고 바로 직렬화)의 첫 바이트까지 시간, 전체 시간, 최대 메모리.
+# 임시 SQLite 파일 사용.
+#   python bench/list_stream.py --limit 1000 --body-chars 5000
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from controllers.posts import STREAM_CHUNK_ROWS
+from database import Base
+from db_models import Post
+from models.posts import iterListPosts, listPosts
+from schemas import PostOut
+from utils import dumpJson
+
+
+def legacy(db, limit):
+    # response_model 경로: dict 목록 -> PostOut 검증 -> jsonable_encoder -> json.dumps
+    data = [PostOut(**p) for p in listPosts(db, 0, limit, None)]
+    yield json.dumps(jsonable_encoder(data)).encode()
+
+
+def streamed(db, limit):
+    sep = b"["
+    for part in iterListPosts(db, 0, limit, None, batchSize=STREAM_CHUNK_ROWS):
+        yield sep + b",".join(dumpJson(p) for p in part)
+        sep = b","
+    yield b"]"
+
+
+def measure(fn, db, limit):
+    tracemalloc.start()
+    t = time.perf_counter()
+    ttfb = None
+    size = 0
+    for chunk in fn(db, limit):
+        if ttfb is None:
+            ttfb = time.perf_counter() - t
+        size += len(chunk)
+    total = time.perf_counter() - t
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return ttfb * 1000, total * 1000, peak / 1024 / 1024, size
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--body-chars", type=int, default=5000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    body = ("lorem ipsum dolor sit amet " * (args.body_chars // 27 + 1))[:args.body_chars]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            for i in range(0, args.posts, 1000):
+                conn.execute(Post.__table__.insert(), [
+                    {"title": f"post {j}", "body": body, "authorId": j % 100,
+                     "createdAt": now - timedelta(seconds=j), "updatedAt": now - timedelta(seconds=j),
+                     "views": 0, "likesCount": 0, "commentsCount": 0, "moderationStatus": "approved"}
+                    for j in range(i, min(i + 1000, args.posts))
+                ])
+
+        db = sessionmaker(bind=engine)()
+        print(f"limit={args.limit}")
+        print(f"{'mode':<10}{'ttfb ms':>10}{'total ms':>10}{'peak MiB':>10}{'bytes':>14}")
+
+        for name, fn in (("legacy", legacy), ("stream", streamed)):
+            runs = [measure(fn, db, args.limit) for _ in range(args.repeat)]
+            ttfb, total, peak = (statistics.median(r[i] for r in runs) for i in range(3))
+            print(f"{name:<10}{ttfb:>10.1f}{total:>10.1f}{peak:>10.1f}{runs[0][3]:>14,}")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# bench/moderation_load.py
+#
+# 게시글 작성(유해성 검사) 부하 중에 검사가 없는 API(GET /posts)의 지연 시간 측정.
+# 서버를 먼저 띄운 뒤 실행한다.
+#
+#   TOXIC_WORKERS=0 uvicorn main:app --port 8006   # before: 요청 스레드에서 추론
+#   TOXIC_WORKERS=2 uvicorn main:app --port 8006   # after: 워커 프로세스에서 추론
+#   python bench/moderation_load.py --url http://127.0.0.1:8006 --seconds 30
+
+import argparse
+import json
+import random
+import statistics
+import string
+import threading
+import time
+import urllib.error
+import urllib.request
+
+
+def request(url: str, method: str = "GET", payload=None, token: str | None = None):
+    data = json.dumps(payload).encode() if payload is not None else None
+    req = urllib.request.Request(url, data=data, method=method)
+    req.add_header("Content-Type", "application/json")
+    if token:
+        req.add_header("Authorization", f"Bearer {token}")
+
+    try:
+        with urllib.request.urlopen(req, timeout=60) as res:
+            return res.status, res.read()
+    except urllib.error.HTTPError as ex:
+        return ex.code, ex.read()
+
+
+def login(base: str) -> str:
+    nick = "b" + "".join(random.choices(string.digits, k=8))
+    email, password = f"{nick}@bench.dev", "Bench!234"
+    request(f"{base}/auth/signup", "POST", {"email": email, "password": password, "nickname": nick})
+    _, body = request(f"{base}/auth/login", "POST", {"email": email, "password": password})
+    return json.loads(body)["accessToken"]
+
+
+def percentile(values, p):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * p))]
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--url", default="http://127.0.0.1:8006")
+    parser.add_argument("--seconds", type=float, default=20)
+    parser.add_argument("--writers", type=int, default=8, help="게시글 작성 동시 요청 수")
+    parser.add_argument("--readers", type=int, default=4, help="GET /posts 동시 요청 수")
+    parser.add_argument("--body-words", type=int, default=400)
+    args = parser.parse_args()
+
+    token = login(args.url)
+    stop = time.monotonic() + args.seconds
+    readLatencies, writeLatencies = [], []
+    lock = threading.Lock()
+
+    def writer():
+        while time.monotonic() < stop:
+            body = " ".join(random.choices(["hello", "community", "post", "today", "weather", "code"], k=args.body_words))
+            body += f" {random.random()}"  # 판정 캐시를 피하기 위해 본문을 매번 다르게
+            t = time.perf_counter()
+            request(f"{args.url}/posts", "POST", {"title": "bench", "body": body}, token)
+            with lock:
+                writeLatencies.append(time.perf_counter() - t)
+
+    def reader():
+        while time.monotonic() < stop:
+            t = time.perf_counter()
+            request(f"{args.url}/posts?limit=20")
+            with lock:
+                readLatencies.append(time.perf_counter() - t)
+
+    threads = [threading.Thread(target=writer) for _ in range(args.writers)]
+    threads += [threading.Thread(target=reader) for _ in range(args.readers)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    for name, values in (("GET /posts", readLatencies), ("POST /posts", writeLatencies)):
+        if not values:
+            continue
+        ms = [v * 1000 for v in values]
+        print(
+            f"{name:<12} n={len(ms):<6} p50={statistics.median(ms):8.1f}ms "
+            f"p99={percentile(ms, 0.99):8.1f}ms max={max(ms):8.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+# bench/pagination.py
+#
+# GET /posts 깊은 페이지 조회: skip(OFFSET) vs 커서(keyset) 비교 (임시 SQLite 파일 사용).
+#   python bench/pagination.py --posts 200000 --limit 20
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from db_models import Post
+from models.posts import listPosts
+
+
+def populate(engine, n: int):
+    now = datetime.now(timezone.utc)
+    rows = [
+        {
+            "title": f"post {i}", "body": "lorem ipsum " * 20, "authorId": i % 1000,
+            "createdAt": now - timedelta(seconds=i), "updatedAt": now - timedelta(seconds=i),
+            "views": 0, "likesCount": 0, "commentsCount": 0, "moderationStatus": "approved",
+        }
+        for i in range(n)
+    ]
+    with engine.begin() as conn:
+        for i in range(0, n, 5000):
+            conn.execute(Post.__table__.insert(), rows[i:i + 5000])
+
+
+def median(fn, repeat):
+    times = []
+    for _ in range(repeat):
+        t = time.perf_counter()
+        fn()
+        times.append((time.perf_counter() - t) * 1000)
+    return statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+        populate(engine, args.posts)
+        db = Session()
+
+        # 각 깊이의 직전 페이지 마지막 행 = 커서
+        depths = [d for d in (0, 100, 1_000, 10_000, 100_000) if d * args.limit < args.posts]
+        print(f"{'page':>8}{'skip ms':>10}{'cursor ms':>11}")
+
+        for page in depths:
+            skip = page * args.limit
+            after = None
+            if skip:
+                last = db.query(Post.createdAt, Post.id).order_by(Post.createdAt.desc(), Post.id.desc()).offset(skip - 1).first()
+                after = (last.createdAt, last.id)
+
+            offsetMs = median(lambda: listPosts(db, skip, args.limit, None), args.repeat)
+            cursorMs = median(lambda: listPosts(db, 0, args.limit, None, after=after), args.repeat)
+            print(f"{page:>8}{offsetMs:>10.2f}{cursorMs:>11.2f}")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+# bench/quantization.py
+#
+# fp32 모델과 int8 dynamic quantization 모델 비교.
+#   python bench/quantization.py                      # 내장 코퍼스
+#   python bench/quantization.py --corpus posts.txt   # 한 줄에 한 문장
+#
+# 지연 시간(batch=1 p50/p99), 처리량(batch=--batch), 모델 크기/RSS 증가량,
+# fp32 대비 라벨·유해 판정 일치율을 출력한다.
+# 백엔드마다 TOXIC_BACKEND 를 바꾼 별도 프로세스에서 서버와 같은 ai.check_toxicity_batch 로 측정하고,
+# RSS 는 모델 로딩 전후의 현재 VmRSS 차이다 (Linux 전용).
+
+import argparse
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import torch
+
+import ai
+
+CORPUS = [
+    "오늘 날씨가 정말 좋네요. 다들 산책 다녀오세요!",
+    "Thanks for sharing, this was really helpful.",
+    "I completely disagree with your argument, but I respect your view.",
+    "This is the dumbest post I have ever read.",
+    "You are an idiot and should stop posting.",
+    "Shut up, nobody cares about your stupid opinion.",
+    "Does anyone know a good place to eat near the station?",
+    "I hate waiting in line at the bank on Mondays.",
+    "What a terrible, useless piece of garbage code.",
+    "Congrats on the release, the team did great work.",
+    "Go away, loser.",
+    "The meeting is moved to 3pm tomorrow.",
+    "I will find you and hurt you.",
+    "Can you recommend a beginner-friendly Python book?",
+    "Your code is trash and so are you.",
+    "Happy birthday! Hope you have a wonderful day.",
+]
+
+
+def rssMb() -> float:
+    # ru_maxrss 는 최대값이라 줄어든 메모리를 반영하지 못하므로 현재 VmRSS 를 읽는다
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def modelMb(model) -> float:
+    buf = io.BytesIO()
+    torch.save(model.state_dict(), buf)
+    return buf.tell() / (1024 * 1024)
+
+
+def predict(texts):
+    return [(v["label"], v["isToxic"]) for v in ai.check_toxicity_batch(texts)]
+
+
+def bench(corpus, batch, rounds):
+    # TOXIC_BACKEND 로 고른 백엔드 하나를 현재 프로세스에서 측정
+    before = rssMb()
+    ai.load_model()
+    rssDelta = rssMb() - before
+    predict(corpus[:2])
+
+    latencies = []
+    for _ in range(rounds):
+        for text in corpus:
+            t = time.perf_counter()
+            predict([text])
+            latencies.append((time.perf_counter() - t) * 1000)
+
+    t = time.perf_counter()
+    n = 0
+    for _ in range(rounds):
+        for i in range(0, len(corpus), batch):
+            predict(corpus[i:i + batch])
+            n += len(corpus[i:i + batch])
+    throughput = n / (time.perf_counter() - t)
+
+    latencies.sort()
+    return {
+        "p50": statistics.median(latencies),
+        "p99": latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))],
+        "throughput": throughput,
+        "modelMb": modelMb(ai.model),
+        "rssMb": rssDelta,
+        "predictions": predict(corpus),
+    }
+
+
+def runBackend(backend: str, argv: list) -> dict:
+    env = dict(os.environ, TOXIC_BACKEND=backend, TOXIC_PRELOAD="0")
+    out = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), *argv, "--child"],
+        env=env, capture_output=True, text=True, check=True,
+    ).stdout
+    return json.loads(out.splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--corpus", help="한 줄에 한 문장인 텍스트 파일")
+    parser.add_argument("--batch", type=int, default=16)
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--threads", type=int, default=0)
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.threads:
+        torch.set_num_threads(args.threads)
+
+    corpus = CORPUS
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [line.strip() for line in f if line.strip()]
+
+    if args.child:
+        print(json.dumps(bench(corpus, args.batch, args.rounds)))
+        return
+
+    results = {backend: runBackend(backend, sys.argv[1:]) for backend in ai.BACKENDS}
+    ref = results["fp32"]["predictions"]
+
+    print(f"corpus={len(corpus)} batch={args.batch} rounds={args.rounds} threads={torch.get_num_threads()}")
+    print(f"{'backend':<8}{'p50 ms':>9}{'p99 ms':>9}{'items/s':>10}{'model MB':>10}{'RSS MB':>9}{'label agr':>11}{'toxic agr':>11}")
+    for backend, r in results.items():
+        preds = r["predictions"]
+        labelAgree = sum(a[0] == b[0] for a, b in zip(preds, ref)) / len(ref)
+        toxicAgree = sum(a[1] == b[1] for a, b in zip(preds, ref)) / len(ref)
+        print(
+            f"{backend:<8}{r['p50']:>9.1f}{r['p99']:>9.1f}{r['throughput']:>10.1f}"
+            f"{r['modelMb']:>10.1f}{r['rssMb']:>9.1f}{labelAgree:>11.1%}{toxicAgree:>11.1%}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# bench/read_path.py
+#
+# GET /posts/{id} 처리 경로 micro-benchmark (임시 SQLite 파일 사용).
+#   before : incView(SELECT + commit + refresh) → getPost(ORM) → PostOut 검증 → JSON
+#   direct : UPDATE ... RETURNING 한 문장 → JSON   (VIEW_BUFFER=0)
+#   buffer : SELECT 한 문장 + 메모리 조회수 → JSON (VIEW_BUFFER=1)
+#   python bench/read_path.py --iterations 5000
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from db_models import Post
+from models.posts import getPost, incView, post_to_dict, readPostAndIncView
+from schemas import PostOut
+from utils import dumpJson
+
+
+def oldPath(db, pid):
+    views = incView(db, pid)
+    post = db.query(Post).filter(Post.id == pid).first()
+    p = post_to_dict(post)
+    p["views"] = views
+    return PostOut(**p).model_dump_json().encode()
+
+
+def directPath(db, pid):
+    return dumpJson(readPostAndIncView(db, pid))
+
+
+def bufferedPath(db, pid):
+    p = getPost(db, pid)
+    p["views"] += 1
+    return dumpJson(p)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--iterations", type=int, default=5000)
+    parser.add_argument("--body-chars", type=int, default=2000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db", connect_args={"check_same_thread": False})
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+        now = datetime.now(timezone.utc)
+        with engine.begin() as conn:
+            conn.execute(Post.__table__.insert(), [
+                {"title": f"post {i}", "body": "x" * args.body_chars, "authorId": 1,
+                 "createdAt": now, "updatedAt": now, "views": 0, "likesCount": 0,
+                 "commentsCount": 0, "moderationStatus": "approved"}
+                for i in range(100)
+            ])
+
+        print(f"RETURNING supported: {engine.dialect.update_returning}")
+        print(f"{'path':<10}{'us/request':>12}{'requests/s':>12}")
+
+        for name, fn in (("before", oldPath), ("direct", directPath), ("buffer", bufferedPath)):
+            db = Session()
+            t = time.perf_counter()
+            for i in range(args.iterations):
+                fn(db, i % 100 + 1)
+            elapsed = time.perf_counter() - t
+            db.close()
+            print(f"{name:<10}{elapsed / args.iterations * 1e6:>12.1f}{args.iterations / elapsed:>12.0f}")
+
+
+if __name__ == "__main__":
+    main()
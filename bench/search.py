@@ -0,0 +1,103 @@
+# bench/search.py
+#
+# GET /posts?q= 검색: ILIKE 전체 스캔 vs FTS5 인덱스 비교 (임시 SQLite 파일 사용).
+#   python bench/search.py --posts 100000 --body-chars 2000
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+import search
+from database import Base
+from db_models import Post
+from models.posts import listPosts
+
+WORDS = (
+    "community post today weather coffee python fastapi sqlite database index query search "
+    "커뮤니티 게시글 오늘 날씨 커피 개발 데이터베이스 검색 인덱스 주말 여행 맛집 추천"
+).split()
+
+
+def populate(engine, n: int, bodyChars: int):
+    rng = random.Random(42)
+    now = datetime.now(timezone.utc)
+    rows = []
+
+    for i in range(n):
+        body = []
+        while sum(len(w) + 1 for w in body) < bodyChars:
+            body.append(rng.choice(WORDS))
+        if i % 1000 == 0:
+            body.append("needle-in-haystack")
+        rows.append({
+            "title": f"post {i} {rng.choice(WORDS)}",
+            "body": " ".join(body),
+            "authorId": rng.randint(1, 1000),
+            "createdAt": now - timedelta(seconds=i),
+            "updatedAt": now - timedelta(seconds=i),
+            "views": 0, "likesCount": 0, "commentsCount": 0,
+            "moderationStatus": "approved",
+        })
+
+    with engine.begin() as conn:
+        for i in range(0, n, 5000):
+            conn.execute(Post.__table__.insert(), rows[i:i + 5000])
+
+
+def timeQuery(Session, q: str, fts: bool, repeat: int):
+    search._state["ready"] = fts
+    times = []
+
+    for _ in range(repeat):
+        db = Session()
+        t = time.perf_counter()
+        result = listPosts(db, 0, 20, q)
+        times.append((time.perf_counter() - t) * 1000)
+        db.close()
+
+    return statistics.median(times), len(result)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--body-chars", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        Session = sessionmaker(bind=engine)
+
+        t = time.perf_counter()
+        populate(engine, args.posts, args.body_chars)
+        print(f"inserted {args.posts} posts in {time.perf_counter() - t:.1f}s")
+
+        if not search.setupFts(engine):
+            print("FTS5 trigram tokenizer unavailable; nothing to compare")
+            return
+
+        t = time.perf_counter()
+        search.rebuildFts(engine)
+        print(f"built FTS index in {time.perf_counter() - t:.1f}s")
+
+        print(f"{'query':<22}{'LIKE ms':>10}{'FTS ms':>10}{'speedup':>9}{'hits':>6}")
+        for q in ("needle-in-haystack", "fastapi", "데이터베이스", "no-such-term"):
+            like, hits = timeQuery(Session, q, False, args.repeat)
+            fts, _ = timeQuery(Session, q, True, args.repeat)
+            print(f"{q:<22}{like:>10.1f}{fts:>10.1f}{like / fts:>8.1f}x{hits:>6}")
+
+
+if __name__ == "__main__":
+    main()
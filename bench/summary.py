@@ -0,0 +1,67 @@
+# bench/summary.py
+#
+# GET /posts 목록의 full(body 전체) vs view=summary(excerpt) 응답 크기와 조회+직렬화 시간 비교.
+# 임시 SQLite 파일 사용.
+#   python bench/summary.py --posts 5000 --body-chars 20000 --limit 1000
+
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from database import Base
+from db_models import Post
+from models.posts import listPosts
+from utils import dumpJson
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--posts", type=int, default=5000)
+    parser.add_argument("--body-chars", type=int, default=20_000)
+    parser.add_argument("--limit", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    now = datetime.now(timezone.utc)
+    body = ("lorem ipsum dolor sit amet " * (args.body_chars // 27 + 1))[:args.body_chars]
+
+    with tempfile.TemporaryDirectory() as tmp:
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as conn:
+            for i in range(0, args.posts, 1000):
+                conn.execute(Post.__table__.insert(), [
+                    {"title": f"post {j}", "body": body, "authorId": j % 100,
+                     "createdAt": now - timedelta(seconds=j), "updatedAt": now - timedelta(seconds=j),
+                     "views": 0, "likesCount": 0, "commentsCount": 0, "moderationStatus": "approved"}
+                    for j in range(i, min(i + 1000, args.posts))
+                ])
+
+        db = sessionmaker(bind=engine)()
+        print(f"{'mode':<10}{'bytes':>14}{'query ms':>11}{'json ms':>10}")
+
+        for mode, summary in (("full", False), ("summary", True)):
+            queryMs, jsonMs = [], []
+            for _ in range(args.repeat):
+                t = time.perf_counter()
+                data = listPosts(db, 0, args.limit, None, summary=summary)
+                t2 = time.perf_counter()
+                payload = dumpJson(data)
+                queryMs.append((t2 - t) * 1000)
+                jsonMs.append((time.perf_counter() - t2) * 1000)
+            print(f"{mode:<10}{len(payload):>14,}{statistics.median(queryMs):>11.2f}{statistics.median(jsonMs):>10.2f}")
+
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+# cache.py
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Tuple
+
+_MISSING = object()
+
+
+class LRUCache:
+    # 엔트리 수 / 바이트 수 상한과 선택적 TTL 을 갖는 thread-safe LRU 캐시
+    def __init__(self, maxEntries: int = 1024, maxBytes: int = 0, ttl: float = 0):
+        self.maxEntries = maxEntries
+        self.maxBytes = maxBytes
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, Tuple[Any, int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self._counters = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            item = self._data.get(key, _MISSING)
+
+            if item is _MISSING:
+                self._counters["misses"] += 1
+                return default
+
+            value, size, expiresAt = item
+
+            if expiresAt and expiresAt <= time.monotonic():
+                self._remove(key)
+                self._counters["expirations"] += 1
+                self._counters["misses"] += 1
+                return default
+
+            self._data.move_to_end(key)
+            self._counters["hits"] += 1
+            return value
+
+    def set(self, key: Hashable, value: Any, size: int = 0):
+        if self.maxEntries <= 0 or (self.maxBytes and size > self.maxBytes):
+            return
+
+        expiresAt = time.monotonic() + self.ttl if self.ttl else 0.0
+
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+            self._data[key] = (value, size, expiresAt)
+            self._bytes += size
+
+            while len(self._data) > self.maxEntries or (self.maxBytes and self._bytes > self.maxBytes):
+                oldest = next(iter(self._data))
+                self._remove(oldest)
+                self._counters["evictions"] += 1
+
+    def pop(self, key: Hashable):
+        with self._lock:
+            if key in self._data:
+                self._remove(key)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            c = dict(self._counters)
+            c["entries"] = len(self._data)
+            c["bytes"] = self._bytes
+
+        lookups = c["hits"] + c["misses"]
+        c["hitRatio"] = c["hits"] / lookups if lookups else 0.0
+        c["config"] = {"maxEntries": self.maxEntries, "maxBytes": self.maxBytes, "ttl": self.ttl}
+
+        return c
+
+    def _remove(self, key: Hashable):
+        _, size, _ = self._data.pop(key)
+        self._bytes -= size
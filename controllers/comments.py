@@ -0,0 +1,60 @@
+# controllersComments.py
+
+from datetime import datetime
+from typing import Optional, Dict, Any
+from sqlalchemy.orm import Session
+from utils import notFound, forbidden, encodeCursor, decodeCursor
+from models.comments import listComments, getComment, createComment, updateComment, deleteComment
+from controllers.posts import _requirePost, _isVisible
+
+def _requireVisiblePost(db: Session, pid: int, viewerId: Optional[int]) -> Dict[str, Any]:
+    p = _requirePost(db, pid)
+
+    if not _isVisible(p, viewerId):
+        notFound("게시글을 찾을 수 없습니다.")
+
+    return p
+
+def _requireOwnComment(db: Session, pid: int, cid: int, authorId: int, action: str) -> Dict[str, Any]:
+    item = getComment(db, pid, cid)
+
+    if not item:
+        notFound("댓글을 찾을 수 없습니다.")
+
+    if item["authorId"] != authorId:
+        forbidden(f"{action} 권한이 없습니다.")
+
+    return item
+
+def ctrlListComments(db: Session, pid: int, limit: int, cursor: Optional[str] = None, viewerId: Optional[int] = None):
+    # (댓글 목록, 다음 페이지 커서) 반환. 마지막 페이지면 커서는 None
+    _requireVisiblePost(db, pid, viewerId)
+    after = decodeCursor(cursor, datetime, int) if cursor else None
+    data = listComments(db, pid, limit, after)
+    nextCursor = encodeCursor(data[-1]["createdAt"], data[-1]["id"]) if len(data) == limit else None
+
+    return data, nextCursor
+
+def ctrlCreateComment(db: Session, pid: int, authorId: int, text: str):
+    _requireVisiblePost(db, pid, authorId)
+    item = createComment(db, pid, authorId, text)
+
+    if not item:
+        notFound("게시글을 찾을 수 없습니다.")
+
+    return item
+
+def ctrlUpdateComment(db: Session, pid: int, cid: int, authorId: int, text: str):
+    _requireVisiblePost(db, pid, authorId)
+    _requireOwnComment(db, pid, cid, authorId, "수정")
+
+    return updateComment(db, pid, cid, text)
+
+def ctrlDeleteComment(db: Session, pid: int, cid: int, authorId: int):
+    _requireVisiblePost(db, pid, authorId)
+    _requireOwnComment(db, pid, cid, authorId, "삭제")
+
+    if not deleteComment(db, pid, cid):
+        notFound("댓글을 찾을 수 없습니다.")
+
+    return True
@@ -1,13 +1,26 @@
 # controllersPosts.py
 
+import os
 from datetime import datetime, timezone
 from fastapi import HTTPException
-from typing import Optional, Dict, Any, List
-from storage import posts, comments, likes, postImages, postSeq, commentSeq
-from utils import notFound, forbidden, badRequest
-from models.posts import listPosts, createPost, getPost, updatePost, deletePost, incView
-from ai import check_toxicity
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from storage import posts, postImages, postSeq
+from utils import notFound, forbidden, badRequest, serviceUnavailable, encodeCursor, decodeCursor, dumpJson, etagFor, etagForBytes, etagMatches
+from models.posts import listPosts, createPost, getPost, updatePost, deletePost, incView, getPostCached, readPostAndIncViewCached, iterListPosts, lastRowKey, getPostValidator, ordersByRank
+from models.likes import likedPostIds, toggleLike
+from moderation import checkText, checkTextAsync, ModerationBusy, verdictRecord
+import moderation
+from moderation_worker import worker as moderationWorker
+from counters import viewCounter
+from posts_cache import listCache, listCacheKey
 from sqlalchemy.orm import Session
+from database import ReadSessionLocal
+
+# limit 이 이 값 이상인 목록은 행을 읽는 대로 직렬화해서 스트리밍 (0 이면 사용 안 함)
+STREAM_MIN_LIMIT = int(os.getenv("POSTS_STREAM_MIN_LIMIT", "200"))
+STREAM_CHUNK_ROWS = int(os.getenv("POSTS_STREAM_CHUNK_ROWS", "100"))
+
+MODERATION_BUSY_MESSAGE = "*요청이 많아 게시글 검사를 처리할 수 없습니다. 잠시 후 다시 시도해주세요."
 
 def _requirePost(db: Session, pid: int) -> Dict[str, Any]:
     p = getPost(db, pid)
@@ -18,43 +31,204 @@ def _requirePost(db: Session, pid: int) -> Dict[str, Any]:
     return p
 
 
-def ctrlListPosts(db: Session, skip: int, limit: int, q: Optional[str]):
-    return listPosts(db, skip, limit, q)
+def ctrlListPosts(
+    db: Session,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+):
+    # (게시글 목록, 다음 페이지 커서) 반환. 마지막 페이지면 커서는 None
+    after = _decodePostCursor(cursor, sort)
+    data = listPosts(db, skip, limit, q, viewerId, after, view == "summary", sort)
+
+    if viewerId is not None:
+        _withLiked(data, likedPostIds(db, viewerId, [p["id"] for p in data]))
+
+    nextCursor = None if ordersByRank(q, after, sort) else _nextPostCursor(data, limit, sort)
+
+    return _withoutSortKey(data), nextCursor
+
+def ctrlListPostsJson(
+    db: Session,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+) -> Tuple[bytes, Optional[str], str]:
+    # (직렬화된 목록, 다음 페이지 커서, ETag). 비로그인 요청은 본인 대기 글 / 좋아요 여부가 없어
+    # 응답이 모두 같으므로 버전 캐시에서 SQL 과 직렬화 없이 바로 돌려준다
+    key = listCacheKey(skip, limit, q, cursor, view, sort) if viewerId is None else None
+    cached = listCache.get(key) if key else None
+
+    if cached:
+        return cached
+
+    data, nextCursor = ctrlListPosts(db, skip, limit, q, viewerId, cursor, view, sort)
+    body = dumpJson(data)
+    result = (body, nextCursor, etagForBytes(body))
 
+    if key:
+        listCache.set(key, result, len(result[0]))
 
-def ctrlCreatePost(db: Session, authorId: int, title: str, body: str):
-    _ensure_not_toxic(body, field="body")
+    return result
 
-    return createPost(db, authorId, title, body)
+def shouldStream(limit: int) -> bool:
+    return 0 < STREAM_MIN_LIMIT <= limit
+
+def ctrlStreamPosts(
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+) -> Tuple[Iterator[bytes], Optional[str]]:
+    # (JSON 배열 조각 iterator, 다음 페이지 커서). 첫 바이트까지의 시간과 메모리가 limit 에 비례하지 않도록
+    # STREAM_CHUNK_ROWS 행씩 읽고 바로 직렬화해서 내보낸다.
+    # 응답 전송이 요청 처리보다 오래 이어지므로 의존성 세션 대신 직접 연 세션을 iterator 가 닫는다
+    after = _decodePostCursor(cursor, sort)
+    db = ReadSessionLocal()
 
-def ctrlGetPost(db: Session, pid: int):
     try:
-        views = incView(db, pid)
-    except KeyError:
-        notFound("게시글을 찾을 수 없습니다.")
+        last = None if ordersByRank(q, after, sort) else lastRowKey(db, skip, limit, q, viewerId, after, sort)
+    except Exception:
+        db.close()
+        raise
 
-    p = getPost(db, pid)
+    def body() -> Iterator[bytes]:
+        try:
+            sep = b"["
+            for part in iterListPosts(db, skip, limit, q, viewerId, after, view == "summary", STREAM_CHUNK_ROWS, sort):
+                if viewerId is not None:
+                    _withLiked(part, likedPostIds(db, viewerId, [p["id"] for p in part]))
+                yield sep + b",".join(dumpJson(p) for p in _withoutSortKey(part))
+                sep = b","
+            yield b"[]" if sep == b"[" else b"]"
+        finally:
+            db.close()
+
+    return body(), encodeCursor(*last) if last else None
+
+def _decodePostCursor(cursor: Optional[str], sort: str = "latest"):
+    if not cursor:
+        return None
+
+    return decodeCursor(cursor, float, int) if sort == "hot" else decodeCursor(cursor, datetime, int)
+
+def _nextPostCursor(data: List[Dict[str, Any]], limit: int, sort: str = "latest") -> Optional[str]:
+    if len(data) < limit:
+        return None
+
+    return encodeCursor(data[-1]["hotScore" if sort == "hot" else "createdAt"], data[-1]["id"])
+
+def _withoutSortKey(data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    # sort=hot 커서용으로 읽은 hotScore 는 응답에 넣지 않는다
+    for p in data:
+        p.pop("hotScore", None)
+
+    return data
+
+def _isVisible(p: Dict[str, Any], viewerId: Optional[int]) -> bool:
+    return p["moderationStatus"] == "approved" or p["authorId"] == viewerId
+
+def _withLiked(data: List[Dict[str, Any]], likedIds) -> List[Dict[str, Any]]:
+    # 요청자의 좋아요 여부 (목록 전체를 한 번의 조회로 채운다)
+    for p in data:
+        p["liked"] = p["id"] in likedIds
+
+    return data
+
+
+def ctrlCreatePost(db: Session, authorId: int, title: str, body: str, verdict: Optional[Dict[str, Any]] = None):
+    if moderation.MODE == "async":
+        p = createPost(db, authorId, title, body, moderation={"moderationStatus": "pending"})
+        moderationWorker.notify()
+        return p
+
+    result = _ensure_not_toxic(body, field="body", verdict=verdict)
+
+    return createPost(db, authorId, title, body, moderation=verdictRecord(body, result))
+
+def _withPendingViews(p: Dict[str, Any]) -> Dict[str, Any]:
+    if viewCounter:
+        p["views"] += viewCounter.pending(p["id"])
+
+    return p
+
+def ctrlGetPost(db: Session, pid: int, viewerId: Optional[int] = None):
+    if not viewCounter:
+        # 조회수 증가와 조회를 한 문장으로
+        p = readPostAndIncViewCached(db, pid, viewerId)
+
+        if not p:
+            notFound("게시글을 찾을 수 없습니다.")
+
+        return _withViewerLike(db, p, viewerId)
+
+    p = getPostCached(db, pid)
     
     if not p:
         notFound("게시글을 찾을 수 없습니다.")
 
-    p["views"] = views
+    if not _isVisible(p, viewerId):
+        notFound("게시글을 찾을 수 없습니다.")
+
+    # 조회 요청에서는 DB 에 쓰지 않고, 저장된 조회수 + 반영 대기 중인 증가분을 응답
+    p["views"] += viewCounter.add(pid)
     
+    return _withViewerLike(db, p, viewerId)
+
+def postEtag(p: Dict[str, Any]) -> str:
+    # 조회수는 조회할 때마다 바뀌므로 ETag 에서 제외 (304 로 재검증한 요청은 조회수를 올리지 않는다).
+    # 같은 ETag 의 응답끼리 views 가 다를 수 있으므로 strong 이 아닌 weak ETag
+    return "W/" + etagFor(p["id"], p["updatedAt"], p["likesCount"], p["commentsCount"], p["moderationStatus"], p.get("liked", False))
+
+def ctrlPostNotModified(db: Session, pid: int, viewerId: Optional[int], ifNoneMatch: Optional[str]) -> Optional[str]:
+    # 본문을 읽기 전에 ETag 에 들어가는 컬럼만 조회해서 비교. 일치하면 ETag, 아니면 None
+    if not ifNoneMatch:
+        return None
+
+    p = getPostValidator(db, pid)
+
+    if not p or not _isVisible(p, viewerId):
+        return None
+
+    etag = postEtag(_withViewerLike(db, p, viewerId))
+
+    return etag if etagMatches(ifNoneMatch, etag) else None
+
+def _withViewerLike(db: Session, p: Dict[str, Any], viewerId: Optional[int]) -> Dict[str, Any]:
+    if viewerId is not None:
+        _withLiked([p], likedPostIds(db, viewerId, [p["id"]]))
+
     return p
 
 def ctrlIncView(pid: int) -> int:
     _requirePost(pid)
     return incView(pid)
 
-def ctrlUpdatePost(db: Session, pid: int, authorId: int, title: str, body: str):
+def ctrlUpdatePost(db: Session, pid: int, authorId: int, title: str, body: str, verdict: Optional[Dict[str, Any]] = None):
     p = _requirePost(db, pid)
 
     if p["authorId"] != authorId:
         forbidden("수정 권한이 없습니다.")
 
-    _ensure_not_toxic(body, field="body")
+    if moderation.MODE == "async":
+        p = updatePost(db, pid, title, body, moderation={"moderationStatus": "pending"})
+        moderationWorker.notify()
+        return _withPendingViews(p)
+
+    result = _ensure_not_toxic(body, field="body", verdict=verdict)
 
-    return updatePost(db, pid, title, body)
+    return _withPendingViews(updatePost(db, pid, title, body, moderation=verdictRecord(body, result)))
 
 def ctrlDeletePost(db: Session, pid: int, authorId: int):
     p = _requirePost(db, pid)
@@ -64,14 +238,58 @@ def ctrlDeletePost(db: Session, pid: int, authorId: int):
 
     return deletePost(db, pid)
 
-def _ensure_not_toxic(text: str, field: str = "text"):
-    result = check_toxicity(text)
+def ctrlRequirePostOwner(db: Session, pid: int, userId: int, action: str) -> Dict[str, Any]:
+    # 본문 없이 존재 / 작성자만 확인. 유해성 검사처럼 비싼 작업 전에 호출한다
+    p = getPostValidator(db, pid)
+
+    if not p:
+        notFound("게시글을 찾을 수 없습니다.")
+
+    if p["authorId"] != userId:
+        forbidden(f"{action} 권한이 없습니다.")
+
+    return p
+
+def ctrlToggleLike(db: Session, pid: int, userId: int) -> Dict[str, Any]:
+    p = _requirePost(db, pid)
+
+    if not _isVisible(p, userId):
+        notFound("게시글을 찾을 수 없습니다.")
+
+    result = toggleLike(db, pid, userId)
+
+    if not result:
+        notFound("게시글을 찾을 수 없습니다.")
+
+    return result
+
+async def ctrlCheckToxicity(text: str) -> Optional[Dict[str, Any]]:
+    # async 모드에서는 저장 후 백그라운드 워커가 검사한다
+    if moderation.MODE == "async":
+        return None
+
+    try:
+        return await checkTextAsync(text)
+    except ModerationBusy:
+        serviceUnavailable(MODERATION_BUSY_MESSAGE)
+
+def _ensure_not_toxic(text: str, field: str = "text", verdict: Optional[Dict[str, Any]] = None):
+    if verdict is not None:
+        result = verdict
+    else:
+        try:
+            result = checkText(text)
+        except ModerationBusy:
+            serviceUnavailable(MODERATION_BUSY_MESSAGE)
 
     if result["isToxic"]:
         fields = {
             "reason": "toxic_language",
             "score": result["score"],
             "label": result["label"],
+            "offset": result.get("offset", 0),
             "field": field,
         }
-        badRequest("*부적절한 표현이 포함되어 있습니다. 내용을 수정해주세요.", fields)
\ No newline at end of file
+        badRequest("*부적절한 표현이 포함되어 있습니다. 내용을 수정해주세요.", fields)
+
+    return result
\ No newline at end of file
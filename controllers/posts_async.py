@@ -0,0 +1,183 @@
+# controllersPostsAsync.py
+# DB_MODE=async 일 때 쓰는 controllers/posts.py 의 AsyncSession 버전
+
+from typing import Optional, Dict, Any, Tuple, AsyncIterator
+from sqlalchemy.ext.asyncio import AsyncSession
+from utils import notFound, forbidden, dumpJson, encodeCursor, etagForBytes, etagMatches
+from database import AsyncReadSessionLocal
+from models import posts_async as m
+from models.posts import ordersByRank
+from moderation import verdictRecord
+import moderation
+from moderation_worker import worker as moderationWorker
+from counters import viewCounter
+from posts_cache import listCache, listCacheKey
+from controllers.posts import (
+    STREAM_CHUNK_ROWS, postEtag, _decodePostCursor, _nextPostCursor, _withoutSortKey, _isVisible, _withLiked, _withPendingViews, _ensure_not_toxic,
+)
+
+async def _requirePost(db: AsyncSession, pid: int) -> Dict[str, Any]:
+    p = await m.getPost(db, pid)
+
+    if not p:
+        notFound("게시글을 찾을 수 없습니다.")
+
+    return p
+
+async def ctrlListPosts(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+):
+    after = _decodePostCursor(cursor, sort)
+    data = await m.listPosts(db, skip, limit, q, viewerId, after, view == "summary", sort)
+
+    if viewerId is not None:
+        _withLiked(data, await m.likedPostIds(db, viewerId, [p["id"] for p in data]))
+
+    nextCursor = None if ordersByRank(q, after, sort) else _nextPostCursor(data, limit, sort)
+
+    return _withoutSortKey(data), nextCursor
+
+async def ctrlListPostsJson(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+) -> Tuple[bytes, Optional[str], str]:
+    key = listCacheKey(skip, limit, q, cursor, view, sort) if viewerId is None else None
+    cached = listCache.get(key) if key else None
+
+    if cached:
+        return cached
+
+    data, nextCursor = await ctrlListPosts(db, skip, limit, q, viewerId, cursor, view, sort)
+    body = dumpJson(data)
+    result = (body, nextCursor, etagForBytes(body))
+
+    if key:
+        listCache.set(key, result, len(result[0]))
+
+    return result
+
+async def ctrlStreamPosts(
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    cursor: Optional[str] = None,
+    view: str = "full",
+    sort: str = "latest",
+) -> Tuple[AsyncIterator[bytes], Optional[str]]:
+    after = _decodePostCursor(cursor, sort)
+    db = AsyncReadSessionLocal()
+
+    try:
+        last = None if ordersByRank(q, after, sort) else await m.lastRowKey(db, skip, limit, q, viewerId, after, sort)
+    except Exception:
+        await db.close()
+        raise
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            sep = b"["
+            async for part in m.iterListPosts(db, skip, limit, q, viewerId, after, view == "summary", STREAM_CHUNK_ROWS, sort):
+                if viewerId is not None:
+                    _withLiked(part, await m.likedPostIds(db, viewerId, [p["id"] for p in part]))
+                yield sep + b",".join(dumpJson(p) for p in _withoutSortKey(part))
+                sep = b","
+            yield b"[]" if sep == b"[" else b"]"
+        finally:
+            await db.close()
+
+    return body(), encodeCursor(*last) if last else None
+
+async def ctrlCreatePost(db: AsyncSession, authorId: int, title: str, body: str, verdict: Optional[Dict[str, Any]] = None):
+    if moderation.MODE == "async":
+        p = await m.createPost(db, authorId, title, body, moderation={"moderationStatus": "pending"})
+        moderationWorker.notify()
+        return p
+
+    result = _ensure_not_toxic(body, field="body", verdict=verdict)
+
+    return await m.createPost(db, authorId, title, body, moderation=verdictRecord(body, result))
+
+async def ctrlGetPost(db: AsyncSession, pid: int, viewerId: Optional[int] = None):
+    if not viewCounter:
+        p = await m.readPostAndIncViewCached(db, pid, viewerId)
+
+        if not p:
+            notFound("게시글을 찾을 수 없습니다.")
+
+        return await _withViewerLike(db, p, viewerId)
+
+    p = await m.getPostCached(db, pid)
+
+    if not p or not _isVisible(p, viewerId):
+        notFound("게시글을 찾을 수 없습니다.")
+
+    p["views"] += viewCounter.add(pid)
+
+    return await _withViewerLike(db, p, viewerId)
+
+async def ctrlPostNotModified(db: AsyncSession, pid: int, viewerId: Optional[int], ifNoneMatch: Optional[str]) -> Optional[str]:
+    if not ifNoneMatch:
+        return None
+
+    p = await m.getPostValidator(db, pid)
+
+    if not p or not _isVisible(p, viewerId):
+        return None
+
+    etag = postEtag(await _withViewerLike(db, p, viewerId))
+
+    return etag if etagMatches(ifNoneMatch, etag) else None
+
+async def _withViewerLike(db: AsyncSession, p: Dict[str, Any], viewerId: Optional[int]) -> Dict[str, Any]:
+    if viewerId is not None:
+        _withLiked([p], await m.likedPostIds(db, viewerId, [p["id"]]))
+
+    return p
+
+async def ctrlRequirePostOwner(db: AsyncSession, pid: int, userId: int, action: str) -> Dict[str, Any]:
+    p = await m.getPostValidator(db, pid)
+
+    if not p:
+        notFound("게시글을 찾을 수 없습니다.")
+
+    if p["authorId"] != userId:
+        forbidden(f"{action} 권한이 없습니다.")
+
+    return p
+
+async def ctrlUpdatePost(db: AsyncSession, pid: int, authorId: int, title: str, body: str, verdict: Optional[Dict[str, Any]] = None):
+    p = await _requirePost(db, pid)
+
+    if p["authorId"] != authorId:
+        forbidden("수정 권한이 없습니다.")
+
+    if moderation.MODE == "async":
+        p = await m.updatePost(db, pid, title, body, moderation={"moderationStatus": "pending"})
+        moderationWorker.notify()
+        return _withPendingViews(p)
+
+    result = _ensure_not_toxic(body, field="body", verdict=verdict)
+
+    return _withPendingViews(await m.updatePost(db, pid, title, body, moderation=verdictRecord(body, result)))
+
+async def ctrlDeletePost(db: AsyncSession, pid: int, authorId: int):
+    p = await _requirePost(db, pid)
+
+    if p["authorId"] != authorId:
+        forbidden("삭제 권한이 없습니다.")
+
+    return await m.deletePost(db, pid)
@@ -0,0 +1,31 @@
+# controllersUsers.py
+
+from datetime import datetime
+from typing import Optional
+from sqlalchemy.orm import Session
+from utils import encodeCursor, decodeCursor
+from models.posts import listAuthorPosts, getAuthorStats
+from models.likes import likedPostIds
+from controllers.posts import _withLiked
+
+def ctrlListUserPosts(
+    db: Session,
+    uid: int,
+    limit: int,
+    cursor: Optional[str] = None,
+    viewerId: Optional[int] = None,
+    view: str = "full",
+):
+    # (작성자의 글 목록, 다음 페이지 커서) 반환. 마지막 페이지면 커서는 None
+    after = decodeCursor(cursor, datetime, int) if cursor else None
+    data = listAuthorPosts(db, uid, limit, viewerId, after, view == "summary")
+
+    if viewerId is not None:
+        _withLiked(data, likedPostIds(db, viewerId, [p["id"] for p in data]))
+
+    nextCursor = encodeCursor(data[-1]["createdAt"], data[-1]["id"]) if len(data) == limit else None
+
+    return data, nextCursor
+
+def ctrlGetUserStats(db: Session, uid: int):
+    return getAuthorStats(db, uid)
@@ -0,0 +1,94 @@
+# counters.py
+
+import logging
+import os
+import threading
+from typing import Dict
+
+from database import SessionLocal
+from models.posts import addViews
+
+# 조회수를 메모리에 모았다가 주기적으로 한 트랜잭션에서 DB 에 반영 (0 이면 요청마다 UPDATE)
+BUFFER_VIEWS = os.getenv("VIEW_BUFFER", "1") != "0"
+FLUSH_INTERVAL = float(os.getenv("VIEW_FLUSH_INTERVAL", "5"))
+
+logger = logging.getLogger(__name__)
+
+
+class ViewCounter:
+    def __init__(self, interval: float):
+        self.interval = interval
+        self._pending: Dict[int, int] = {}
+        # flush 중인(아직 commit 되지 않은) 증가분도 응답에 포함시키기 위해 따로 보관
+        self._flushing: Dict[int, int] = {}
+        self._lock = threading.Lock()
+        self._flushLock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._counters = {"views": 0, "flushes": 0, "rowsFlushed": 0, "errors": 0}
+
+    def add(self, pid: int, n: int = 1) -> int:
+        # 증가시킨 뒤 아직 DB 에 반영되지 않은 증가분을 반환
+        with self._lock:
+            self._pending[pid] = self._pending.get(pid, 0) + n
+            self._counters["views"] += n
+            return self._pending[pid] + self._flushing.get(pid, 0)
+
+    def pending(self, pid: int) -> int:
+        with self._lock:
+            return self._pending.get(pid, 0) + self._flushing.get(pid, 0)
+
+    def flush(self) -> int:
+        with self._flushLock:
+            with self._lock:
+                batch, self._pending = self._pending, {}
+                self._flushing = batch
+
+            if not batch:
+                return 0
+
+            db = SessionLocal()
+            try:
+                addViews(db, batch)
+            except Exception:
+                # 실패한 증가분은 다음 flush 때 다시 시도
+                with self._lock:
+                    for pid, n in batch.items():
+                        self._pending[pid] = self._pending.get(pid, 0) + n
+                    self._flushing = {}
+                    self._counters["errors"] += 1
+                raise
+            finally:
+                db.close()
+
+            with self._lock:
+                self._flushing = {}
+                self._counters["flushes"] += 1
+                self._counters["rowsFlushed"] += len(batch)
+
+            return len(batch)
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="view-counter", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self.flush()
+
+    def stats(self):
+        with self._lock:
+            c = dict(self._counters)
+            c["pendingPosts"] = len(self._pending)
+        return c
+
+    def _loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.flush()
+            except Exception:
+                logger.exception("view counter flush failed")
+
+
+viewCounter = ViewCounter(FLUSH_INTERVAL) if BUFFER_VIEWS else None
@@ -1,17 +1,61 @@
 # database.py
 
-from sqlalchemy import create_engine
+import os
+from sqlalchemy import create_engine, event, inspect
 from sqlalchemy.orm import sessionmaker, declarative_base
 from typing import Generator
 
 SQLALCHEMY_DATABASE_URL = "sqlite:///./community.db"
 
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL,
-    connect_args={"check_same_thread": False},
-)
+# wal: WAL 저널 + 쓰기 전용 단일 커넥션 엔진 / 읽기 전용 커넥션 풀 분리
+# default: 기존과 같은 단일 엔진, SQLite 기본 설정
+STORAGE_PROFILE = os.getenv("SQLITE_PROFILE", "wal")
+SQLITE_SYNCHRONOUS = os.getenv("SQLITE_SYNCHRONOUS", "NORMAL")
+SQLITE_CACHE_SIZE = int(os.getenv("SQLITE_CACHE_SIZE", "-20000"))  # 음수면 KiB 단위
+SQLITE_MMAP_SIZE = int(os.getenv("SQLITE_MMAP_SIZE", str(256 * 1024 * 1024)))
+SQLITE_BUSY_TIMEOUT = int(os.getenv("SQLITE_BUSY_TIMEOUT", "5000"))  # ms
+SQLITE_READ_POOL_SIZE = int(os.getenv("SQLITE_READ_POOL_SIZE", "8"))
+# sync: 기존 Session + sync 라우트, async: 게시글 API 를 AsyncSession(aiosqlite) + async 라우트로 처리
+DB_MODE = os.getenv("DB_MODE", "sync")
+
+
+def _applyPragmas(engine, readOnly: bool):
+    @event.listens_for(engine, "connect")
+    def setPragmas(dbapiConnection, connectionRecord):
+        cur = dbapiConnection.cursor()
+        if not readOnly:
+            cur.execute("PRAGMA journal_mode=WAL")
+        cur.execute(f"PRAGMA synchronous={SQLITE_SYNCHRONOUS}")
+        cur.execute(f"PRAGMA cache_size={SQLITE_CACHE_SIZE}")
+        cur.execute(f"PRAGMA mmap_size={SQLITE_MMAP_SIZE}")
+        cur.execute(f"PRAGMA busy_timeout={SQLITE_BUSY_TIMEOUT}")
+        if readOnly:
+            cur.execute("PRAGMA query_only=ON")
+        cur.close()
+
+
+def buildEngines(url: str = SQLALCHEMY_DATABASE_URL, profile: str = STORAGE_PROFILE, factory=create_engine):
+    # (쓰기 엔진, 읽기 엔진) 반환. factory 로 create_async_engine 을 넘기면 async 엔진
+    connectArgs = {"check_same_thread": False}
+
+    if profile != "wal":
+        engine = factory(url, connect_args=connectArgs)
+        return engine, engine
+
+    # SQLite 는 한 번에 하나의 writer 만 허용하므로 쓰기 커넥션은 하나만 두고,
+    # WAL 덕분에 읽기는 쓰기와 동시에 별도 풀에서 진행된다
+    writeEngine = factory(url, connect_args=connectArgs, pool_size=1, max_overflow=0)
+    readEngine = factory(url, connect_args=connectArgs, pool_size=SQLITE_READ_POOL_SIZE, max_overflow=0)
+    _applyPragmas(getattr(writeEngine, "sync_engine", writeEngine), readOnly=False)
+    _applyPragmas(getattr(readEngine, "sync_engine", readEngine), readOnly=True)
+
+    return writeEngine, readEngine
+
+
+engine, readEngine = buildEngines()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+ReadSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=readEngine)
 
 Base = declarative_base()
 
@@ -22,3 +66,65 @@ def get_db() -> Generator:
         yield db
     finally:
         db.close()
+
+
+def get_read_db() -> Generator:
+    # 조회만 하는 API 용 세션 (쓰기 시도 시 query_only 로 실패)
+    db = ReadSessionLocal()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+if DB_MODE == "async":
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    ASYNC_DATABASE_URL = SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    asyncEngine, asyncReadEngine = buildEngines(ASYNC_DATABASE_URL, factory=create_async_engine)
+    AsyncSessionLocal = async_sessionmaker(asyncEngine, autoflush=False, expire_on_commit=False)
+    AsyncReadSessionLocal = async_sessionmaker(asyncReadEngine, autoflush=False, expire_on_commit=False)
+
+
+async def get_async_db():
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+async def get_async_read_db():
+    async with AsyncReadSessionLocal() as db:
+        yield db
+
+
+def _columnDefault(col) -> str:
+    if col.server_default is None:
+        return ""
+
+    arg = col.server_default.arg
+    value = f"'{arg}'" if isinstance(arg, str) else str(getattr(arg, "text", arg))
+
+    return f" DEFAULT {value}"
+
+
+def migrate(bind=engine):
+    # create_all 은 기존 테이블에 컬럼/인덱스를 추가하지 않으므로,
+    # 모델에 새로 추가된 컬럼과 인덱스를 기존 DB 파일에 반영한다.
+    # wal 프로필의 쓰기 엔진은 커넥션이 하나뿐이므로 생성 / 조회 / 변경을 모두 같은 커넥션에서 한다
+    with bind.begin() as conn:
+        Base.metadata.create_all(bind=conn)
+        insp = inspect(conn)
+
+        for table in Base.metadata.sorted_tables:
+            existing = {c["name"] for c in insp.get_columns(table.name)}
+
+            for col in table.columns:
+                if col.name in existing:
+                    continue
+
+                ddl = col.type.compile(dialect=bind.dialect)
+                conn.exec_driver_sql(
+                    f'ALTER TABLE "{table.name}" ADD COLUMN "{col.name}" {ddl}{_columnDefault(col)}'
+                )
+
+            for index in table.indexes:
+                index.create(conn, checkfirst=True)
@@ -1,11 +1,17 @@
 # db_models.py
 from datetime import datetime, timezone
-from sqlalchemy import Column, Integer, String, Text, DateTime
+from sqlalchemy import Column, Integer, String, Text, DateTime, Float, Index
 from database import Base
 
 
 class Post(Base):
     __tablename__ = "posts"
+    __table_args__ = (
+        # 최신순 목록의 정렬 + 커서(createdAt, id) 범위 조건용
+        Index("ix_posts_createdAt_id", "createdAt", "id"),
+        # sort=hot 목록의 정렬 + 커서(hotScore, id) 범위 조건용
+        Index("ix_posts_hotScore_id", "hotScore", "id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String(255), nullable=False)
@@ -18,3 +24,55 @@ class Post(Base):
     views = Column(Integer, default=0)
     likesCount = Column(Integer, default=0)
     commentsCount = Column(Integer, default=0)
+    # trending.scoreSql. 카운터가 바뀔 때 트리거(trending.py)가 다시 계산한다
+    hotScore = Column(Float, nullable=False, default=0, server_default="0")
+
+    # pending: 유해성 검사 대기, approved: 공개, rejected: 유해 판정
+    moderationStatus = Column(String(16), nullable=False, default="approved", server_default="approved", index=True)
+    # 마지막 유해성 판정 결과. moderationModel / contentHash 가 현재 설정·본문과 다르면 재검사 대상
+    moderationLabel = Column(String(64), nullable=True)
+    moderationScore = Column(Float, nullable=True)
+    moderationModel = Column(String(128), nullable=True)
+    contentHash = Column(String(64), nullable=True)
+
+
+# GET /users/{id}/posts: 작성자 한 명의 글을 (createdAt DESC, id DESC) 순서 그대로 범위 조회 (정렬 단계 없음)
+Index("ix_posts_authorId_createdAt_id", Post.authorId, Post.createdAt.desc(), Post.id.desc())
+
+
+class PostLike(Base):
+    __tablename__ = "post_likes"
+    __table_args__ = (
+        # (postId, userId) 기본 키가 중복 좋아요를 막고, 이 인덱스로 "내가 좋아요한 글" 을 조회
+        Index("ix_post_likes_userId_postId", "userId", "postId"),
+    )
+
+    postId = Column(Integer, primary_key=True)
+    userId = Column(Integer, primary_key=True)
+    createdAt = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class Comment(Base):
+    __tablename__ = "comments"
+    __table_args__ = (
+        # 게시글별 댓글 목록의 정렬 + 커서(createdAt, id) 범위 조건용
+        Index("ix_comments_postId_createdAt_id", "postId", "createdAt", "id"),
+    )
+
+    id = Column(Integer, primary_key=True)
+    postId = Column(Integer, nullable=False)
+    authorId = Column(Integer, nullable=False)
+    text = Column(Text, nullable=False)
+
+    createdAt = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    updatedAt = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+
+
+class AuthorStats(Base):
+    # 작성자별 공개 글 집계. posts 트리거(author_stats.py)가 증감하므로 직접 쓰지 않는다
+    __tablename__ = "author_stats"
+
+    authorId = Column(Integer, primary_key=True)
+    postCount = Column(Integer, nullable=False, default=0, server_default="0")
+    totalViews = Column(Integer, nullable=False, default=0, server_default="0")
+    totalLikes = Column(Integer, nullable=False, default=0, server_default="0")
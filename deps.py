@@ -15,4 +15,14 @@ def getCurrentUser(authorization: Optional[str] = Header(default=None)) -> Dict[
     if not uid:
         invalidToken()
     
-    return users[uid]
\ No newline at end of file
+    return users[uid]
+
+def getOptionalUser(authorization: Optional[str] = Header(default=None)) -> Optional[Dict[str, Any]]:
+    # 로그인하지 않아도 되는 API 에서 요청자를 식별할 때 사용
+    if not authorization or not authorization.startswith("Bearer "):
+        return None
+
+    token = authorization.split(" ", 1)[1].strip()
+    uid = sessions.get(token)
+
+    return users.get(uid) if uid else None
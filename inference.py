@@ -0,0 +1,90 @@
+# inference.py
+
+import multiprocessing
+import os
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import List
+
+import ai
+from ai import Verdict
+
+WORKERS = int(os.getenv("TOXIC_WORKERS", "0"))
+WORKER_THREADS = int(os.getenv("TOXIC_WORKER_THREADS", "0"))
+
+
+def _initWorker(threads: int):
+    # 워커마다 모델을 한 번만 로딩하고, intra-op 스레드 수를 제한해서
+    # 워커 수 x 스레드 수가 코어 수를 넘지 않도록 한다
+    ai.load_model()
+    ai.torch.set_num_threads(threads)
+    ai.warmup()
+
+
+def _runBatch(texts: List[str]) -> List[Verdict]:
+    return ai.check_toxicity_batch(texts)
+
+
+def _ping() -> bool:
+    return ai.is_ready()
+
+
+class InferenceExecutor:
+    # 모델을 로딩한 워커 프로세스 풀. 동시에 처리 중인 배치 수를 제한한다
+    def __init__(self, workers: int, threadsPerWorker: int = 0):
+        self.workers = max(1, workers)
+        self.threadsPerWorker = threadsPerWorker or max(1, (os.cpu_count() or 1) // self.workers)
+        self._inFlight = threading.BoundedSemaphore(self.workers * 2)
+        self._pool: ProcessPoolExecutor | None = None
+        self._lock = threading.Lock()
+        self.ready = False
+
+    def start(self):
+        pool = self._getPool()
+        for f in [pool.submit(_ping) for _ in range(self.workers)]:
+            f.result()
+        self.ready = True
+
+    def startInBackground(self) -> threading.Thread:
+        t = threading.Thread(target=self.start, name="inference-workers", daemon=True)
+        t.start()
+        return t
+
+    def status(self):
+        return {"processes": self.workers, "threadsPerWorker": self.threadsPerWorker, "ready": self.ready}
+
+    def submit(self, texts: List[str]) -> Future:
+        self._inFlight.acquire()
+
+        try:
+            fut = self._getPool().submit(_runBatch, texts)
+        except Exception:
+            self._inFlight.release()
+            raise
+
+        fut.add_done_callback(lambda _: self._inFlight.release())
+        return fut
+
+    def run(self, texts: List[str]) -> List[Verdict]:
+        return self.submit(texts).result()
+
+    def shutdown(self):
+        with self._lock:
+            if self._pool is not None:
+                self._pool.shutdown(wait=False, cancel_futures=True)
+                self._pool = None
+
+    def _getPool(self) -> ProcessPoolExecutor:
+        if self._pool is None:
+            with self._lock:
+                if self._pool is None:
+                    self._pool = ProcessPoolExecutor(
+                        max_workers=self.workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                        initializer=_initWorker,
+                        initargs=(self.threadsPerWorker,),
+                    )
+        return self._pool
+
+
+executor = InferenceExecutor(WORKERS, WORKER_THREADS) if WORKERS > 0 else None
@@ -4,16 +4,31 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from routers.auth import router as authRouter
 from routers.posts import router as postsRouter
+from routers.users import router as usersRouter
 from datetime import datetime, timezone
 from fastapi.responses import JSONResponse
 from fastapi.exceptions import RequestValidationError
-from database import Base, engine
+from database import migrate, engine
+import database
+from search import setupFts
+from trending import setupHotScore
+from author_stats import setupAuthorStats
+from moderation import moderationStats
+import ai
+from inference import executor
+import moderation
+from moderation_worker import worker as moderationWorker
+from counters import viewCounter
+from posts_cache import cacheStats
 import db_models
 
 
 app = FastAPI(title = "Community API", version = "0.2.0")
 
-Base.metadata.create_all(bind = engine)
+migrate()
+setupFts(engine)
+setupHotScore(engine)
+setupAuthorStats(engine)
 
 
 origins = [
@@ -31,10 +46,48 @@ app.add_middleware(
     allow_credentials = True,
     allow_methods = ["*"],
     allow_headers = ["*"],
+    expose_headers = ["X-Next-Cursor"],
 )
 
 app.include_router(authRouter)
+
+if database.DB_MODE == "async":
+    # 같은 경로는 먼저 등록된 라우트가 처리하므로 async 라우터를 앞에 둔다
+    from routers.posts_async import router as postsAsyncRouter
+    app.include_router(postsAsyncRouter)
+
 app.include_router(postsRouter)
+app.include_router(usersRouter)
+
+@app.on_event("startup")
+def startBackgroundWorkers():
+    # 모델은 백그라운드에서 로딩하고, 유해성 검사가 없는 API 는 바로 요청을 받는다
+    if executor:
+        # 워커 프로세스가 각자 모델을 로딩하므로 API 프로세스에서는 로딩하지 않는다
+        executor.startInBackground()
+    elif ai.PRELOAD:
+        ai.start_background_warmup()
+
+    if moderation.MODE == "async":
+        moderationWorker.start()
+
+    if viewCounter:
+        viewCounter.start()
+
+@app.on_event("shutdown")
+async def stopBackgroundWorkers():
+    moderationWorker.stop()
+
+    if viewCounter:
+        # 메모리에 남은 조회수 증가분을 반영하고 종료
+        viewCounter.stop()
+
+    if executor:
+        executor.shutdown()
+
+    if database.DB_MODE == "async":
+        await database.asyncEngine.dispose()
+        await database.asyncReadEngine.dispose()
 
 """ utils.py
 pwdContext = CryptContext(schemes = ["pbkdf2_sha256"], deprecated = "auto")
@@ -280,7 +333,26 @@ def ctrlDeletePost(pid: int, authorId: int):
 
 @app.get("/health")
 def health():
-    return {"status": "ok", "time": datetime.now(timezone.utc).isoformat()}
+    return {
+        "status": "ok",
+        "time": datetime.now(timezone.utc).isoformat(),
+        "model": executor.status() if executor else ai.model_status(),
+        "views": viewCounter.stats() if viewCounter else None,
+    }
+
+@app.get("/health/cache")
+def healthCache():
+    return cacheStats()
+
+@app.get("/health/moderation")
+def healthModeration():
+    stats = moderationStats()
+    stats["mode"] = moderation.MODE
+
+    if moderation.MODE == "async":
+        stats["worker"] = moderationWorker.stats()
+
+    return stats
 
 """ routersAuth.py
 @app2.post("/auth/signup", response_model = UserOut)
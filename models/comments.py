@@ -0,0 +1,87 @@
+# modelsComments.py
+
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, List, Tuple
+from sqlalchemy import select, update, delete, tuple_, func
+from sqlalchemy.orm import Session
+from db_models import Post, Comment
+
+COMMENT_COLUMNS = [Comment.id, Comment.postId, Comment.authorId, Comment.text, Comment.createdAt, Comment.updatedAt]
+
+
+def _addCommentsCount(db: Session, pid: int, delta: int) -> int:
+    return db.execute(
+        update(Post)
+        .where(Post.id == pid)
+        .values(commentsCount=func.max(func.coalesce(Post.commentsCount, 0) + delta, 0))
+        .execution_options(synchronize_session=False)
+    ).rowcount
+
+
+def listComments(
+    db: Session,
+    pid: int,
+    limit: int,
+    after: Optional[Tuple[datetime, int]] = None,
+) -> List[Dict[str, Any]]:
+    # 오래된 순. (postId, createdAt, id) 인덱스를 커서 위치부터 limit 개만 읽는다
+    stmt = select(*COMMENT_COLUMNS).where(Comment.postId == pid)
+
+    if after is not None:
+        stmt = stmt.where(tuple_(Comment.createdAt, Comment.id) > tuple_(*after))
+
+    rows = db.execute(stmt.order_by(Comment.createdAt, Comment.id).limit(limit))
+    return [dict(r._mapping) for r in rows]
+
+
+def getComment(db: Session, pid: int, cid: int) -> Optional[Dict[str, Any]]:
+    row = db.execute(select(*COMMENT_COLUMNS).where(Comment.id == cid, Comment.postId == pid)).first()
+    return dict(row._mapping) if row else None
+
+
+def createComment(db: Session, pid: int, authorId: int, text: str) -> Optional[Dict[str, Any]]:
+    # 댓글 추가와 commentsCount 증가를 한 트랜잭션에서. 게시글이 없으면 None
+    if not _addCommentsCount(db, pid, 1):
+        db.rollback()
+        return None
+
+    now = datetime.now(timezone.utc)
+    comment = Comment(postId=pid, authorId=authorId, text=text.strip(), createdAt=now, updatedAt=now)
+    db.add(comment)
+    db.flush()
+    # SQLite 에는 시간대 없이 저장되므로 목록 / 수정 응답과 같은 값(시간대 없는 UTC)으로 돌려준다
+    stored = now.replace(tzinfo=None)
+    item = {
+        "id": comment.id, "postId": pid, "authorId": authorId,
+        "text": comment.text, "createdAt": stored, "updatedAt": stored,
+    }
+    db.commit()
+    return item
+
+
+def updateComment(db: Session, pid: int, cid: int, text: str) -> Optional[Dict[str, Any]]:
+    now = datetime.now(timezone.utc)
+    db.execute(
+        update(Comment)
+        .where(Comment.id == cid, Comment.postId == pid)
+        .values(text=text.strip(), updatedAt=now)
+        .execution_options(synchronize_session=False)
+    )
+    db.commit()
+    return getComment(db, pid, cid)
+
+
+def deleteComment(db: Session, pid: int, cid: int) -> bool:
+    # 댓글 삭제와 commentsCount 감소를 한 트랜잭션에서
+    if not db.execute(delete(Comment).where(Comment.id == cid, Comment.postId == pid)).rowcount:
+        db.rollback()
+        return False
+
+    _addCommentsCount(db, pid, -1)
+    db.commit()
+    return True
+
+
+def deleteComments(db: Session, pid: int):
+    # 게시글 삭제 시 같은 트랜잭션에서 댓글도 정리 (commit 은 호출한 쪽에서)
+    db.execute(delete(Comment).where(Comment.postId == pid))
@@ -0,0 +1,64 @@
+# modelsLikes.py
+
+from datetime import datetime, timezone
+from typing import Optional, Dict, Any, Iterable, Set
+from sqlalchemy import select, delete, update, func
+from sqlalchemy.dialects.sqlite import insert
+from sqlalchemy.orm import Session
+from db_models import Post, PostLike
+
+
+def likedStmt(userId: int, pids: Iterable[int]):
+    return select(PostLike.postId).where(PostLike.userId == userId, PostLike.postId.in_(list(pids)))
+
+
+def likedPostIds(db: Session, userId: int, pids: Iterable[int]) -> Set[int]:
+    # 목록 한 페이지의 좋아요 여부를 쿼리 한 번으로 조회
+    pids = list(pids)
+    if not pids:
+        return set()
+    return set(db.execute(likedStmt(userId, pids)).scalars())
+
+
+def toggleLike(db: Session, pid: int, userId: int) -> Optional[Dict[str, Any]]:
+    # 좋아요 행 삭제(취소) 또는 추가와 likesCount 증감을 한 트랜잭션에서 처리.
+    # 행이 실제로 바뀐 경우에만 카운터를 움직이므로 동시 요청에도 likesCount 가 어긋나지 않는다
+    removed = db.execute(
+        delete(PostLike).where(PostLike.postId == pid, PostLike.userId == userId)
+    ).rowcount
+
+    if removed:
+        liked, delta = False, -1
+    else:
+        added = db.execute(
+            insert(PostLike)
+            .values(postId=pid, userId=userId, createdAt=datetime.now(timezone.utc))
+            .on_conflict_do_nothing()
+        ).rowcount
+        liked, delta = True, 1 if added else 0
+
+    stmt = (
+        update(Post)
+        .where(Post.id == pid)
+        .values(likesCount=func.coalesce(Post.likesCount, 0) + delta)
+        .execution_options(synchronize_session=False)
+    )
+
+    if db.get_bind().dialect.update_returning:
+        likesCount = db.execute(stmt.returning(Post.likesCount)).scalar()
+    elif db.execute(stmt).rowcount:
+        likesCount = db.execute(select(Post.likesCount).where(Post.id == pid)).scalar()
+    else:
+        likesCount = None
+
+    if likesCount is None:
+        db.rollback()
+        return None
+
+    db.commit()
+    return {"liked": liked, "likesCount": likesCount}
+
+
+def deleteLikes(db: Session, pid: int):
+    # 게시글 삭제 시 같은 트랜잭션에서 좋아요 행도 정리 (commit 은 호출한 쪽에서)
+    db.execute(delete(PostLike).where(PostLike.postId == pid))
@@ -1,9 +1,15 @@
 # modelsPosts.py
 
+import os
 from datetime import datetime, timezone
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Iterator
+from sqlalchemy import tuple_, update, bindparam, select, func
 from sqlalchemy.orm import Session
-from db_models import Post
+from db_models import Post, AuthorStats
+from models.likes import deleteLikes
+from models.comments import deleteComments
+from posts_cache import bumpPostsVersion, postsVersion, postCache, cachePost, invalidatePost
+import search
 
 
 def post_to_dict(post: Post) -> Dict[str, Any]:
@@ -17,30 +23,210 @@ def post_to_dict(post: Post) -> Dict[str, Any]:
         "views": post.views or 0,
         "likesCount": post.likesCount or 0,
         "commentsCount": post.commentsCount or 0,
+        "moderationStatus": post.moderationStatus or "approved",
     }
 
 
-def listPosts(db: Session, skip: int, limit: int, q: Optional[str]) -> List[Dict[str, Any]]:
-    query = db.query(Post)
-    if q:
-        key = f"%{q.strip().lower()}%"
-        query = query.filter(
+# API 응답에 쓰는 컬럼. 조회 경로에서는 ORM 객체 대신 이 컬럼들만 Core 로 읽는다
+POST_COLUMNS = [
+    Post.id, Post.title, Post.body, Post.authorId, Post.createdAt, Post.updatedAt,
+    Post.views, Post.likesCount, Post.commentsCount, Post.moderationStatus,
+]
+
+
+# view=summary 목록의 excerpt 최대 길이(글자 수)
+EXCERPT_CHARS = int(os.getenv("POSTS_EXCERPT_CHARS", "200"))
+
+# 목록 요약용 컬럼. body 전체 대신 SQL 에서 잘라낸 앞부분만 읽는다 (잘렸는지 알기 위해 1글자 더)
+POST_SUMMARY_COLUMNS = [
+    Post.id, Post.title, func.substr(Post.body, 1, EXCERPT_CHARS + 1).label("excerpt"), Post.authorId,
+    Post.createdAt, Post.updatedAt, Post.views, Post.likesCount, Post.commentsCount, Post.moderationStatus,
+]
+
+
+# 게시글 캐시 위에 매 요청 덮어쓰는 카운터 컬럼
+POST_COUNTER_COLUMNS = [Post.views, Post.likesCount, Post.commentsCount]
+
+
+def row_to_dict(row) -> Dict[str, Any]:
+    p = dict(row._mapping)
+    p["views"] = p.get("views") or 0
+    p["likesCount"] = p["likesCount"] or 0
+    p["commentsCount"] = p["commentsCount"] or 0
+    p["moderationStatus"] = p["moderationStatus"] or "approved"
+    if "excerpt" in p and len(p["excerpt"]) > EXCERPT_CHARS:
+        p["excerpt"] = p["excerpt"][:EXCERPT_CHARS].rstrip() + "…"
+    return p
+
+
+def visibleTo(viewerId: Optional[int], includeOwnRejected: bool = False):
+    # 공개된 글 + 요청자 본인의 검사 대기 글 (상세 조회는 본인 글이면 상태와 무관)
+    visible = Post.moderationStatus == "approved"
+    if viewerId is not None:
+        own = Post.authorId == viewerId
+        visible = visible | (own if includeOwnRejected else own & (Post.moderationStatus == "pending"))
+    return visible
+
+
+# 목록 정렬 키 (내림차순). 커서는 페이지 마지막 행의 이 값들
+SORT_KEYS = {
+    "latest": (Post.createdAt, Post.id),
+    "hot": (Post.hotScore, Post.id),
+}
+
+
+def ordersByRank(q: Optional[str], after: Optional[Tuple[Any, int]] = None, sort: str = "latest") -> bool:
+    # FTS 검색의 최신순 첫 페이지는 관련도(bm25) 순이라 마지막 행의 (createdAt, id) 로는 다음 페이지를 이어갈 수 없다.
+    # 이 경우 다음 페이지는 skip 으로만 조회한다 (커서를 내보내지 않음)
+    q = (q or "").strip()
+    return bool(q) and after is None and sort == "latest" and search.canUseFts(q)
+
+
+def listPostsStmt(
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+    columns: Optional[List[Any]] = None,
+    sort: str = "latest",
+):
+    # sync / async 목록 조회가 같이 쓰는 SELECT 문
+    keys = SORT_KEYS[sort]
+
+    if columns is None:
+        columns = POST_SUMMARY_COLUMNS if summary else POST_COLUMNS
+        if sort == "hot":
+            # 다음 페이지 커서를 만들기 위해 hotScore 도 읽는다 (응답 전에 controller 에서 제거)
+            columns = columns + [Post.hotScore]
+
+    stmt = select(*columns).where(visibleTo(viewerId))
+    order = [k.desc() for k in keys]
+    q = (q or "").strip()
+
+    if q and search.canUseFts(q):
+        # FTS5 인덱스로 검색하고, 최신순 첫 페이지면 관련도(bm25) 순으로 정렬
+        stmt = stmt.join(search.postsFts, search.postsFts.c.rowid == Post.id).where(search.matchClause(q))
+        if ordersByRank(q, after, sort):
+            order = [search.postsFts.c.rank] + order
+    elif q:
+        key = f"%{q.lower()}%"
+        stmt = stmt.where(
             (Post.title.ilike(key)) | (Post.body.ilike(key))
         )
 
-    posts = (
-        query.order_by(Post.createdAt.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
+    if after is not None:
+        # 커서 이후 행부터 (createdAt, id) / (hotScore, id) 인덱스를 그대로 읽는다
+        stmt = stmt.where(tuple_(*keys) < tuple_(*after))
+        skip = 0
+
+    return stmt.order_by(*order).offset(skip).limit(limit)
+
+
+def listPosts(
+    db: Session,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+    sort: str = "latest",
+) -> List[Dict[str, Any]]:
+    rows = db.execute(listPostsStmt(skip, limit, q, viewerId, after, summary, sort=sort))
+    return [row_to_dict(r) for r in rows]
+
+
+def lastRowStmt(
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    sort: str = "latest",
+):
+    # 목록 페이지 마지막 행의 정렬 키. 스트리밍 응답은 본문보다 먼저 다음 커서 헤더를 보내야 하므로 따로 조회
+    stmt = listPostsStmt(skip, limit, q, viewerId, after, columns=list(SORT_KEYS[sort]), sort=sort)
+    return stmt.offset((0 if after else skip) + limit - 1).limit(1)
+
+
+def lastRowKey(
+    db: Session,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    sort: str = "latest",
+) -> Optional[Tuple[Any, int]]:
+    row = db.execute(lastRowStmt(skip, limit, q, viewerId, after, sort)).first()
+    return tuple(row) if row else None
+
+
+def iterListPosts(
+    db: Session,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+    batchSize: int = 100,
+    sort: str = "latest",
+) -> Iterator[List[Dict[str, Any]]]:
+    # listPosts 와 같은 결과를 batchSize 행씩 나눠서 돌려준다 (전체 목록을 메모리에 만들지 않음)
+    stmt = listPostsStmt(skip, limit, q, viewerId, after, summary, sort=sort).execution_options(yield_per=batchSize)
+    for part in db.execute(stmt).partitions():
+        yield [row_to_dict(r) for r in part]
+
+
+def listAuthorPostsStmt(
+    authorId: int,
+    limit: int,
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+):
+    # 작성자 한 명의 최신순 글 목록. authorId 등호 + (createdAt, id) 범위라
+    # ix_posts_authorId_createdAt_id 를 앞에서부터 limit 행만 읽는다. 본인이면 검사 상태와 무관하게 전부
+    stmt = select(*(POST_SUMMARY_COLUMNS if summary else POST_COLUMNS)).where(
+        Post.authorId == authorId,
+        visibleTo(viewerId, includeOwnRejected=True),
     )
 
-    return [post_to_dict(p) for p in posts]
+    if after is not None:
+        stmt = stmt.where(tuple_(Post.createdAt, Post.id) < tuple_(*after))
+
+    return stmt.order_by(Post.createdAt.desc(), Post.id.desc()).limit(limit)
+
 
+def listAuthorPosts(
+    db: Session,
+    authorId: int,
+    limit: int,
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+) -> List[Dict[str, Any]]:
+    rows = db.execute(listAuthorPostsStmt(authorId, limit, viewerId, after, summary))
+    return [row_to_dict(r) for r in rows]
 
-def createPost(db: Session, authorId: int, title: str, body: str) -> Dict[str, Any]:
+
+def getAuthorStats(db: Session, authorId: int) -> Dict[str, Any]:
+    # author_stats 트리거가 유지하는 집계 한 행 (글이 없던 작성자는 0)
+    row = db.get(AuthorStats, authorId)
+    return {
+        "authorId": authorId,
+        "postCount": row.postCount if row else 0,
+        "totalViews": row.totalViews if row else 0,
+        "totalLikes": row.totalLikes if row else 0,
+    }
+
+
+def newPost(authorId: int, title: str, body: str, moderation: Optional[Dict[str, Any]] = None) -> Post:
     now = datetime.now(timezone.utc)
-    post = Post(
+    return Post(
         title=title.strip(),
         body=body.strip(),
         authorId=authorId,
@@ -49,28 +235,129 @@ def createPost(db: Session, authorId: int, title: str, body: str) -> Dict[str, A
         views=0,
         likesCount=0,
         commentsCount=0,
+        **(moderation or {}),
     )
+
+
+def applyPostUpdate(post: Post, title: str, body: str, moderation: Optional[Dict[str, Any]] = None):
+    post.title = title.strip()
+    post.body = body.strip()
+    post.updatedAt = datetime.now(timezone.utc)
+    for k, v in (moderation or {}).items():
+        setattr(post, k, v)
+
+
+def incViewStmt(pid: int, viewerId: Optional[int] = None):
+    # 공개되지 않은 글은 작성자 본인이 아니면 대상에서 제외 (조회수도 올리지 않음)
+    return (
+        update(Post)
+        .where(Post.id == pid, visibleTo(viewerId, includeOwnRejected=True))
+        .values(views=func.coalesce(Post.views, 0) + 1)
+        .execution_options(synchronize_session=False)
+    )
+
+
+def getPostStmt(pid: int):
+    return select(*POST_COLUMNS).where(Post.id == pid)
+
+
+def createPost(db: Session, authorId: int, title: str, body: str, moderation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    post = newPost(authorId, title, body, moderation)
     db.add(post)
     db.commit()
+    bumpPostsVersion()
     db.refresh(post)
     return post_to_dict(post)
 
 
 def getPost(db: Session, pid: int) -> Optional[Dict[str, Any]]:
-    post = db.query(Post).filter(Post.id == pid).first()
-    return post_to_dict(post) if post else None
+    row = db.execute(getPostStmt(pid)).first()
+    return row_to_dict(row) if row else None
 
 
-def updatePost(db: Session, pid: int, title: str, body: str) -> Dict[str, Any]:
+def readPostAndIncView(db: Session, pid: int, viewerId: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    # 조회수 증가 + 게시글 조회를 UPDATE ... RETURNING 한 문장으로 처리 (SQLite 3.35+).
+    # RETURNING 을 지원하지 않으면 같은 트랜잭션에서 UPDATE 후 SELECT.
+    stmt = incViewStmt(pid, viewerId)
+
+    if db.get_bind().dialect.update_returning:
+        row = db.execute(stmt.returning(*POST_COLUMNS)).first()
+        db.commit()
+        return row_to_dict(row) if row else None
+
+    if db.execute(stmt).rowcount == 0:
+        db.rollback()
+        return None
+
+    p = getPost(db, pid)
+    db.commit()
+    return p
+
+
+def _withCounters(cached: Dict[str, Any], row) -> Dict[str, Any]:
+    p = dict(cached)
+    p["views"] = row.views or 0
+    p["likesCount"] = row.likesCount or 0
+    p["commentsCount"] = row.commentsCount or 0
+    return p
+
+
+def getPostCached(db: Session, pid: int) -> Optional[Dict[str, Any]]:
+    # read-through: 캐시에 있으면 본문은 다시 읽지 않고 카운터 컬럼만 조회
+    cached = postCache.get(pid)
+
+    if cached is None:
+        version = postsVersion()
+        p = getPost(db, pid)
+        if p:
+            cachePost(p, version)
+        return p
+
+    row = db.execute(select(*POST_COUNTER_COLUMNS).where(Post.id == pid)).first()
+    if not row:
+        invalidatePost(pid)
+        return None
+
+    return _withCounters(cached, row)
+
+
+def readPostAndIncViewCached(db: Session, pid: int, viewerId: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    # 캐시에 있으면 조회수 증가 UPDATE 가 카운터 컬럼만 RETURNING
+    cached = postCache.get(pid)
+
+    if cached is None or not db.get_bind().dialect.update_returning:
+        version = postsVersion()
+        p = readPostAndIncView(db, pid, viewerId)
+        if p:
+            cachePost(p, version)
+        return p
+
+    row = db.execute(incViewStmt(pid, viewerId).returning(*POST_COUNTER_COLUMNS)).first()
+    db.commit()
+    return _withCounters(cached, row) if row else None
+
+
+# 조건부 GET(If-None-Match) 비교용 컬럼. 본문 없이 ETag 에 들어가는 값만 읽는다
+POST_VALIDATOR_COLUMNS = [
+    Post.id, Post.authorId, Post.updatedAt, Post.likesCount, Post.commentsCount, Post.moderationStatus,
+]
+
+
+def getPostValidator(db: Session, pid: int) -> Optional[Dict[str, Any]]:
+    row = db.execute(select(*POST_VALIDATOR_COLUMNS).where(Post.id == pid)).first()
+    return row_to_dict(row) if row else None
+
+
+def updatePost(db: Session, pid: int, title: str, body: str, moderation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     post = db.query(Post).filter(Post.id == pid).first()
     if not post:
         raise KeyError("Post not found")
 
-    post.title = title.strip()
-    post.body = body.strip()
-    post.updatedAt = datetime.now(timezone.utc)
+    applyPostUpdate(post, title, body, moderation)
 
     db.commit()
+    bumpPostsVersion()
+    invalidatePost(pid)
     db.refresh(post)
     return post_to_dict(post)
 
@@ -81,7 +368,11 @@ def deletePost(db: Session, pid: int) -> bool:
         return False
 
     db.delete(post)
+    deleteLikes(db, pid)
+    deleteComments(db, pid)
     db.commit()
+    bumpPostsVersion()
+    invalidatePost(pid)
     return True
 
 
@@ -94,3 +385,76 @@ def incView(db: Session, pid: int) -> int:
     db.commit()
     db.refresh(post)
     return post.views
+
+
+def addViewsStmt():
+    posts = Post.__table__
+    return (
+        update(posts)
+        .where(posts.c.id == bindparam("pid"))
+        .values(views=posts.c.views + bindparam("delta"))
+    )
+
+
+def addViews(db: Session, deltas: Dict[int, int]):
+    # 여러 게시글의 조회수 증가분을 한 트랜잭션에서 executemany 로 반영
+    db.execute(addViewsStmt(), [{"pid": pid, "delta": n} for pid, n in deltas.items()])
+    db.commit()
+
+
+def insertPosts(db: Session, rows: List[Dict[str, Any]]) -> int:
+    # bulk import: 여러 게시글을 한 트랜잭션에서 executemany 로 추가 (ORM 객체 / refresh 없음)
+    if not rows:
+        return 0
+
+    db.execute(Post.__table__.insert(), rows)
+    db.commit()
+    bumpPostsVersion()
+    return len(rows)
+
+
+def iterPosts(db: Session, batchSize: int = 1000) -> Iterator[Dict[str, Any]]:
+    # bulk export: id 순으로 batchSize 행씩 커서에서 꺼내므로 전체를 메모리에 올리지 않는다
+    stmt = select(*POST_COLUMNS).order_by(Post.id).execution_options(yield_per=batchSize)
+    for row in db.execute(stmt):
+        yield row_to_dict(row)
+
+
+def listPendingPosts(db: Session, limit: int) -> List[Dict[str, Any]]:
+    rows = (
+        db.query(Post.id, Post.body, Post.updatedAt)
+        .filter(Post.moderationStatus == "pending")
+        .order_by(Post.id)
+        .limit(limit)
+        .all()
+    )
+    return [{"id": r.id, "body": r.body, "updatedAt": r.updatedAt} for r in rows]
+
+
+def listPostsForModeration(db: Session, afterId: int, limit: int) -> List[Dict[str, Any]]:
+    rows = (
+        db.query(Post.id, Post.body, Post.updatedAt, Post.moderationModel, Post.contentHash)
+        .filter(Post.id > afterId)
+        .order_by(Post.id)
+        .limit(limit)
+        .all()
+    )
+    return [dict(r._mapping) for r in rows]
+
+
+def applyModerationResults(db: Session, results: List[Dict[str, Any]], onlyPending: bool = False) -> int:
+    # results: {"id", "updatedAt", 저장할 moderation 컬럼들...}
+    # 검사 도중 글이 수정되었으면(updatedAt 변경) 판정을 반영하지 않는다
+    updated = 0
+    for r in results:
+        values = {k: v for k, v in r.items() if k not in ("id", "updatedAt")}
+        query = db.query(Post).filter(Post.id == r["id"], Post.updatedAt == r["updatedAt"])
+        if onlyPending:
+            query = query.filter(Post.moderationStatus == "pending")
+        updated += query.update(values, synchronize_session=False)
+    db.commit()
+    if updated:
+        bumpPostsVersion()
+        for r in results:
+            invalidatePost(r["id"])
+    return updated
@@ -0,0 +1,162 @@
+# modelsPostsAsync.py
+# models/posts.py 의 AsyncSession 버전. SQL 문은 models/posts.py 의 빌더를 그대로 사용한다.
+
+from typing import Optional, Dict, Any, List, Tuple, Set, AsyncIterator
+from sqlalchemy import select, delete
+from sqlalchemy.ext.asyncio import AsyncSession
+from db_models import Post, PostLike, Comment
+from models.likes import likedStmt
+from posts_cache import bumpPostsVersion, postsVersion, postCache, cachePost, invalidatePost
+from models.posts import (
+    POST_COLUMNS, POST_COUNTER_COLUMNS, POST_VALIDATOR_COLUMNS, _withCounters, listPostsStmt, lastRowStmt, getPostStmt, incViewStmt,
+    newPost, applyPostUpdate, post_to_dict, row_to_dict,
+)
+
+
+async def likedPostIds(db: AsyncSession, userId: int, pids) -> Set[int]:
+    pids = list(pids)
+    if not pids:
+        return set()
+    return set((await db.execute(likedStmt(userId, pids))).scalars())
+
+
+async def listPosts(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+    sort: str = "latest",
+) -> List[Dict[str, Any]]:
+    rows = await db.execute(listPostsStmt(skip, limit, q, viewerId, after, summary, sort=sort))
+    return [row_to_dict(r) for r in rows]
+
+
+async def lastRowKey(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    sort: str = "latest",
+) -> Optional[Tuple[Any, int]]:
+    row = (await db.execute(lastRowStmt(skip, limit, q, viewerId, after, sort))).first()
+    return tuple(row) if row else None
+
+
+async def iterListPosts(
+    db: AsyncSession,
+    skip: int,
+    limit: int,
+    q: Optional[str],
+    viewerId: Optional[int] = None,
+    after: Optional[Tuple[Any, int]] = None,
+    summary: bool = False,
+    batchSize: int = 100,
+    sort: str = "latest",
+) -> AsyncIterator[List[Dict[str, Any]]]:
+    stmt = listPostsStmt(skip, limit, q, viewerId, after, summary, sort=sort).execution_options(yield_per=batchSize)
+    result = await db.stream(stmt)
+    async for part in result.partitions():
+        yield [row_to_dict(r) for r in part]
+
+
+async def createPost(db: AsyncSession, authorId: int, title: str, body: str, moderation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    post = newPost(authorId, title, body, moderation)
+    db.add(post)
+    await db.commit()
+    bumpPostsVersion()
+    await db.refresh(post)
+    return post_to_dict(post)
+
+
+async def getPost(db: AsyncSession, pid: int) -> Optional[Dict[str, Any]]:
+    row = (await db.execute(getPostStmt(pid))).first()
+    return row_to_dict(row) if row else None
+
+
+async def readPostAndIncView(db: AsyncSession, pid: int, viewerId: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    stmt = incViewStmt(pid, viewerId)
+
+    if db.get_bind().dialect.update_returning:
+        row = (await db.execute(stmt.returning(*POST_COLUMNS))).first()
+        await db.commit()
+        return row_to_dict(row) if row else None
+
+    if (await db.execute(stmt)).rowcount == 0:
+        await db.rollback()
+        return None
+
+    p = await getPost(db, pid)
+    await db.commit()
+    return p
+
+
+async def getPostCached(db: AsyncSession, pid: int) -> Optional[Dict[str, Any]]:
+    cached = postCache.get(pid)
+
+    if cached is None:
+        version = postsVersion()
+        p = await getPost(db, pid)
+        if p:
+            cachePost(p, version)
+        return p
+
+    row = (await db.execute(select(*POST_COUNTER_COLUMNS).where(Post.id == pid))).first()
+    if not row:
+        invalidatePost(pid)
+        return None
+
+    return _withCounters(cached, row)
+
+
+async def readPostAndIncViewCached(db: AsyncSession, pid: int, viewerId: Optional[int] = None) -> Optional[Dict[str, Any]]:
+    cached = postCache.get(pid)
+
+    if cached is None or not db.get_bind().dialect.update_returning:
+        version = postsVersion()
+        p = await readPostAndIncView(db, pid, viewerId)
+        if p:
+            cachePost(p, version)
+        return p
+
+    row = (await db.execute(incViewStmt(pid, viewerId).returning(*POST_COUNTER_COLUMNS))).first()
+    await db.commit()
+    return _withCounters(cached, row) if row else None
+
+
+async def getPostValidator(db: AsyncSession, pid: int) -> Optional[Dict[str, Any]]:
+    row = (await db.execute(select(*POST_VALIDATOR_COLUMNS).where(Post.id == pid))).first()
+    return row_to_dict(row) if row else None
+
+
+async def updatePost(db: AsyncSession, pid: int, title: str, body: str, moderation: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    post = (await db.execute(select(Post).where(Post.id == pid))).scalar_one_or_none()
+    if not post:
+        raise KeyError("Post not found")
+
+    applyPostUpdate(post, title, body, moderation)
+
+    await db.commit()
+    bumpPostsVersion()
+    invalidatePost(pid)
+    await db.refresh(post)
+    return post_to_dict(post)
+
+
+async def deletePost(db: AsyncSession, pid: int) -> bool:
+    post = (await db.execute(select(Post).where(Post.id == pid))).scalar_one_or_none()
+    if not post:
+        return False
+
+    await db.delete(post)
+    await db.execute(delete(PostLike).where(PostLike.postId == pid))
+    await db.execute(delete(Comment).where(Comment.postId == pid))
+    await db.commit()
+    bumpPostsVersion()
+    invalidatePost(pid)
+    return True
+
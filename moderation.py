@@ -0,0 +1,283 @@
+# moderation.py
+
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Tuple
+
+from ai import Verdict, check_toxicity_batch, content_hash, model_id
+from cache import LRUCache
+from inference import executor
+from prefilter import prefilter
+
+# sync: 작성 요청에서 검사 후 저장, async: pending 상태로 저장 후 백그라운드 워커가 검사
+MODE = os.getenv("MODERATION_MODE", "sync")
+BATCH_MAX_SIZE = int(os.getenv("TOXIC_BATCH_MAX_SIZE", "16"))
+BATCH_MAX_WAIT_MS = float(os.getenv("TOXIC_BATCH_MAX_WAIT_MS", "10"))
+MAX_PENDING = int(os.getenv("TOXIC_MAX_PENDING", "256"))
+CACHE_MAX_ENTRIES = int(os.getenv("TOXIC_CACHE_MAX_ENTRIES", "10000"))
+CACHE_MAX_BYTES = int(os.getenv("TOXIC_CACHE_MAX_BYTES", str(4 * 1024 * 1024)))
+CACHE_TTL = float(os.getenv("TOXIC_CACHE_TTL", "0"))
+
+# 캐시 엔트리 하나(키 튜플 + 판정 dict)의 대략적인 메모리 사용량
+_VERDICT_ENTRY_BYTES = 512
+
+
+class ModerationBusy(Exception):
+    pass
+
+
+class ToxicityBatcher:
+    # 동시에 들어온 검사 요청을 짧은 시간 동안 모아서 한 번에 추론.
+    # runner 가 Future 를 반환하면(프로세스 풀) 결과를 기다리지 않고 다음 배치를 모은다.
+    def __init__(
+        self,
+        runner: Callable[[List[str]], List[Verdict] | Future],
+        maxBatchSize: int,
+        maxWaitMs: float,
+        maxPending: int = 0,
+    ):
+        self.runner = runner
+        self.maxBatchSize = max(1, maxBatchSize)
+        self.maxWait = max(0.0, maxWaitMs) / 1000
+        self.maxPending = maxPending
+        self._queue: List[Tuple[str, Future, float]] = []
+        self._outstanding = 0
+        self._cond = threading.Condition()
+        self._thread: threading.Thread | None = None
+        self._counters = {
+            "requests": 0,
+            "rejected": 0,
+            "batches": 0,
+            "items": 0,
+            "maxBatchSize": 0,
+            "errors": 0,
+            "queueWaitMs": 0.0,
+            "inferenceMs": 0.0,
+        }
+
+    def submit(self, text: str) -> Future:
+        fut: Future = Future()
+
+        with self._cond:
+            if self.maxPending and self._outstanding >= self.maxPending:
+                self._counters["rejected"] += 1
+                raise ModerationBusy("moderation queue is full")
+
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, name="toxicity-batcher", daemon=True)
+                self._thread.start()
+
+            self._queue.append((text, fut, time.perf_counter()))
+            self._outstanding += 1
+            self._counters["requests"] += 1
+            self._cond.notify()
+
+        return fut
+
+    def check(self, text: str) -> Verdict:
+        return self.submit(text).result()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            c = dict(self._counters)
+            c["queued"] = len(self._queue)
+            c["outstanding"] = self._outstanding
+
+        batches = c["batches"] or 1
+        items = c["items"] or 1
+        c["avgBatchSize"] = c["items"] / batches
+        c["avgQueueWaitMs"] = c["queueWaitMs"] / items
+        c["avgInferenceMs"] = c["inferenceMs"] / batches
+        c["config"] = {
+            "maxBatchSize": self.maxBatchSize,
+            "maxWaitMs": self.maxWait * 1000,
+            "maxPending": self.maxPending,
+        }
+
+        return c
+
+    def _loop(self):
+        while True:
+            with self._cond:
+                while not self._queue:
+                    self._cond.wait()
+
+                # 첫 요청 기준으로 maxWait 까지, 또는 배치가 가득 찰 때까지 대기
+                deadline = self._queue[0][2] + self.maxWait
+                while len(self._queue) < self.maxBatchSize:
+                    remaining = deadline - time.perf_counter()
+                    if remaining <= 0:
+                        break
+                    self._cond.wait(remaining)
+
+                batch = self._queue[:self.maxBatchSize]
+                del self._queue[:self.maxBatchSize]
+
+            self._dispatch(batch)
+
+    def _dispatch(self, batch: List[Tuple[str, Future, float]]):
+        started = time.perf_counter()
+
+        try:
+            out = self.runner([text for text, _, _ in batch])
+        except Exception as ex:
+            self._complete(batch, started, None, ex)
+            return
+
+        if isinstance(out, Future):
+            out.add_done_callback(lambda f: self._complete(batch, started, *_futureOutcome(f)))
+        else:
+            self._complete(batch, started, out, None)
+
+    def _complete(self, batch, started: float, results, error: BaseException | None):
+        finished = time.perf_counter()
+
+        with self._cond:
+            c = self._counters
+            self._outstanding -= len(batch)
+
+            if error is not None:
+                c["errors"] += 1
+            else:
+                c["batches"] += 1
+                c["items"] += len(batch)
+                c["maxBatchSize"] = max(c["maxBatchSize"], len(batch))
+                c["queueWaitMs"] += sum(started - queuedAt for _, _, queuedAt in batch) * 1000
+                c["inferenceMs"] += (finished - started) * 1000
+
+        if error is not None:
+            for _, fut, _ in batch:
+                fut.set_exception(error)
+            return
+
+        for (_, fut, _), result in zip(batch, results):
+            fut.set_result(result)
+
+
+def _futureOutcome(f: Future):
+    error = f.exception()
+    return (None, error) if error is not None else (f.result(), None)
+
+
+batcher = ToxicityBatcher(
+    executor.submit if executor else check_toxicity_batch,
+    BATCH_MAX_SIZE,
+    BATCH_MAX_WAIT_MS,
+    MAX_PENDING,
+)
+verdictCache = LRUCache(CACHE_MAX_ENTRIES, CACHE_MAX_BYTES, CACHE_TTL)
+
+
+def _cacheKey(text: str) -> Tuple[str, str]:
+    # 모델/임계값이 바뀌면 기존 판정은 자연스럽게 무효화된다
+    return (model_id(), content_hash(text))
+
+
+def _remember(key: Tuple[str, str], result: Verdict):
+    verdictCache.set(key, dict(result), _VERDICT_ENTRY_BYTES + len(str(result.get("label", ""))))
+
+
+def _prefiltered(text: str) -> Verdict | None:
+    # 1차 필터(사전 + 길이 규칙)가 판정한 경우 모델을 건너뛴다.
+    # 일부는 모델로도 검사해서(결과를 기다리지 않음) 1차 필터 일치율을 기록한다.
+    if prefilter is None:
+        return None
+
+    decided = prefilter.decide(text)
+
+    if decided is not None and prefilter.shouldAudit():
+        try:
+            audit = batcher.submit(text)
+        except ModerationBusy:
+            return decided
+        audit.add_done_callback(lambda f: f.exception() is None and prefilter.recordAudit(decided, f.result()))
+
+    return decided
+
+
+def checkText(text: str) -> Verdict:
+    decided = _prefiltered(text)
+    if decided is not None:
+        return decided
+
+    key = _cacheKey(text)
+    cached = verdictCache.get(key)
+
+    if cached is not None:
+        return dict(cached)
+
+    result = batcher.check(text)
+    _remember(key, result)
+
+    return result
+
+
+def checkTexts(texts: List[str]) -> List[Verdict]:
+    # 캐시에 없는 텍스트만 배처에 한꺼번에 넣어서 배치 단위로 추론되게 한다
+    results: List[Verdict | None] = [_prefiltered(text) for text in texts]
+    keys = [_cacheKey(text) for text in texts]
+
+    for i, key in enumerate(keys):
+        if results[i] is None:
+            results[i] = verdictCache.get(key)
+
+    futures = {i: batcher.submit(text) for i, text in enumerate(texts) if results[i] is None}
+
+    for i, fut in futures.items():
+        results[i] = fut.result()
+        _remember(keys[i], results[i])
+
+    return [dict(r) for r in results]
+
+
+async def checkTextAsync(text: str) -> Verdict:
+    # 이벤트 루프나 스레드 풀을 점유하지 않고 판정 결과를 기다린다
+    decided = _prefiltered(text)
+    if decided is not None:
+        return decided
+
+    key = _cacheKey(text)
+    cached = verdictCache.get(key)
+
+    if cached is not None:
+        return dict(cached)
+
+    result = await asyncio.wrap_future(batcher.submit(text))
+    _remember(key, result)
+
+    return result
+
+
+def verdictRecord(text: str, verdict: Verdict) -> Dict[str, Any]:
+    # posts 테이블에 저장하는 판정 결과 컬럼
+    return {
+        "moderationStatus": "rejected" if verdict["isToxic"] else "approved",
+        "moderationLabel": verdict["label"],
+        "moderationScore": verdict["score"],
+        "moderationModel": verdict.get("model") or model_id(),
+        "contentHash": content_hash(text),
+    }
+
+
+def isStale(row: Dict[str, Any]) -> bool:
+    # 현재 모델 또는 현재 사전 버전으로 내린 판정이면 다시 검사할 필요가 없다
+    current = {model_id()}
+    if prefilter:
+        current.add(f"lexicon:{prefilter.version}")
+
+    return row.get("moderationModel") not in current or row.get("contentHash") != content_hash(row.get("body") or "")
+
+
+def moderationStats() -> Dict[str, Any]:
+    stats = {"batcher": batcher.stats(), "cache": verdictCache.stats()}
+
+    if prefilter:
+        stats["prefilter"] = prefilter.stats()
+
+    if executor:
+        stats["workers"] = executor.status()
+
+    return stats
@@ -0,0 +1,92 @@
+# moderation_worker.py
+
+import logging
+import os
+import threading
+from typing import Any, Dict
+
+from database import SessionLocal, ReadSessionLocal
+from models.posts import listPendingPosts, applyModerationResults
+from moderation import checkTexts, verdictRecord
+
+BATCH_SIZE = int(os.getenv("MODERATION_WORKER_BATCH_SIZE", "32"))
+POLL_INTERVAL = float(os.getenv("MODERATION_WORKER_INTERVAL", "2"))
+
+logger = logging.getLogger(__name__)
+
+
+class PendingPostWorker:
+    # pending 상태의 게시글을 배치로 꺼내 검사하고 approved / rejected 로 갱신
+    def __init__(self, batchSize: int, interval: float):
+        self.batchSize = batchSize
+        self.interval = interval
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._counters = {"batches": 0, "checked": 0, "approved": 0, "rejected": 0, "stale": 0, "errors": 0}
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._loop, name="moderation-worker", daemon=True)
+            self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        self._wake.set()
+
+    def notify(self):
+        self._wake.set()
+
+    def stats(self) -> Dict[str, Any]:
+        return dict(self._counters)
+
+    def drain(self) -> int:
+        # wal 프로필의 쓰기 커넥션은 하나뿐이므로 추론하는 동안에는 잡고 있지 않는다.
+        # 대기 글은 읽기 세션으로 읽고, 판정 결과를 반영할 때만 쓰기 세션을 연다
+        # (그 사이 수정된 글은 applyModerationResults 가 updatedAt 비교로 건너뛴다)
+        db = ReadSessionLocal()
+        try:
+            rows = listPendingPosts(db, self.batchSize)
+        finally:
+            db.close()
+
+        if not rows:
+            return 0
+
+        verdicts = checkTexts([r["body"] for r in rows])
+        decisions = [
+            {"id": r["id"], "updatedAt": r["updatedAt"], **verdictRecord(r["body"], v)}
+            for r, v in zip(rows, verdicts)
+        ]
+
+        db = SessionLocal()
+        try:
+            applied = applyModerationResults(db, decisions, onlyPending=True)
+        finally:
+            db.close()
+
+        rejected = sum(d["moderationStatus"] == "rejected" for d in decisions)
+        c = self._counters
+        c["batches"] += 1
+        c["checked"] += len(rows)
+        c["rejected"] += rejected
+        c["approved"] += len(rows) - rejected
+        c["stale"] += len(rows) - applied
+
+        return len(rows)
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                processed = self.drain()
+            except Exception:
+                logger.exception("moderation worker failed")
+                self._counters["errors"] += 1
+                processed = 0
+
+            if processed < self.batchSize:
+                self._wake.wait(self.interval)
+                self._wake.clear()
+
+
+worker = PendingPostWorker(BATCH_SIZE, POLL_INTERVAL)
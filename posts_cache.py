@@ -0,0 +1,62 @@
+# posts_cache.py
+
+import os
+import threading
+from typing import Any, Dict, Optional, Tuple
+
+from cache import LRUCache
+
+# GET /posts 응답(JSON bytes) 캐시. 글 작성/수정/삭제/검사 결과 반영 시 버전이 올라가
+# 이전 버전의 엔트리는 더 이상 조회되지 않고 LRU 로 밀려난다.
+# 조회수/좋아요/댓글 수는 버전을 올리지 않으므로 최대 TTL 만큼 늦게 반영된다.
+LIST_CACHE_MAX_ENTRIES = int(os.getenv("POSTS_LIST_CACHE_MAX_ENTRIES", "256"))
+LIST_CACHE_MAX_BYTES = int(os.getenv("POSTS_LIST_CACHE_MAX_BYTES", str(8 * 1024 * 1024)))
+LIST_CACHE_TTL = float(os.getenv("POSTS_LIST_CACHE_TTL", "5"))
+
+# GET /posts/{id} 용 게시글 캐시. 조회수/좋아요/댓글 수를 뺀 본문 부분만 보관하고,
+# 카운터는 매 요청 DB(+ 조회수 버퍼)에서 읽어 덮어쓴다. 수정/삭제/검사 결과 반영 시 해당 id 를 제거
+POST_CACHE_MAX_ENTRIES = int(os.getenv("POST_CACHE_MAX_ENTRIES", "2048"))
+POST_CACHE_MAX_BYTES = int(os.getenv("POST_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+POST_CACHE_TTL = float(os.getenv("POST_CACHE_TTL", "60"))
+POST_COUNTER_FIELDS = ("views", "likesCount", "commentsCount")
+_POST_ENTRY_BYTES = 256  # 본문 외 필드 / dict 오버헤드 근사치
+
+listCache = LRUCache(LIST_CACHE_MAX_ENTRIES, LIST_CACHE_MAX_BYTES, LIST_CACHE_TTL)
+postCache = LRUCache(POST_CACHE_MAX_ENTRIES, POST_CACHE_MAX_BYTES, POST_CACHE_TTL)
+
+_version = 0
+_versionLock = threading.Lock()
+
+
+def postsVersion() -> int:
+    return _version
+
+
+def bumpPostsVersion():
+    # 목록에 보이는 내용(글 추가/삭제, 제목·본문, 공개 여부)이 바뀐 뒤 commit 이후에 호출
+    global _version
+    with _versionLock:
+        _version += 1
+
+
+def cachePost(p: Dict[str, Any], version: int):
+    # version: 게시글을 읽기 전에 postsVersion() 으로 받아둔 값.
+    # 읽는 도중 수정/삭제가 commit 되었으면 옛 내용일 수 있으므로 저장하지 않는다
+    if version != postsVersion():
+        return
+
+    entry = {k: v for k, v in p.items() if k not in POST_COUNTER_FIELDS}
+    postCache.set(p["id"], entry, _POST_ENTRY_BYTES + len(p["title"]) + len(p["body"].encode()))
+
+
+def invalidatePost(pid: int):
+    postCache.pop(pid)
+
+
+def listCacheKey(skip: int, limit: int, q: Optional[str], cursor: Optional[str], view: str = "full", sort: str = "latest") -> Tuple:
+    # 요청 시작 시점의 버전을 키에 포함. 조회 도중 버전이 바뀌면 그 결과는 옛 버전 키로 저장되어 쓰이지 않는다
+    return (postsVersion(), view, sort, 0 if cursor else skip, limit, (q or "").strip(), cursor or "")
+
+
+def cacheStats() -> Dict[str, Any]:
+    return {"version": postsVersion(), "list": listCache.stats(), "post": postCache.stats()}
@@ -0,0 +1,159 @@
+# prefilter.py
+
+import hashlib
+import os
+import random
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from ai import Verdict
+
+ENABLED = os.getenv("TOXIC_PREFILTER", "1") != "0"
+LEXICON_PATH = os.getenv("TOXIC_LEXICON_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "lexicon.txt"))
+# 짧은 텍스트가 이 목록의 단어로만 이루어져 있으면 모델 없이 통과 (짧다는 것만으로는 통과시키지 않음)
+ALLOWLIST_PATH = os.getenv("TOXIC_ALLOWLIST_PATH", os.path.join(os.path.dirname(os.path.abspath(__file__)), "allowlist.txt"))
+# 위 목록 통과 규칙을 적용하는 최대 단어 수 / 글자 수
+SHORT_MAX_WORDS = int(os.getenv("TOXIC_PREFILTER_SHORT_MAX_WORDS", "2"))
+SHORT_MAX_CHARS = int(os.getenv("TOXIC_PREFILTER_SHORT_MAX_CHARS", "20"))
+# 1차 필터가 결정한 텍스트 중 모델로도 검사해서 일치율을 측정할 비율
+AUDIT_RATE = float(os.getenv("TOXIC_PREFILTER_AUDIT_RATE", "0.05"))
+
+
+def loadLexicon(path: str) -> List[str]:
+    try:
+        with open(path, encoding="utf-8") as f:
+            terms = [line.strip().lower() for line in f]
+    except FileNotFoundError:
+        return []
+
+    return sorted({t for t in terms if t and not t.startswith("#")}, key=len, reverse=True)
+
+
+# 한글 표현 뒤에 붙어도 같은 표현으로 보는 조사 / 어미. 이 외의 글자가 이어지면
+# ("시발점", "시발역" 처럼) 다른 단어일 수 있으므로 1차 필터에서 판정하지 않고 모델로 넘긴다
+KOREAN_SUFFIXES = [
+    "아", "야", "이", "가", "은", "는", "을", "를", "도", "들", "라", "이다", "이네",
+    "놈", "놈아", "년", "새끼", "같은", "같이", "같네", "같다", "하네", "짓",
+]
+
+
+def compileLexicon(terms: List[str]) -> Optional["re.Pattern[str]"]:
+    # 여러 표현을 하나의 정규식으로 묶어 텍스트를 한 번만 훑는다.
+    # 바로 유해 판정하므로 오탐이 없도록 단어 전체로만 매칭한다.
+    # 영문은 활용형(fucked, retarded, shitty 등)을 사전에 그대로 나열하고 단어 경계로 매칭
+    # ("retardant", "retardation" 은 모델로), 한글은 단어 전체 또는 단어 + KOREAN_SUFFIXES 로 매칭.
+    if not terms:
+        return None
+
+    ascii_ = [re.escape(t) for t in terms if t.isascii()]
+    other = [re.escape(t) for t in terms if not t.isascii()]
+    parts = []
+
+    if ascii_:
+        parts.append(r"\b(?:" + "|".join(ascii_) + r")\b")
+    if other:
+        suffixes = "|".join(re.escape(x) for x in sorted(KOREAN_SUFFIXES, key=len, reverse=True))
+        parts.append(r"(?<![가-힣])(?:" + "|".join(other) + r")(?:" + suffixes + r")?(?![가-힣])")
+
+    return re.compile("|".join(parts), re.IGNORECASE)
+
+
+_wordRe = re.compile(r"\w+")
+
+
+class LexicalPrefilter:
+    def __init__(self, terms: List[str], shortMaxWords: int, shortMaxChars: int, auditRate: float, allowed: Optional[List[str]] = None):
+        self.pattern = compileLexicon(terms)
+        self.allowed = frozenset(allowed or [])
+        self.version = hashlib.sha256("\n".join(terms + ["#allow"] + sorted(self.allowed)).encode("utf-8")).hexdigest()[:12]
+        self.shortMaxWords = shortMaxWords
+        self.shortMaxChars = shortMaxChars
+        self.auditRate = auditRate
+        self._lock = threading.Lock()
+        self._counters = {
+            "checked": 0,
+            "lexiconToxic": 0,
+            "shortBenign": 0,
+            "passedToModel": 0,
+            "audited": 0,
+            "auditAgreed": 0,
+            "auditMissedToxic": 0,
+            "auditFalseToxic": 0,
+        }
+
+    def decide(self, text: str) -> Optional[Verdict]:
+        # 명확한 경우만 판정하고, 애매하면 None 을 반환해서 모델로 넘긴다
+        text = (text or "").strip()
+        decided = None
+
+        m = self.pattern.search(text) if self.pattern else None
+        if m:
+            decided = self._verdict(True, m.start())
+        elif self._isShortAllowed(text):
+            decided = self._verdict(False, 0)
+
+        with self._lock:
+            self._counters["checked"] += 1
+            if decided is None:
+                self._counters["passedToModel"] += 1
+            elif decided["isToxic"]:
+                self._counters["lexiconToxic"] += 1
+            else:
+                self._counters["shortBenign"] += 1
+
+        return decided
+
+    def _isShortAllowed(self, text: str) -> bool:
+        # "kill yourself" 처럼 사전에 없는 짧은 유해 표현이 있으므로, 허용 목록 단어로만 된 짧은 텍스트만 통과
+        if len(text) > self.shortMaxChars or len(text.split()) > self.shortMaxWords:
+            return False
+
+        words = _wordRe.findall(text.lower())
+        return bool(words) and all(w in self.allowed for w in words)
+
+    def shouldAudit(self) -> bool:
+        return self.auditRate > 0 and random.random() < self.auditRate
+
+    def recordAudit(self, decided: Verdict, modelVerdict: Verdict):
+        with self._lock:
+            self._counters["audited"] += 1
+            if decided["isToxic"] == modelVerdict["isToxic"]:
+                self._counters["auditAgreed"] += 1
+            elif modelVerdict["isToxic"]:
+                self._counters["auditMissedToxic"] += 1
+            else:
+                self._counters["auditFalseToxic"] += 1
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            c = dict(self._counters)
+
+        checked = c["checked"] or 1
+        c["lexiconToxicRate"] = c["lexiconToxic"] / checked
+        c["shortBenignRate"] = c["shortBenign"] / checked
+        c["modelRate"] = c["passedToModel"] / checked
+        c["auditAgreement"] = c["auditAgreed"] / c["audited"] if c["audited"] else None
+        c["config"] = {
+            "lexiconVersion": self.version,
+            "shortMaxWords": self.shortMaxWords,
+            "shortMaxChars": self.shortMaxChars,
+            "auditRate": self.auditRate,
+        }
+
+        return c
+
+    def _verdict(self, isToxic: bool, offset: int) -> Verdict:
+        return {
+            "label": "toxic" if isToxic else "non_toxic",
+            "score": 1.0 if isToxic else 0.0,
+            "isToxic": isToxic,
+            "offset": offset,
+            "model": f"lexicon:{self.version}",
+        }
+
+
+prefilter = (
+    LexicalPrefilter(loadLexicon(LEXICON_PATH), SHORT_MAX_WORDS, SHORT_MAX_CHARS, AUDIT_RATE, loadLexicon(ALLOWLIST_PATH))
+    if ENABLED else None
+)
@@ -1,57 +1,100 @@
 # routersPosts.py
 
-from fastapi import APIRouter, Depends, status, UploadFile, File, HTTPException, Query
+from fastapi import APIRouter, Depends, UploadFile, File, Query, Response, Header
 from fastapi.responses import StreamingResponse
-import io, mimetypes, storage
-from deps import getCurrentUser
-from schemas import PostCreate, PostOut, CommentCreate, CommentOut
-from controllers.posts import ctrlListPosts, ctrlCreatePost, ctrlGetPost, ctrlUpdatePost, ctrlDeletePost
-from storage import likes, comments, postImages
-from typing import Optional, List
-from datetime import datetime, timezone
-from utils import notFound, forbidden
+from fastapi.concurrency import run_in_threadpool
+import mimetypes
+from deps import getCurrentUser, getOptionalUser
+from schemas import PostCreate, PostOut, PostSummaryOut, CommentCreate, CommentOut
+from controllers.posts import shouldStream, ctrlStreamPosts, ctrlListPostsJson, ctrlCreatePost, ctrlGetPost, ctrlUpdatePost, ctrlDeletePost, ctrlCheckToxicity, ctrlToggleLike, ctrlPostNotModified, postEtag, ctrlRequirePostOwner
+from controllers.comments import ctrlListComments, ctrlCreateComment, ctrlUpdateComment, ctrlDeleteComment
+from storage import postImages
+from typing import Optional, List, Literal, Union
+from utils import notFound, jsonResponse, etagForBytes, etagMatches, notModified
 from sqlalchemy.orm import Session
-from database import get_db
+from database import get_db, get_read_db
+from counters import viewCounter
 
 router = APIRouter(prefix="/posts", tags=["posts"])
 
-@router.get("", response_model = List[PostOut])
+# 조회수를 메모리에 모으는 경우 상세 조회도 DB 에 쓰지 않으므로 읽기 전용 세션 사용
+get_post_db = get_read_db if viewCounter else get_db
+
+@router.get("", response_model = List[Union[PostOut, PostSummaryOut]])
 def listPosts(
     skip: int = Query(0, ge=0),
     limit: int = Query(20, ge=1, le=1000),
     q: Optional[str] = None,
-    db: Session = Depends(get_db),
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    sort: Literal["latest", "hot"] = "latest",
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
+    viewer = Depends(getOptionalUser),
+    db: Session = Depends(get_read_db),
 ):
-    return ctrlListPosts(db, skip, limit, q)
+    viewerId = viewer["id"] if viewer else None
+
+    if shouldStream(limit):
+        # 큰 페이지는 읽는 대로 직렬화해서 스트리밍 (캐시하지 않음).
+        # 본문을 다 만들기 전에 헤더를 보내므로 ETag / 304 는 지원하지 않는다
+        stream, nextCursor = ctrlStreamPosts(skip, limit, q, viewerId, cursor, view, sort)
+        return StreamingResponse(
+            stream,
+            media_type = "application/json",
+            headers = {"X-Next-Cursor": nextCursor} if nextCursor else None,
+        )
+
+    body, nextCursor, etag = ctrlListPostsJson(db, skip, limit, q, viewerId, cursor, view, sort)
+    headers = {"X-Next-Cursor": nextCursor} if nextCursor else {}
+
+    # 캐시 적중 시 SQL / 직렬화 없이 ETag 만 비교해서 304
+    if etagMatches(ifNoneMatch, etag):
+        return notModified(etag, headers)
+
+    # 직렬화된 bytes 를 그대로 응답 (캐시 적중 시 SQL / Pydantic 모두 생략)
+    return Response(content = body, media_type = "application/json", headers = {"ETag": etag, **headers})
 
 @router.post("", response_model = PostOut)
-def createPost(p: PostCreate, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
-    return ctrlCreatePost(db, current["id"], p.title, p.body)
+async def createPost(p: PostCreate, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    verdict = await ctrlCheckToxicity(p.body)
+
+    return await run_in_threadpool(ctrlCreatePost, db, current["id"], p.title, p.body, verdict)
 
 @router.get("/{postId}", response_model = PostOut)
-def getPost(postId: int, db: Session = Depends(get_db)):
-    return ctrlGetPost(db, postId)
+def getPost(
+    postId: int,
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
+    viewer = Depends(getOptionalUser),
+    db: Session = Depends(get_post_db),
+):
+    viewerId = viewer["id"] if viewer else None
+    etag = ctrlPostNotModified(db, postId, viewerId, ifNoneMatch)
+
+    if etag:
+        return notModified(etag)
+
+    # 모델이 PostOut 컬럼만 돌려주므로 response_model 재검증 없이 바로 직렬화
+    p = ctrlGetPost(db, postId, viewerId)
+
+    return jsonResponse(p, headers = {"ETag": postEtag(p)})
 
 @router.put("/{postId}", response_model = PostOut)
-def updatePost(postId: int, p: PostCreate, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
-    return ctrlUpdatePost(db, postId, current["id"], p.title, p.body)
+async def updatePost(
+    postId: int,
+    p: PostCreate,
+    current = Depends(getCurrentUser),
+    db: Session = Depends(get_db),
+    readDb: Session = Depends(get_read_db),
+):
+    # 모델 추론 전에 존재 / 권한부터 확인 (쓰기 커넥션을 추론 동안 잡지 않도록 읽기 세션으로)
+    await run_in_threadpool(ctrlRequirePostOwner, readDb, postId, current["id"], "수정")
+    verdict = await ctrlCheckToxicity(p.body)
+
+    return await run_in_threadpool(ctrlUpdatePost, db, postId, current["id"], p.title, p.body, verdict)
 
 @router.post("/{postId}/like")
-def toggleLike(postId: int, current = Depends(getCurrentUser)):
-    p = ctrlGetPost(postId)
-    uid = current["id"]
-    s = likes.setdefault(postId, set())
-    
-    if uid in s:
-        s.remove(uid)
-        p["likesCount"] = max(0, p.get("likesCount", 0) - 1)
-        liked = False
-    else:
-        s.add(uid)
-        p["likesCount"] = p.get("likesCount", 0) + 1
-        liked = True
-    
-    return {"liked": liked, "likesCount": p["likesCount"]}
+def toggleLike(postId: int, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    return ctrlToggleLike(db, postId, current["id"])
 
 @router.delete("/{postId}")
 def deletePost(postId: int, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
@@ -59,96 +102,60 @@ def deletePost(postId: int, current = Depends(getCurrentUser), db: Session = Dep
     return {"ok": True}
 
 @router.get("/{postId}/comments", response_model = List[CommentOut])
-def listComments(postId: int):
-    ctrlGetPost(postId)
-    data = list(comments.get(postId, {}).values())
-    data.sort(key = lambda x: x["createdAt"])
+def listComments(
+    postId: int,
+    response: Response,
+    limit: int = Query(50, ge=1, le=500),
+    cursor: Optional[str] = None,
+    viewer = Depends(getOptionalUser),
+    db: Session = Depends(get_read_db),
+):
+    data, nextCursor = ctrlListComments(db, postId, limit, cursor, viewer["id"] if viewer else None)
+
+    if nextCursor:
+        response.headers["X-Next-Cursor"] = nextCursor
 
     return data
 
 @router.post("/{postId}/comments", response_model = CommentOut)
-def createComment(postId: int, c: CommentCreate, current = Depends(getCurrentUser)):
-    p = ctrlGetPost(postId)
-    storage.commentSeq += 1
-    cid = storage.commentSeq
-    now = datetime.now(timezone.utc)
-    item = {
-        "id": cid,
-        "postId": postId,
-        "authorId": current["id"],
-        "text": c.text.strip(),
-        "createdAt": now,
-        "updatedAt": now,
-    }
-    comments.setdefault(postId, {})[cid] = item
-    p["commentsCount"] = p.get("commentsCount", 0) + 1
-
-    return item
+def createComment(postId: int, c: CommentCreate, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    return ctrlCreateComment(db, postId, current["id"], c.text)
 
 @router.put("/{postId}/comments/{commentId}", response_model = CommentOut)
-def updateComment(postId: int, commentId: int, c: CommentCreate, current = Depends(getCurrentUser)):
-    ctrlGetPost(postId)
-    postComments = comments.get(postId, {})
-    item = postComments.get(commentId)
-    
-    if not item:
-        notFound("댓글을 찾을 수 없습니다.")
-    
-    if item["authorId"] != current["id"]:
-        forbidden("수정 권한이 없습니다.")
-    
-    item["text"] = c.text.strip()
-    item["updatedAt"] = datetime.now(timezone.utc)
-    
-    return item
+def updateComment(postId: int, commentId: int, c: CommentCreate, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    return ctrlUpdateComment(db, postId, commentId, current["id"], c.text)
 
 @router.delete("/{postId}/comments/{commentId}")
-def deleteComment(postId: int, commentId: int, current = Depends(getCurrentUser)):
-    p = ctrlGetPost(postId)
-    postComments = comments.get(postId, {})
-    item = postComments.get(commentId)
-
-    if not item:
-        notFound("댓글을 찾을 수 없습니다.")
-    
-    if item["authorId"] != current["id"]:
-        forbidden("삭제 권한이 없습니다.")
-    
-    del postComments[commentId]
-    p["commentsCount"] = max(0, p.get("commentsCount", 0) - 1)
-    
+def deleteComment(postId: int, commentId: int, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    ctrlDeleteComment(db, postId, commentId, current["id"])
     return {"ok": True}
 
 @router.post("/{postId}/image")
-def uploadPostImage(postId: int, file: UploadFile = File(...), current = Depends(getCurrentUser)):
-    p = ctrlGetPost(postId)
-
-    if p["authorId"] != current["id"]:
-        forbidden("권한이 없습니다.")
-    
+def uploadPostImage(postId: int, file: UploadFile = File(...), current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    ctrlRequirePostOwner(db, postId, current["id"], "이미지 업로드")
     content = file.file.read()
-    postImages[postId] = {"filename": file.filename, "bytes": content}
+    # 조건부 GET 비교용 ETag 는 업로드 시 한 번만 계산
+    postImages[postId] = {"filename": file.filename, "bytes": content, "etag": etagForBytes(content)}
 
     return {"ok": True, "filename": file.filename}
 
 @router.get("/{postId}/image")
-def getPostImage(postId: int):
+def getPostImage(postId: int, ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match")):
     item = postImages.get(postId)
     
     if not item:
         notFound("이미지가 없습니다.")
+
+    if etagMatches(ifNoneMatch, item["etag"]):
+        return notModified(item["etag"])
     
     mime, _ = mimetypes.guess_type(item["filename"])
     
-    return StreamingResponse(io.BytesIO(item["bytes"]), media_type = mime or "application/octet-stream")
+    return Response(content = item["bytes"], media_type = mime or "application/octet-stream", headers = {"ETag": item["etag"]})
 
 @router.delete("/{postId}/image")
-def deletePostImage(postId: int, current = Depends(getCurrentUser)):
-    p = ctrlGetPost(postId)
-    
-    if p["authorId"] != current["id"]:
-        forbidden("권한이 없습니다.")
-    
+def deletePostImage(postId: int, current = Depends(getCurrentUser), db: Session = Depends(get_db)):
+    ctrlRequirePostOwner(db, postId, current["id"], "이미지 삭제")
     postImages.pop(postId, None)
     
-    return {"ok": True}
\ No newline at end of file
+    return {"ok": True}
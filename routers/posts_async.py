@@ -0,0 +1,95 @@
+# routersPostsAsync.py
+# DB_MODE=async 일 때 main.py 가 routers/posts.py 보다 먼저 등록한다.
+# 목록/작성/상세/수정/삭제만 여기서 처리하고 나머지 경로는 기존 라우터로 넘어간다.
+
+from fastapi import APIRouter, Depends, Query, Response, Header
+from fastapi.responses import StreamingResponse
+from deps import getCurrentUser, getOptionalUser
+from schemas import PostCreate, PostOut, PostSummaryOut
+from controllers.posts import ctrlCheckToxicity, shouldStream, postEtag
+from controllers.posts_async import ctrlStreamPosts, ctrlListPostsJson, ctrlCreatePost, ctrlGetPost, ctrlUpdatePost, ctrlDeletePost, ctrlPostNotModified, ctrlRequirePostOwner
+from typing import Optional, List, Literal, Union
+from utils import jsonResponse, etagMatches, notModified
+from sqlalchemy.ext.asyncio import AsyncSession
+from database import get_async_db, get_async_read_db
+from counters import viewCounter
+
+router = APIRouter(prefix="/posts", tags=["posts"])
+
+get_post_db = get_async_read_db if viewCounter else get_async_db
+
+@router.get("", response_model = List[Union[PostOut, PostSummaryOut]])
+async def listPosts(
+    skip: int = Query(0, ge=0),
+    limit: int = Query(20, ge=1, le=1000),
+    q: Optional[str] = None,
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    sort: Literal["latest", "hot"] = "latest",
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
+    viewer = Depends(getOptionalUser),
+    db: AsyncSession = Depends(get_async_read_db),
+):
+    viewerId = viewer["id"] if viewer else None
+
+    if shouldStream(limit):
+        # 큰 페이지는 읽는 대로 직렬화해서 스트리밍 (캐시하지 않음).
+        # 본문을 다 만들기 전에 헤더를 보내므로 ETag / 304 는 지원하지 않는다
+        stream, nextCursor = await ctrlStreamPosts(skip, limit, q, viewerId, cursor, view, sort)
+        return StreamingResponse(
+            stream,
+            media_type = "application/json",
+            headers = {"X-Next-Cursor": nextCursor} if nextCursor else None,
+        )
+
+    body, nextCursor, etag = await ctrlListPostsJson(db, skip, limit, q, viewerId, cursor, view, sort)
+    headers = {"X-Next-Cursor": nextCursor} if nextCursor else {}
+
+    # 캐시 적중 시 SQL / 직렬화 없이 ETag 만 비교해서 304
+    if etagMatches(ifNoneMatch, etag):
+        return notModified(etag, headers)
+
+    # 직렬화된 bytes 를 그대로 응답 (캐시 적중 시 SQL / Pydantic 모두 생략)
+    return Response(content = body, media_type = "application/json", headers = {"ETag": etag, **headers})
+
+@router.post("", response_model = PostOut)
+async def createPost(p: PostCreate, current = Depends(getCurrentUser), db: AsyncSession = Depends(get_async_db)):
+    verdict = await ctrlCheckToxicity(p.body)
+
+    return await ctrlCreatePost(db, current["id"], p.title, p.body, verdict)
+
+@router.get("/{postId}", response_model = PostOut)
+async def getPost(
+    postId: int,
+    ifNoneMatch: Optional[str] = Header(default=None, alias="If-None-Match"),
+    viewer = Depends(getOptionalUser),
+    db: AsyncSession = Depends(get_post_db),
+):
+    viewerId = viewer["id"] if viewer else None
+    etag = await ctrlPostNotModified(db, postId, viewerId, ifNoneMatch)
+
+    if etag:
+        return notModified(etag)
+
+    p = await ctrlGetPost(db, postId, viewerId)
+
+    return jsonResponse(p, headers = {"ETag": postEtag(p)})
+
+@router.put("/{postId}", response_model = PostOut)
+async def updatePost(
+    postId: int,
+    p: PostCreate,
+    current = Depends(getCurrentUser),
+    db: AsyncSession = Depends(get_async_db),
+    readDb: AsyncSession = Depends(get_async_read_db),
+):
+    # 모델 추론 전에 존재 / 권한부터 확인 (쓰기 커넥션을 추론 동안 잡지 않도록 읽기 세션으로)
+    await ctrlRequirePostOwner(readDb, postId, current["id"], "수정")
+    verdict = await ctrlCheckToxicity(p.body)
+
+    return await ctrlUpdatePost(db, postId, current["id"], p.title, p.body, verdict)
+
+@router.delete("/{postId}")
+async def deletePost(postId: int, current = Depends(getCurrentUser), db: AsyncSession = Depends(get_async_db)):
+    await ctrlDeletePost(db, postId, current["id"])
+    return {"ok": True}
@@ -0,0 +1,32 @@
+# routersUsers.py
+
+from fastapi import APIRouter, Depends, Query, Response
+from deps import getOptionalUser
+from schemas import PostOut, PostSummaryOut, AuthorStatsOut
+from controllers.users import ctrlListUserPosts, ctrlGetUserStats
+from typing import Optional, List, Literal, Union
+from sqlalchemy.orm import Session
+from database import get_read_db
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+@router.get("/{userId}/posts", response_model = List[Union[PostOut, PostSummaryOut]])
+def listUserPosts(
+    userId: int,
+    response: Response,
+    limit: int = Query(20, ge=1, le=100),
+    cursor: Optional[str] = None,
+    view: Literal["full", "summary"] = "full",
+    viewer = Depends(getOptionalUser),
+    db: Session = Depends(get_read_db),
+):
+    data, nextCursor = ctrlListUserPosts(db, userId, limit, cursor, viewer["id"] if viewer else None, view)
+
+    if nextCursor:
+        response.headers["X-Next-Cursor"] = nextCursor
+
+    return data
+
+@router.get("/{userId}/stats", response_model = AuthorStatsOut)
+def getUserStats(userId: int, db: Session = Depends(get_read_db)):
+    return ctrlGetUserStats(db, userId)
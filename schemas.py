@@ -36,6 +36,29 @@ class PostOut(BaseModel):
     views: int = 0
     likesCount: int = 0
     commentsCount: int = 0
+    moderationStatus: str = "approved"
+    liked: bool = False  # 요청자의 좋아요 여부 (로그인한 경우에만 채움)
+
+class PostSummaryOut(BaseModel):
+    # GET /posts?view=summary: body 대신 서버에서 자른 excerpt
+    id: int
+    title: str
+    excerpt: str
+    authorId: int
+    createdAt: datetime
+    updatedAt: datetime
+    views: int = 0
+    likesCount: int = 0
+    commentsCount: int = 0
+    moderationStatus: str = "approved"
+    liked: bool = False
+
+class AuthorStatsOut(BaseModel):
+    # GET /users/{userId}/stats: 공개된 글 기준 집계 (author_stats)
+    authorId: int
+    postCount: int = 0
+    totalViews: int = 0
+    totalLikes: int = 0
 
 class CommentCreate(BaseModel):
     text: str = Field(min_length = 1, max_length = 1000)
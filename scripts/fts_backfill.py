@@ -0,0 +1,35 @@
+# scripts/fts_backfill.py
+#
+# 게시글 검색용 FTS5 인덱스(posts_fts)를 만들고 기존 게시글 전체를 다시 색인한다.
+#   python scripts/fts_backfill.py
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_models
+from database import engine, migrate
+from search import rebuildFts, setupFts
+
+
+def main():
+    migrate()
+
+    if not setupFts(engine):
+        print("FTS5 (trigram tokenizer) is not available in this SQLite build; search uses LIKE.")
+        sys.exit(1)
+
+    started = time.perf_counter()
+    rebuildFts(engine)
+
+    with engine.connect() as conn:
+        count = conn.exec_driver_sql("SELECT count(*) FROM posts").scalar()
+
+    elapsed = time.perf_counter() - started
+    print(f"indexed {count} posts in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
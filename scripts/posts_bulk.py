@@ -0,0 +1,188 @@
+# scripts/posts_bulk.py
+#
+# NDJSON(한 줄에 게시글 하나) 게시글 일괄 가져오기 / 내보내기.
+#
+#   python scripts/posts_bulk.py import posts.ndjson --author-id 1 [--batch 500] [--moderation batch|pending]
+#   python scripts/posts_bulk.py export posts.ndjson [--batch 1000]
+#
+# import: 각 줄을 PostCreate 로 검증하고, batch 단위로 유해성 검사 후 한 트랜잭션에서 executemany 로 저장.
+#   줄마다 authorId / createdAt 이 있으면 그대로 쓰고, 없으면 --author-id / 현재 시각.
+#   유해 판정된 글도 rejected 상태로 저장된다. --moderation pending 이면 검사하지 않고 pending 으로 저장한다 (서버의 MODERATION_MODE=async 워커가 검사).
+# export: id 순으로 커서에서 batch 행씩 꺼내 바로 쓰므로 메모리 사용량이 게시글 수와 무관하다.
+# 파일 경로 대신 - 를 주면 stdin / stdout 을 사용하고, 진행 상황은 stderr 로 출력한다.
+
+import argparse
+import json
+import os
+import sys
+import time
+from datetime import datetime, timezone
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pydantic import ValidationError
+
+import db_models
+from database import SessionLocal, engine, migrate
+from models.posts import insertPosts, iterPosts
+from schemas import PostCreate
+from search import setupFts
+from trending import setupHotScore
+from author_stats import setupAuthorStats
+from utils import dumpJson
+
+
+def log(message: str):
+    print(message, file=sys.stderr, flush=True)
+
+
+def openInput(path: str):
+    return sys.stdin if path == "-" else open(path, encoding="utf-8")
+
+
+def openOutput(path: str):
+    return sys.stdout.buffer if path == "-" else open(path, "wb")
+
+
+def parseTime(value: str) -> datetime:
+    # SQLite 는 시간대 없이 저장하므로 UTC 로 맞춘 뒤 tzinfo 를 뗀다 (시간대가 없는 값은 UTC 로 간주)
+    t = datetime.fromisoformat(value)
+    if t.tzinfo is None:
+        return t
+    return t.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def toRow(line: str, authorId: int | None) -> dict:
+    item = json.loads(line)
+    if not isinstance(item, dict):
+        raise ValueError(f"게시글은 JSON 객체여야 합니다 ({type(item).__name__})")
+
+    post = PostCreate(title=item.get("title"), body=item.get("body"))
+    author = item.get("authorId", authorId)
+    if author is None:
+        raise ValueError("authorId 가 없습니다 (--author-id 지정)")
+
+    createdAt = parseTime(item["createdAt"]) if item.get("createdAt") else datetime.now(timezone.utc).replace(tzinfo=None)
+    updatedAt = parseTime(item["updatedAt"]) if item.get("updatedAt") else createdAt
+
+    return {
+        "title": post.title.strip(), "body": post.body.strip(), "authorId": int(author),
+        "createdAt": createdAt, "updatedAt": updatedAt,
+        "views": 0, "likesCount": 0, "commentsCount": 0,
+    }
+
+
+def moderate(rows: list, mode: str, chunk: int):
+    if mode == "pending":
+        for r in rows:
+            r["moderationStatus"] = "pending"
+        return
+
+    # 배처의 대기열 한도(TOXIC_MAX_PENDING)를 넘지 않도록 나눠서 넣는다
+    from moderation import MAX_PENDING, checkTexts, verdictRecord
+
+    size = min(chunk, MAX_PENDING) if MAX_PENDING else chunk
+    for i in range(0, len(rows), size):
+        part = rows[i:i + size]
+        for r, v in zip(part, checkTexts([r["body"] for r in part])):
+            r.update(verdictRecord(r["body"], v))
+
+
+def runImport(args):
+    db = SessionLocal()
+    started = time.perf_counter()
+    imported = rejected = invalid = 0
+    batch = []
+
+    def flush():
+        nonlocal imported, rejected
+        moderate(batch, args.moderation, args.moderation_batch)
+        rejected += sum(1 for r in batch if r.get("moderationStatus") == "rejected")
+        imported += insertPosts(db, batch)
+        batch.clear()
+        elapsed = time.perf_counter() - started
+        log(f"imported={imported} rejected={rejected} invalid={invalid} ({imported / elapsed:.1f} rows/s)")
+
+    try:
+        with openInput(args.path) as f:
+            for lineNo, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+
+                try:
+                    batch.append(toRow(line, args.author_id))
+                except (ValueError, TypeError, ValidationError) as ex:
+                    invalid += 1
+                    log(f"line {lineNo}: {str(ex).splitlines()[0]}")
+                    continue
+
+                if len(batch) >= args.batch:
+                    flush()
+
+        if batch:
+            flush()
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    log(f"done: imported={imported} rejected={rejected} invalid={invalid} in {elapsed:.1f}s "
+        f"({imported / elapsed if elapsed else 0:.1f} rows/s)")
+
+
+def runExport(args):
+    db = SessionLocal()
+    started = time.perf_counter()
+    exported = 0
+
+    try:
+        out = openOutput(args.path)
+        try:
+            for p in iterPosts(db, args.batch):
+                out.write(dumpJson(p) + b"\n")
+                exported += 1
+
+                if exported % (args.batch * 10) == 0:
+                    log(f"exported={exported} ({exported / (time.perf_counter() - started):.1f} rows/s)")
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+    finally:
+        db.close()
+
+    elapsed = time.perf_counter() - started
+    log(f"done: exported={exported} in {elapsed:.1f}s ({exported / elapsed if elapsed else 0:.1f} rows/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    imp = sub.add_parser("import")
+    imp.add_argument("path", help="NDJSON 파일 (- 이면 stdin)")
+    imp.add_argument("--author-id", type=int, help="줄에 authorId 가 없을 때 사용할 작성자 id")
+    imp.add_argument("--batch", type=int, default=500, help="한 트랜잭션에 저장하는 게시글 수")
+    imp.add_argument("--moderation", choices=["batch", "pending"], default="batch")
+    imp.add_argument("--moderation-batch", type=int, default=64, help="한 번에 검사에 넣는 게시글 수")
+
+    exp = sub.add_parser("export")
+    exp.add_argument("path", help="NDJSON 파일 (- 이면 stdout)")
+    exp.add_argument("--batch", type=int, default=1000, help="커서에서 한 번에 꺼내는 행 수")
+
+    args = parser.parse_args()
+    migrate()
+    setupFts(engine)
+    setupHotScore(engine)
+    setupAuthorStats(engine)
+
+    if args.command == "import":
+        runImport(args)
+    else:
+        runExport(args)
+
+    from inference import executor
+    if executor:
+        executor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
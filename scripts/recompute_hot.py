@@ -0,0 +1,35 @@
+# scripts/recompute_hot.py
+#
+# 모든 게시글의 hotScore(sort=hot 정렬 값)를 다시 계산한다.
+# 처음 적용할 때나 HOT_* 가중치 / 반감기를 바꾼 뒤에는 setupHotScore 가 자동으로 다시 계산하므로,
+# 그 밖에 전체를 강제로 다시 계산할 때만 쓴다 (id 구간별로 나눠서 commit).
+#   python scripts/recompute_hot.py [--chunk 50000]
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import db_models
+from database import engine, migrate
+from trending import recomputeHotScores, setupHotScore
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk", type=int, default=50_000, help="한 트랜잭션에서 갱신하는 id 구간 크기")
+    args = parser.parse_args()
+
+    migrate()
+    setupHotScore(engine)
+
+    started = time.perf_counter()
+    count = recomputeHotScores(engine, args.chunk)
+    elapsed = time.perf_counter() - started
+    print(f"recomputed {count} posts in {elapsed:.1f}s ({count / elapsed if elapsed else 0:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,109 @@
+# scripts/rescan_moderation.py
+#
+# 저장된 유해성 판정이 현재 MODEL_NAME / TOXIC_BACKEND / TOXIC_THRESHOLD 또는
+# 현재 본문과 맞지 않는(stale) 게시글만 배치로 재검사한다.
+# 서버와 같은 경로(1차 필터 → 판정 캐시 → 배처)로 검사하므로 사전에 걸리는 글은 모델을 거치지 않고,
+# 현재 사전 버전(lexicon:<version>)으로 판정된 글은 stale 로 보지 않는다.
+#
+#   python scripts/rescan_moderation.py [--chunk 500] [--batch 32] [--restart]
+#
+# 처리한 마지막 id 를 checkpoint 파일에 기록하므로 중단 후 다시 실행하면 이어서 진행한다.
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ai
+import db_models
+from database import SessionLocal, migrate
+from models.posts import listPostsForModeration, applyModerationResults
+from inference import executor
+from moderation import MAX_PENDING, checkTexts, isStale, verdictRecord
+
+
+def readCheckpoint(path: str) -> int:
+    try:
+        with open(path) as f:
+            return int(f.read().strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def writeCheckpoint(path: str, lastId: int):
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        f.write(str(lastId))
+    os.replace(tmp, path)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--chunk", type=int, default=500, help="한 번에 읽어 오는 게시글 수")
+    parser.add_argument("--batch", type=int, default=32, help="한 번에 검사에 넣는 게시글 수 (추론 배치 크기는 TOXIC_BATCH_MAX_SIZE)")
+    parser.add_argument("--checkpoint", default=".rescan_moderation.checkpoint")
+    parser.add_argument("--restart", action="store_true", help="checkpoint 를 무시하고 처음부터")
+    args = parser.parse_args()
+
+    migrate()
+    if not executor:
+        ai.load_model()
+
+    lastId = 0 if args.restart else readCheckpoint(args.checkpoint)
+    if lastId:
+        print(f"resuming after id={lastId}")
+
+    print(f"model={ai.model_id()}")
+
+    scanned = rescored = changed = 0
+    started = time.perf_counter()
+    db = SessionLocal()
+    # 배처의 대기열 한도(TOXIC_MAX_PENDING)를 넘지 않도록 나눠서 넣는다
+    size = min(args.batch, MAX_PENDING) if MAX_PENDING else args.batch
+
+    try:
+        while True:
+            rows = listPostsForModeration(db, lastId, args.chunk)
+            if not rows:
+                break
+
+            stale = [r for r in rows if isStale(r)]
+            results = []
+
+            for i in range(0, len(stale), size):
+                part = stale[i:i + size]
+                verdicts = checkTexts([r["body"] for r in part])
+                results += [
+                    {"id": r["id"], "updatedAt": r["updatedAt"], **verdictRecord(r["body"], v)}
+                    for r, v in zip(part, verdicts)
+                ]
+
+            changed += applyModerationResults(db, results) if results else 0
+            scanned += len(rows)
+            rescored += len(stale)
+            lastId = rows[-1]["id"]
+            writeCheckpoint(args.checkpoint, lastId)
+
+            elapsed = time.perf_counter() - started
+            print(
+                f"id<={lastId} scanned={scanned} rescored={rescored} updated={changed} "
+                f"({scanned / elapsed:.1f} rows/s, {rescored / elapsed:.1f} inferences/s)",
+                flush=True,
+            )
+    finally:
+        db.close()
+
+    if os.path.exists(args.checkpoint):
+        os.remove(args.checkpoint)
+
+    if executor:
+        executor.shutdown()
+
+    elapsed = time.perf_counter() - started
+    print(f"done: scanned={scanned} rescored={rescored} updated={changed} in {elapsed:.1f}s")
+
+
+if __name__ == "__main__":
+    main()
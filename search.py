@@ -0,0 +1,95 @@
+# search.py
+
+import logging
+import os
+
+from sqlalchemy import column, table, text
+
+ENABLED = os.getenv("POSTS_FTS", "1") != "0"
+# trigram 토크나이저는 3글자 이상의 부분 문자열 검색만 지원한다
+MIN_QUERY_CHARS = 3
+
+logger = logging.getLogger(__name__)
+
+postsFts = table("posts_fts", column("rowid"), column("rank"))
+
+_state = {"ready": False}
+
+_DDL = [
+    # posts 테이블을 content 로 쓰는 external content FTS5 테이블.
+    # trigram 토크나이저라 기존 ILIKE '%q%' 와 같은 부분 문자열 검색(한글 포함)이 된다.
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5(
+        title, body, content='posts', content_rowid='id', tokenize='trigram'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ai AFTER INSERT ON posts BEGIN
+        INSERT INTO posts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_ad AFTER DELETE ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS posts_fts_au AFTER UPDATE OF title, body ON posts BEGIN
+        INSERT INTO posts_fts(posts_fts, rowid, title, body) VALUES ('delete', old.id, old.title, old.body);
+        INSERT INTO posts_fts(rowid, title, body) VALUES (new.id, new.title, new.body);
+    END
+    """,
+]
+
+
+def setupFts(bind) -> bool:
+    # FTS5(trigram) 를 지원하지 않는 SQLite 에서는 기존 ILIKE 검색을 그대로 사용한다
+    if not ENABLED:
+        return False
+
+    try:
+        with bind.begin() as conn:
+            created = conn.exec_driver_sql(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'posts_fts'"
+            ).first() is None
+
+            for ddl in _DDL:
+                conn.exec_driver_sql(ddl)
+
+            if created:
+                # 기존 DB 에 처음 적용하는 경우, 트리거 이전 게시글도 같은 트랜잭션에서 색인
+                _rebuild(conn)
+    except Exception as ex:
+        logger.warning("FTS5 unavailable, falling back to LIKE search: %s", ex)
+        _state["ready"] = False
+        return False
+
+    _state["ready"] = True
+    return True
+
+
+def _rebuild(conn):
+    conn.exec_driver_sql("INSERT INTO posts_fts(posts_fts) VALUES ('rebuild')")
+
+
+def rebuildFts(bind):
+    # 트리거 생성 이전에 있던 게시글까지 인덱스에 반영
+    with bind.begin() as conn:
+        _rebuild(conn)
+
+
+def ftsReady() -> bool:
+    return _state["ready"]
+
+
+def canUseFts(q: str) -> bool:
+    return ftsReady() and len(q) >= MIN_QUERY_CHARS
+
+
+def matchExpr(q: str) -> str:
+    # 검색어 전체를 하나의 phrase 로 매칭 (FTS 문법 문자는 따옴표로 무력화)
+    return '"' + q.replace('"', '""') + '"'
+
+
+def matchClause(q: str):
+    return text("posts_fts MATCH :ftsQuery").bindparams(ftsQuery=matchExpr(q))
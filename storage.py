@@ -9,6 +9,3 @@ posts: Dict[int, Dict[str, Any]] = {}
 userSeq = 0
 postSeq = 0
 postImages: Dict[int, Dict[str, Any]] = {}
-comments: Dict[int, Dict[int, Dict[str, Any]]] = {}
-likes: Dict[int, set] = {}
-commentSeq = 0
\ No newline at end of file
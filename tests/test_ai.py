@@ -0,0 +1,73 @@
+# tests/test_ai.py
+#
+# 긴 본문 윈도우 검사(_scanWindows): 모델 대신 윈도우별 점수를 돌려주는 infer 로 확인
+
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import ai
+
+# toxic-bert 의 label 중 "tox" 가 들어가지 않는 label 은 유해 판정에 쓰이지 않는다
+OTHER, TOXIC = 0, 1
+
+
+@pytest.fixture(autouse=True)
+def stubModel(monkeypatch):
+    monkeypatch.setattr(ai, "model", SimpleNamespace(config=SimpleNamespace(id2label={OTHER: "obscene", TOXIC: "toxic"})))
+    monkeypatch.setattr(ai, "FIRST_WINDOWS", 4)
+    monkeypatch.setattr(ai, "WINDOW_BATCH_SIZE", 32)
+
+
+def scan(scores):
+    # scores: 텍스트별 윈도우 (score, label) 목록
+    sampleMap = [s for s, windows in enumerate(scores) for _ in windows]
+    starts = [w * 100 for windows in scores for w in range(len(windows))]
+    flat = [v for windows in scores for v in windows]
+    calls = []
+
+    def infer(rows):
+        calls.append(list(rows))
+        return [flat[r] for r in rows]
+
+    return ai._scanWindows(sampleMap, starts, infer), calls
+
+
+def test_non_toxic_text_reports_highest_scoring_window():
+    best, _ = scan([[(0.2, TOXIC), (0.6, TOXIC), (0.4, TOXIC)]])
+
+    assert best[0]["isToxic"] is False
+    assert best[0]["score"] == 0.6
+    assert best[0]["offset"] == 100
+
+
+def test_toxic_window_wins_over_higher_scoring_other_label():
+    best, _ = scan([[(0.99, OTHER), (0.8, TOXIC), (0.9, TOXIC)]])
+
+    assert best[0]["isToxic"] is True
+    assert best[0]["score"] == 0.9
+    assert best[0]["offset"] == 200
+
+
+def test_long_text_stops_after_first_windows_when_toxic():
+    # 27 윈도우(20k 자 본문 수준) 중 두 번째 윈도우가 유해하면 앞쪽 4개만 추론
+    best, calls = scan([[(0.1, TOXIC), (0.95, TOXIC)] + [(0.1, TOXIC)] * 25])
+
+    assert best[0]["isToxic"] is True
+    assert sum(len(c) for c in calls) == 4
+
+
+def test_first_windows_of_every_text_run_before_the_rest():
+    best, calls = scan([
+        [(0.1, TOXIC)] * 10,
+        [(0.95, TOXIC)] + [(0.1, TOXIC)] * 9,
+    ])
+
+    assert calls[0] == [0, 1, 2, 3, 10, 11, 12, 13]
+    # 두 번째 텍스트는 유해 판정이 났으므로 나머지 윈도우는 첫 번째 텍스트 것만
+    assert calls[1] == list(range(4, 10))
+    assert best[0]["isToxic"] is False and best[1]["isToxic"] is True
@@ -0,0 +1,55 @@
+# tests/test_prefilter.py
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from prefilter import ALLOWLIST_PATH, LEXICON_PATH, LexicalPrefilter, loadLexicon
+
+
+@pytest.fixture
+def prefilter():
+    return LexicalPrefilter(loadLexicon(LEXICON_PATH), 2, 20, 0, loadLexicon(ALLOWLIST_PATH))
+
+
+@pytest.mark.parametrize("text", ["fucked up", "you retarded", "shitty post", "Bitches", "개새끼야", "씨발 진짜", "병신같은 글", "지랄하네"])
+def test_lexicon_matches_inflected_forms(prefilter, text):
+    assert prefilter.decide(text)["isToxic"] is True
+
+
+@pytest.mark.parametrize("text", [
+    "이 글이 논의의 시발점이 되었으면 합니다",
+    "시발역에서 출발",
+    "fire retardant coating review",
+    "mental retardation research",
+    "Scunthorpe United",
+])
+def test_lexicon_does_not_reject_benign_words(prefilter, text):
+    # 사전 표현을 포함하지만 다른 단어인 경우 바로 유해 판정하지 않고 모델로 넘긴다
+    assert prefilter.decide(text) is None
+
+
+@pytest.mark.parametrize("text", ["kill yourself", "go die", "great post", "shell script"])
+def test_short_text_outside_allowlist_goes_to_model(prefilter, text):
+    assert prefilter.decide(text) is None
+
+
+@pytest.mark.parametrize("text", ["thanks!", "Thank you", "좋아요 ㅋㅋ"])
+def test_short_allowlisted_text_passes(prefilter, text):
+    assert prefilter.decide(text)["isToxic"] is False
+
+
+def test_current_lexicon_verdict_is_not_stale(prefilter, monkeypatch):
+    import moderation
+    from ai import content_hash, model_id
+
+    monkeypatch.setattr(moderation, "prefilter", prefilter)
+    body = "씨발 진짜"
+    row = {"body": body, "contentHash": content_hash(body)}
+
+    assert not moderation.isStale({**row, "moderationModel": f"lexicon:{prefilter.version}"})
+    assert not moderation.isStale({**row, "moderationModel": model_id()})
+    assert moderation.isStale({**row, "moderationModel": "lexicon:000000000000"})
@@ -0,0 +1,142 @@
+# tests/test_smoke.py
+#
+# DB_MODE / SQLITE_PROFILE / MODERATION_MODE 조합마다 새 프로세스 + 빈 DB 로 main 을 띄우고 주요 API 를 한 바퀴 호출한다.
+# 설정은 import 시점에 읽히므로 조합마다 subprocess 로 실행한다.
+# 모델은 로딩하지 않고 유해성 검사 배처의 runner 만 고정 판정으로 바꾼다.
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SCRIPT = r'''
+import os
+import time
+
+import database
+# 쓰기 커넥션을 오래 잡는 경로가 있으면 30초가 아니라 바로 실패하도록
+database.engine.pool._timeout = 1
+
+import moderation
+INFERENCE_DELAY = float(os.environ.get("SMOKE_INFERENCE_DELAY", "0"))
+
+inferred = []
+
+def runner(texts):
+    inferred.extend(texts)
+    time.sleep(INFERENCE_DELAY)
+    return [{"label": "non_toxic", "score": 0.0, "isToxic": False, "offset": 0} for _ in texts]
+
+moderation.batcher.runner = runner
+
+from fastapi.testclient import TestClient
+from main import app
+
+def waitApproved(pid):
+    # MODERATION_MODE=async 면 작성 / 수정한 글은 워커가 검사할 때까지 비로그인 조회에 보이지 않는다
+    deadline = time.monotonic() + 10
+    while client.get(f"/posts/{pid}").status_code != 200 and time.monotonic() < deadline:
+        time.sleep(0.1)
+
+with TestClient(app) as client:
+    r = client.post("/auth/signup", json={"email": "a@example.com", "password": "Passw0rd!", "nickname": "alice"})
+    assert r.status_code == 201, r.text
+    uid = r.json()["id"]
+    token = client.post("/auth/login", json={"email": "a@example.com", "password": "Passw0rd!"}).json()["accessToken"]
+    auth = {"Authorization": f"Bearer {token}"}
+
+    body = "a friendly smoke test post body"
+    r = client.post("/posts", json={"title": "hello", "body": body}, headers=auth)
+    assert r.status_code == 200, r.text
+    pid = r.json()["id"]
+
+    if moderation.MODE == "async":
+        # 백그라운드 검사(추론 지연 중)에도 다른 쓰기 요청이 쓰기 커넥션을 얻어야 한다
+        time.sleep(INFERENCE_DELAY / 4)
+        for _ in range(2):
+            assert client.post(f"/posts/{pid}/like", headers=auth).status_code == 200
+        waitApproved(pid)
+
+    r = client.get("/posts")
+    assert r.status_code == 200, r.text
+    assert [p["id"] for p in r.json()] == [pid]
+
+    r = client.get(f"/posts/{pid}")
+    assert r.status_code == 200, r.text
+    etag = r.headers["ETag"]
+    # 본문의 views 는 조회마다 바뀌므로 weak ETag
+    assert etag.startswith("W/"), etag
+    assert client.get(f"/posts/{pid}", headers={"If-None-Match": etag}).status_code == 304
+
+    # 다른 사용자 / 없는 글의 수정 요청은 모델을 호출하기 전에 거절
+    client.post("/auth/signup", json={"email": "b@example.com", "password": "Passw0rd!", "nickname": "bob"})
+    other = client.post("/auth/login", json={"email": "b@example.com", "password": "Passw0rd!"}).json()["accessToken"]
+    before = len(inferred)
+    r = client.put(f"/posts/{pid}", json={"title": "x", "body": "not yours " * 10}, headers={"Authorization": f"Bearer {other}"})
+    assert r.status_code == 403, r.text
+    assert client.put("/posts/999", json={"title": "x", "body": "missing post"}, headers=auth).status_code == 404
+    assert len(inferred) == before
+
+    r = client.put(f"/posts/{pid}", json={"title": "hello again", "body": body}, headers=auth)
+    assert r.status_code == 200, r.text
+    assert r.json()["title"] == "hello again"
+    # 상세 조회 캐시도 수정 즉시 무효화되어야 한다 (MODERATION_MODE=async 면 다시 검사 대기라 작성자로 조회)
+    assert client.get(f"/posts/{pid}", headers=auth).json()["title"] == "hello again"
+    waitApproved(pid)
+
+    r = client.post(f"/posts/{pid}/like", headers=auth)
+    assert r.status_code == 200 and r.json() == {"liked": True, "likesCount": 1}, r.text
+
+    r = client.post(f"/posts/{pid}/comments", json={"text": "nice"}, headers=auth)
+    assert r.status_code == 200, r.text
+    created = r.json()
+    r = client.get(f"/posts/{pid}/comments")
+    # 작성 응답과 목록 응답의 시각 형식이 같아야 한다
+    assert r.status_code == 200 and r.json() == [created], r.text
+
+    r = client.get(f"/users/{uid}/posts")
+    assert r.status_code == 200 and [p["id"] for p in r.json()] == [pid], r.text
+    r = client.get(f"/users/{uid}/stats")
+    assert r.status_code == 200, r.text
+    assert r.json()["postCount"] == 1 and r.json()["totalLikes"] == 1
+
+    r = client.delete(f"/posts/{pid}", headers=auth)
+    assert r.status_code == 200, r.text
+    assert client.get(f"/posts/{pid}").status_code == 404
+    assert client.get(f"/users/{uid}/stats").json()["postCount"] == 0
+
+print("ok")
+'''
+
+
+@pytest.mark.parametrize("dbMode, profile, moderationMode", [
+    ("sync", "wal", "sync"),
+    ("sync", "default", "sync"),
+    ("async", "wal", "sync"),
+    ("async", "default", "sync"),
+    ("sync", "wal", "async"),
+])
+def test_smoke(tmp_path, dbMode, profile, moderationMode):
+    env = dict(
+        os.environ,
+        PYTHONPATH=ROOT,
+        DB_MODE=dbMode,
+        SQLITE_PROFILE=profile,
+        MODERATION_MODE=moderationMode,
+        SMOKE_INFERENCE_DELAY="2" if moderationMode == "async" else "0",
+        TOXIC_PRELOAD="0",
+        TOXIC_WORKERS="0",
+        TOXIC_PREFILTER="0",
+    )
+    # DB 파일(./community.db)은 작업 디렉터리에 만들어진다
+    proc = subprocess.run(
+        [sys.executable, "-c", SCRIPT], cwd=tmp_path, env=env, capture_output=True, text=True, timeout=120,
+    )
+
+    assert proc.returncode == 0, proc.stdout + proc.stderr
+    assert proc.stdout.strip().endswith("ok")
+    # 종료 시 커넥션 정리 오류(async 엔진을 sync 로 dispose 하는 경우 MissingGreenlet)가 없어야 한다
+    assert "Exception closing connection" not in proc.stderr, proc.stderr
@@ -0,0 +1,51 @@
+# tests/test_trending.py
+
+import importlib
+import os
+import sqlite3
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database import Base, buildEngines
+from db_models import Post
+import trending
+
+
+def _scores(path):
+    with sqlite3.connect(path) as con:
+        return dict(con.execute("SELECT id, hotScore FROM posts").fetchall())
+
+
+def test_setup_scores_existing_posts_and_works_without_app_functions(tmp_path, monkeypatch):
+    path = f"{tmp_path}/test.db"
+    engine, _ = buildEngines(f"sqlite:///{path}", "default")
+    Base.metadata.create_all(bind=engine)
+    with engine.begin() as conn:
+        conn.execute(Post.__table__.insert(), [
+            {"title": "quiet", "body": "b", "authorId": 1, "createdAt": datetime(2026, 10, 1), "views": 0, "likesCount": 0},
+            {"title": "busy", "body": "b", "authorId": 1, "createdAt": datetime(2026, 10, 1), "views": 10000, "likesCount": 500},
+        ])
+
+    # 트리거 이전에 있던 글도 처음 setup 할 때 점수가 계산된다
+    assert trending.setupHotScore(engine)
+    scores = _scores(path)
+    assert scores[2] > scores[1] > 0
+
+    # 앱이 등록하는 함수 없이도 다른 클라이언트의 UPDATE 가 동작하고 트리거가 점수를 갱신한다
+    with sqlite3.connect(path) as con:
+        con.execute("UPDATE posts SET views = 20000, likesCount = 1000 WHERE id = 1")
+    assert _scores(path)[1] > scores[2]
+
+    # 가중치가 바뀌면 트리거를 다시 만들고 전체를 다시 계산한다
+    monkeypatch.setenv("HOT_LIKE_WEIGHT", "0")
+    monkeypatch.setenv("HOT_VIEW_WEIGHT", "0")
+    try:
+        importlib.reload(trending)
+        assert trending.setupHotScore(engine)
+        rescored = _scores(path)
+        assert rescored[1] == rescored[2]
+    finally:
+        monkeypatch.undo()
+        importlib.reload(trending)
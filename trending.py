@@ -0,0 +1,87 @@
+# trending.py
+
+import logging
+import math
+import os
+from datetime import datetime, timezone
+
+from sqlalchemy import text
+
+logger = logging.getLogger(__name__)
+
+# GET /posts?sort=hot 정렬용 hotScore.
+#   hotScore = ln(1 + 조회수*VIEW_WEIGHT + 좋아요*LIKE_WEIGHT + 댓글*COMMENT_WEIGHT) + (작성 시각 - EPOCH) / TAU
+# 시간 항이 작성 시각에만 의존하므로 "참여도 * exp(-(now - 작성 시각) / TAU)" 와 정렬 순서가 같다.
+# 즉 시간이 지나면서의 감쇠를 위해 모든 행을 주기적으로 다시 계산할 필요가 없고,
+# 카운터가 바뀐 행만 트리거로 다시 계산하면 (hotScore, id) 인덱스 순서가 항상 최신이다.
+# 가중치 / 반감기가 바뀌면 트리거 식이 달라지므로 setupHotScore 가 트리거를 다시 만들고 전체를 다시 계산한다.
+VIEW_WEIGHT = float(os.getenv("HOT_VIEW_WEIGHT", "1"))
+LIKE_WEIGHT = float(os.getenv("HOT_LIKE_WEIGHT", "5"))
+COMMENT_WEIGHT = float(os.getenv("HOT_COMMENT_WEIGHT", "3"))
+HALF_LIFE_HOURS = float(os.getenv("HOT_HALF_LIFE_HOURS", "24"))
+TAU = HALF_LIFE_HOURS * 3600 / math.log(2)
+EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc).timestamp()
+
+
+def scoreSql(row: str = "") -> str:
+    # 트리거와 전체 재계산이 같이 쓰는 SQL 식. 앱이 등록하는 함수 없이 SQLite 내장 ln() 만 쓰므로
+    # sqlite3 CLI, 백업 / 마이그레이션 스크립트 같은 다른 클라이언트의 UPDATE posts 도 그대로 동작한다
+    p = f"{row}." if row else ""
+    engagement = (
+        f"{VIEW_WEIGHT!r} * coalesce({p}views, 0) + {LIKE_WEIGHT!r} * coalesce({p}likesCount, 0) "
+        f"+ {COMMENT_WEIGHT!r} * coalesce({p}commentsCount, 0)"
+    )
+    return f"ln(1 + max({engagement}, 0)) + (coalesce(strftime('%s', {p}createdAt), {EPOCH!r}) - {EPOCH!r}) / {TAU!r}"
+
+
+_TRIGGERS = {
+    "posts_hot_ai": f"""CREATE TRIGGER posts_hot_ai AFTER INSERT ON posts BEGIN
+        UPDATE posts SET hotScore = {scoreSql("new")} WHERE id = new.id;
+    END""",
+    "posts_hot_au": f"""CREATE TRIGGER posts_hot_au AFTER UPDATE OF views, likesCount, commentsCount ON posts BEGIN
+        UPDATE posts SET hotScore = {scoreSql("new")} WHERE id = new.id;
+    END""",
+}
+
+RECOMPUTE_SQL = f"UPDATE posts SET hotScore = {scoreSql()} WHERE id > :afterId AND id <= :lastId"
+
+
+def setupHotScore(bind) -> bool:
+    # 트리거가 없거나 식(가중치 / 반감기)이 바뀐 경우 다시 만들고, 같은 트랜잭션에서 기존 글의 hotScore 도 다시 계산한다.
+    # ln() 은 SQLite 3.35+ 의 수학 함수라 없는 빌드에서는 hotScore 를 갱신하지 않는다 (sort=hot 순서가 부정확)
+    try:
+        with bind.connect() as conn:
+            conn.exec_driver_sql("SELECT ln(1)")
+    except Exception as ex:
+        logger.warning("SQLite math functions unavailable, hotScore is not maintained: %s", ex)
+        return False
+
+    with bind.begin() as conn:
+        existing = dict(conn.exec_driver_sql(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name IN ('posts_hot_ai', 'posts_hot_au')"
+        ).all())
+        changed = [name for name, ddl in _TRIGGERS.items() if existing.get(name) != ddl]
+
+        for name in changed:
+            conn.exec_driver_sql(f"DROP TRIGGER IF EXISTS {name}")
+            conn.exec_driver_sql(_TRIGGERS[name])
+
+        if changed:
+            updated = conn.exec_driver_sql(f"UPDATE posts SET hotScore = {scoreSql()}").rowcount
+            logger.info("hot score triggers (re)created, recomputed %d posts", updated)
+
+    return True
+
+
+def recomputeHotScores(bind, chunk: int = 50_000) -> int:
+    # 전체 재계산: 행마다 점수 식을 한 번 계산하고 hotScore 와 인덱스를 다시 쓴다 (O(N)).
+    # id 구간별로 commit 해서 쓰기 잠금을 오래 잡지 않는다
+    with bind.connect() as conn:
+        maxId = conn.exec_driver_sql("SELECT coalesce(max(id), 0) FROM posts").scalar()
+
+    updated = 0
+    for afterId in range(0, maxId, chunk):
+        with bind.begin() as conn:
+            updated += conn.execute(text(RECOMPUTE_SQL), {"afterId": afterId, "lastId": afterId + chunk}).rowcount
+
+    return updated
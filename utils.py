@@ -1,9 +1,19 @@
 # utils.py
 
 import re
+import json
+import base64
+import hashlib
+from datetime import datetime
+from fastapi import Response
 from fastapi import HTTPException
 from passlib.context import CryptContext
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 pwdContext = CryptContext(schemes = ["pbkdf2_sha256"], deprecated = "auto")
 passwordRe = re.compile(r"^(?=.*[A-Z])(?=.*[a-z])(?=.*\d)(?=.*[^\w\s]).{8,20}$")
 
@@ -25,6 +35,9 @@ def notFound(message = "리소스를 찾을 수 없습니다."):
 def payloadTooLarge(message = "파일 용량이 허용치를 초과했습니다."):
     raise HTTPException(413, {"code": "PAYLOAD_TOO_LARGE", "message": message})
 
+def serviceUnavailable(message = "잠시 후 다시 시도해주세요."):
+    raise HTTPException(503, {"code": "SERVICE_UNAVAILABLE", "message": message})
+
 def normalizeEmail(email: str) -> str:
     e = (email or "").strip().lower()
     
@@ -48,4 +61,60 @@ def validateNickname(nick: str):
         badRequest("*띄어쓰기를 없애주세요.")
     
     if len(nick) > 10:
-        badRequest("*닉네임은 최대 10자 까지 작성 가능합니다.")
\ No newline at end of file
+        badRequest("*닉네임은 최대 10자 까지 작성 가능합니다.")
+
+def encodeCursor(*values) -> str:
+    # 페이지 마지막 행의 정렬 키를 불투명한 문자열로 전달
+    raw = json.dumps([v.isoformat() if isinstance(v, datetime) else v for v in values], separators = (",", ":"))
+    
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+def decodeCursor(cursor: str, *types) -> tuple:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError(cursor)
+        
+        return tuple(datetime.fromisoformat(v) if t is datetime else t(v) for v, t in zip(values, types))
+    except (ValueError, TypeError):
+        badRequest("*잘못된 커서 값입니다.")
+
+def _jsonDefault(v):
+    if isinstance(v, datetime):
+        return v.isoformat()
+    
+    raise TypeError(f"{type(v).__name__} is not JSON serializable")
+
+def dumpJson(data) -> bytes:
+    # 이미 검증된 모델 출력은 Pydantic 을 거치지 않고 바로 직렬화 (orjson 이 있으면 사용)
+    if orjson is not None:
+        return orjson.dumps(data)
+    
+    return json.dumps(data, default = _jsonDefault, ensure_ascii = False, separators = (",", ":")).encode()
+
+def jsonResponse(data, status_code: int = 200, headers: dict | None = None) -> Response:
+    return Response(content = dumpJson(data), status_code = status_code, headers = headers, media_type = "application/json")
+
+def etagFor(*parts) -> str:
+    # 응답 내용을 결정하는 값들로 만든 strong ETag
+    raw = "\x1f".join(v.isoformat() if isinstance(v, datetime) else str(v) for v in parts)
+    
+    return '"' + hashlib.blake2b(raw.encode(), digest_size = 16).hexdigest() + '"'
+
+def etagForBytes(content: bytes) -> str:
+    return '"' + hashlib.blake2b(content, digest_size = 16).hexdigest() + '"'
+
+def etagMatches(ifNoneMatch: str | None, etag: str) -> bool:
+    # If-None-Match 는 weak 비교 (W/ 접두어 무시), "*" 는 항상 일치
+    if not ifNoneMatch:
+        return False
+    
+    tags = [t.strip() for t in ifNoneMatch.split(",")]
+    opaque = etag[2:] if etag.startswith("W/") else etag
+    
+    return "*" in tags or opaque in (t[2:] if t.startswith("W/") else t for t in tags)
+
+def notModified(etag: str, headers: dict | None = None) -> Response:
+    return Response(status_code = 304, headers = {"ETag": etag, **(headers or {})})